@@ -0,0 +1,59 @@
+"""
+Measures the per-Transaction overhead of `Controller.process_transaction`
+for a GET-only workload, with the step pipelines rebuilt for every
+`Transaction` and with the pipelines compiled once per `Controller`.
+
+Usage:
+    python -m benchmarks.bench_controller_get [resource_count] [sample_count]
+"""
+import random
+import sys
+import timeit
+import uuid
+
+import elemental_backend as backend
+
+
+def _populate_controller(resource_count):
+    model = backend.Model()
+    controller = backend.Controller(model)
+    resource_ids = []
+
+    for _ in range(resource_count):
+        resource = backend.resources.Resource(id=uuid.uuid4())
+        model.register_resource(resource)
+        resource_ids.append(resource.id)
+
+    return controller, resource_ids
+
+
+def _get_precompiled(controller, resource_ids):
+    for resource_id in resource_ids:
+        transaction = backend.transactions.Get(resource_id)
+        controller.process_transaction(transaction)
+
+
+def _get_rebuilt(controller, resource_ids):
+    # Rebuilding the pipelines before each Transaction reproduces the cost of
+    # building them on every call.
+    for resource_id in resource_ids:
+        controller._transaction_processes = (
+            controller._build_transaction_processes())
+        transaction = backend.transactions.Get(resource_id)
+        controller.process_transaction(transaction)
+
+
+def main(resource_count=100000, sample_count=10000):
+    controller, resource_ids = _populate_controller(resource_count)
+    sample_ids = random.sample(resource_ids, min(sample_count, resource_count))
+
+    for label, func in (('rebuilt', _get_rebuilt),
+                        ('precompiled', _get_precompiled)):
+        elapsed = min(timeit.repeat(
+            lambda: func(controller, sample_ids), number=1, repeat=3))
+        msg = '{0:>12}: {1:.3f} us/transaction over {2} resources'
+        print(msg.format(label, elapsed / len(sample_ids) * 1e6, resource_count))
+
+
+if __name__ == '__main__':
+    main(*[int(arg) for arg in sys.argv[1:3]])
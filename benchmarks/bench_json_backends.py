@@ -0,0 +1,88 @@
+"""
+Round-trips one `Resource` of every type bound by
+`serialization.json.bind_to_controller` through each installed JSON backend,
+reporting the fastest time per round trip for each type.
+
+Usage:
+    python -m benchmarks.bench_json_backends [iteration_count] [repeat_count]
+"""
+import sys
+import timeit
+import uuid
+
+import elemental_backend as backend
+from elemental_backend.serialization import json as json_serialization
+
+
+def _make_resources():
+    uuids = [uuid.uuid4() for _ in range(8)]
+    return [
+        backend.resources.ContentType(
+            id=uuid.uuid4(), name='content', base_ids=uuids[:2],
+            attribute_type_ids=uuids[2:]),
+        backend.resources.AttributeType(
+            id=uuid.uuid4(), name='name', default_value='unnamed',
+            kind_id='StringKind', kind_properties={'max_length': 64}),
+        backend.resources.FilterType(
+            id=uuid.uuid4(), name='filter', attribute_type_ids=uuids[:4]),
+        backend.resources.SorterType(
+            id=uuid.uuid4(), name='sorter', attribute_type_ids=uuids[:4]),
+        backend.resources.ViewType(
+            id=uuid.uuid4(), name='view', content_type_ids=uuids[:2],
+            filter_type_ids=uuids[2:4], sorter_type_ids=uuids[4:6]),
+        backend.resources.ContentInstance(
+            id=uuid.uuid4(), type_id=uuid.uuid4(), attribute_ids=uuids),
+        backend.resources.AttributeInstance(
+            id=uuid.uuid4(), type_id=uuid.uuid4(),
+            value='a value of typical length for a name attribute'),
+        backend.resources.FilterInstance(
+            id=uuid.uuid4(), type_id=uuid.uuid4(),
+            kind_params={'pattern': 'name*', 'case_sensitive': False}),
+        backend.resources.SorterInstance(
+            id=uuid.uuid4(), type_id=uuid.uuid4(),
+            kind_params={'descending': True}),
+        backend.resources.ViewInstance(
+            id=uuid.uuid4(), type_id=uuid.uuid4(), filter_ids=uuids[:3],
+            sorter_ids=uuids[3:5], result_id=uuid.uuid4(), limit=50,
+            offset=100)
+    ]
+
+
+def _round_trip(serializer, deserializer, resource):
+    deserializer(serializer(resource), resource)
+
+
+def main(iteration_count=20000, repeat_count=5):
+    controller = backend.Controller(backend.Model())
+    json_serialization.bind_to_controller(controller)
+
+    resources = _make_resources()
+    controller._model.register_resources(resources)
+
+    backend_names = list(json_serialization.iter_available_backends())
+    print('{0:>18}'.format('') + ''.join(
+        '{0:>12}'.format(name) for name in backend_names))
+
+    original_backend_name = json_serialization.get_backend()
+    try:
+        for resource in resources:
+            resource_type = type(resource)
+            serializer = controller._resolve_serializer(resource_type, 'json')
+            deserializer = controller._resolve_deserializer(resource_type,
+                                                            'json')
+            timings = []
+            for backend_name in backend_names:
+                json_serialization.set_backend(backend_name)
+                elapsed = min(timeit.repeat(
+                    lambda: _round_trip(serializer, deserializer, resource),
+                    number=iteration_count, repeat=repeat_count))
+                timings.append(elapsed / iteration_count * 1e6)
+
+            print('{0:>18}'.format(resource_type.__name__) + ''.join(
+                '{0:>10.2f}us'.format(timing) for timing in timings))
+    finally:
+        json_serialization.set_backend(original_backend_name)
+
+
+if __name__ == '__main__':
+    main(*[int(arg) for arg in sys.argv[1:3]])
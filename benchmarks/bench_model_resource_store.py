@@ -0,0 +1,84 @@
+"""
+Compares the memory held by a `Model` with every `Resource` registered
+against a `Model` backed by a `ResourceStore`, along with the time taken to
+open each and to retrieve a sample of its `Resources`.
+
+Usage:
+    python -m benchmarks.bench_model_resource_store [resource_count] [sample_count]
+"""
+import os
+import random
+import sys
+import tempfile
+import time
+import tracemalloc
+import uuid
+
+import elemental_backend as backend
+from elemental_backend.serialization import binary as binary_serialization
+
+
+def _make_resources(resource_count):
+    type_id = uuid.uuid4()
+    return [backend.resources.AttributeInstance(
+                id=uuid.uuid4(), type_id=type_id,
+                value='value {0}'.format(idx))
+            for idx in range(resource_count)]
+
+
+def _open_loaded(directory):
+    path = os.path.join(directory, 'resources.snapshot')
+    model = backend.Model()
+    with open(path, 'rb') as stream:
+        binary_serialization.load_model(stream, model)
+    return model, None
+
+
+def _open_stored(directory):
+    store = backend.ResourceStore(os.path.join(directory, 'resources.store'))
+    return backend.Model(store=store), store
+
+
+def _measure(open_model, directory, sample_ids):
+    tracemalloc.start()
+    start = time.perf_counter()
+    model, store = open_model(directory)
+    open_elapsed = time.perf_counter() - start
+    _, open_peak = tracemalloc.get_traced_memory()
+
+    start = time.perf_counter()
+    for resource_id in sample_ids:
+        model.retrieve_resource(resource_id)
+    retrieve_elapsed = time.perf_counter() - start
+    held, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    if store is not None:
+        store.close()
+
+    return open_elapsed, open_peak, retrieve_elapsed, held
+
+
+def main(resource_count=200000, sample_count=20000):
+    resources = _make_resources(resource_count)
+    sample_ids = [resource.id for resource in
+                  random.sample(resources, min(sample_count, resource_count))]
+
+    directory = tempfile.mkdtemp()
+    with open(os.path.join(directory, 'resources.snapshot'), 'wb') as stream:
+        binary_serialization.dump_resources(resources, stream)
+    backend.ResourceStore.write(os.path.join(directory, 'resources.store'),
+                                resources)
+    del resources
+
+    msg = (
+        '{0:>7}: open {1:>7.2f}s (peak {2:>12,} bytes), '
+        'retrieve {3:>7.2f}s, held {4:>12,} bytes'
+    )
+    for label, open_model in (('loaded', _open_loaded),
+                              ('stored', _open_stored)):
+        print(msg.format(label, *_measure(open_model, directory, sample_ids)))
+
+
+if __name__ == '__main__':
+    main(*[int(arg) for arg in sys.argv[1:3]])
@@ -0,0 +1,55 @@
+"""
+Measures `Model.retrieve_resource` latency with and without cached
+ResourceModel dispatch plans.
+
+Usage:
+    python -m benchmarks.bench_model_retrieve [resource_count] [sample_count]
+"""
+import random
+import sys
+import timeit
+import uuid
+
+import elemental_backend as backend
+
+
+def _populate_model(resource_count):
+    model = backend.Model()
+    resource_ids = []
+
+    for _ in range(resource_count):
+        resource = backend.resources.Resource(id=uuid.uuid4())
+        model.register_resource(resource)
+        resource_ids.append(resource.id)
+
+    return model, resource_ids
+
+
+def _retrieve_cached(model, resource_ids):
+    for resource_id in resource_ids:
+        model.retrieve_resource(resource_id)
+
+
+def _retrieve_uncached(model, resource_ids):
+    # Clearing the plan cache before each retrieval reproduces the cost of
+    # computing the dispatch plan on every call.
+    plans = model._map__resource_cls__resource_models
+    for resource_id in resource_ids:
+        plans.clear()
+        model.retrieve_resource(resource_id)
+
+
+def main(resource_count=1000000, sample_count=10000):
+    model, resource_ids = _populate_model(resource_count)
+    sample_ids = random.sample(resource_ids, min(sample_count, resource_count))
+
+    for label, func in (('uncached', _retrieve_uncached),
+                        ('cached', _retrieve_cached)):
+        elapsed = min(timeit.repeat(
+            lambda: func(model, sample_ids), number=1, repeat=3))
+        msg = '{0:>10}: {1:.3f} us/retrieve over {2} resources'
+        print(msg.format(label, elapsed / len(sample_ids) * 1e6, resource_count))
+
+
+if __name__ == '__main__':
+    main(*[int(arg) for arg in sys.argv[1:3]])
@@ -0,0 +1,54 @@
+"""
+Measures the transient memory allocated by a single
+`Model.retrieve_resource` call with INFO logging enabled and disabled.
+
+Usage:
+    python -m benchmarks.bench_model_retrieve_allocations [sample_count]
+"""
+import logging
+import sys
+import tracemalloc
+import uuid
+
+import elemental_backend as backend
+
+
+def _measure(model, resource_ids):
+    peaks = []
+
+    tracemalloc.start()
+    for resource_id in resource_ids:
+        # Resets the traced and peak sizes to zero, so the peak holds only
+        # what the call allocates.
+        tracemalloc.clear_traces()
+        model.retrieve_resource(resource_id)
+        _, peak = tracemalloc.get_traced_memory()
+        peaks.append(peak)
+    tracemalloc.stop()
+
+    return sum(peaks) / len(peaks)
+
+
+def main(sample_count=1000):
+    model = backend.Model()
+    resource_ids = []
+    for _ in range(sample_count):
+        resource = backend.resources.Resource(id=uuid.uuid4())
+        model.register_resource(resource)
+        resource_ids.append(resource.id)
+
+    # A NullHandler keeps enabled records from reaching stderr while still
+    # paying for their construction.
+    logger = logging.getLogger('elemental_backend')
+    logger.addHandler(logging.NullHandler())
+    logger.propagate = False
+
+    for level in (logging.INFO, logging.WARNING):
+        logger.setLevel(level)
+        average = _measure(model, resource_ids)
+        msg = '{0:>8}: {1:.1f} bytes allocated per retrieve'
+        print(msg.format(logging.getLevelName(level), average))
+
+
+if __name__ == '__main__':
+    main(*[int(arg) for arg in sys.argv[1:2]])
@@ -0,0 +1,116 @@
+"""
+Compares dumping and loading a whole `Model` through the per-resource JSON
+serializers against the binary snapshot format.
+
+The `Model` holds `ContentInstances`, each referring to `attribute_count`
+`AttributeInstances`, for `resource_count` `Resources` in total. The JSON
+path serializes each `Resource` into its own string; loading constructs and
+deserializes each `Resource` before a single `Model.register_resources` call,
+as the binary loader does.
+
+Usage:
+    python -m benchmarks.bench_model_snapshot_load [resource_count] [attribute_count]
+"""
+import gc
+import io
+import sys
+import time
+import uuid
+
+import elemental_backend as backend
+from elemental_backend.serialization import binary as binary_serialization
+from elemental_backend.serialization import json as json_serialization
+
+
+_map__class_name__json_functions = {
+    'AttributeType': (json_serialization.serialize_attribute_type,
+                      json_serialization.deserialize_attribute_type),
+    'ContentType': (json_serialization.serialize_content_type,
+                    json_serialization.deserialize_content_type),
+    'ContentInstance': (json_serialization.serialize_content_instance,
+                        json_serialization.deserialize_content_instance),
+    'AttributeInstance': (json_serialization.serialize_attribute_instance,
+                          json_serialization.deserialize_attribute_instance)
+}
+
+
+def _make_resources(resource_count, attribute_count):
+    attribute_type = backend.resources.AttributeType(
+        id=uuid.uuid4(), name='name', default_value=None,
+        kind_id='StringKind')
+    content_type = backend.resources.ContentType(
+        id=uuid.uuid4(), name='content',
+        attribute_type_ids=[attribute_type.id])
+    resources = [attribute_type, content_type]
+
+    while len(resources) < resource_count:
+        attribute_instances = [
+            backend.resources.AttributeInstance(
+                id=uuid.uuid4(), type_id=attribute_type.id,
+                value='value {0}'.format(len(resources) + idx))
+            for idx in range(attribute_count)]
+        resources.extend(attribute_instances)
+        resources.append(backend.resources.ContentInstance(
+            id=uuid.uuid4(), type_id=content_type.id,
+            attribute_ids=[ai.id for ai in attribute_instances]))
+
+    return resources
+
+
+def _dump_json(model):
+    with model.snapshot() as snapshot:
+        return [
+            (type(resource),
+             _map__class_name__json_functions[type(resource).__name__][0](resource))
+            for resource in snapshot.iter_resources()]
+
+
+def _load_json(records, model):
+    resources = []
+    for resource_type, data in records:
+        resource = resource_type()
+        _map__class_name__json_functions[resource_type.__name__][1](
+            data, resource)
+        resources.append(resource)
+
+    return model.register_resources(resources)
+
+
+def _dump_binary(model):
+    stream = io.BytesIO()
+    binary_serialization.dump_model(model, stream)
+    return stream.getvalue()
+
+
+def _load_binary(data, model):
+    return binary_serialization.load_model(io.BytesIO(data), model)
+
+
+def _measure(func, *args):
+    gc.collect()
+    start = time.perf_counter()
+    result = func(*args)
+    return result, time.perf_counter() - start
+
+
+def main(resource_count=1000000, attribute_count=4):
+    resources = _make_resources(resource_count, attribute_count)
+    model = backend.Model()
+    model.register_resources(resources)
+    del resources
+
+    msg = '{0:>6}: dump {1:>8.2f}s, load {2:>8.2f}s, {3:>12,} bytes'
+
+    records, dump_elapsed = _measure(_dump_json, model)
+    size = sum(len(data.encode('utf-8')) for _, data in records)
+    loaded, load_elapsed = _measure(_load_json, records, backend.Model())
+    print(msg.format('json', dump_elapsed, load_elapsed, size))
+    del records, loaded
+
+    data, dump_elapsed = _measure(_dump_binary, model)
+    loaded, load_elapsed = _measure(_load_binary, data, backend.Model())
+    print(msg.format('binary', dump_elapsed, load_elapsed, len(data)))
+
+
+if __name__ == '__main__':
+    main(*[int(arg) for arg in sys.argv[1:3]])
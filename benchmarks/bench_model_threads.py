@@ -0,0 +1,94 @@
+"""
+Measures `Model.retrieve_resource` throughput across reader threads for a
+thread-safe `Model`, with and without a writer thread registering and
+releasing `Resources` concurrently. An unlocked `Model` read from a single
+thread is measured as the baseline.
+
+Usage:
+    python -m benchmarks.bench_model_threads [resource_count] [sample_count]
+"""
+import random
+import sys
+import threading
+import time
+import uuid
+
+import elemental_backend as backend
+
+
+_THREAD_COUNTS = (1, 2, 4, 8)
+
+
+def _populate_model(resource_count, **model_kwargs):
+    model = backend.Model(**model_kwargs)
+
+    resources = [backend.resources.Resource(id=uuid.uuid4())
+                 for _ in range(resource_count)]
+    model.register_resources(resources)
+
+    return model, [resource.id for resource in resources]
+
+
+def _retrieve(model, resource_ids):
+    for resource_id in resource_ids:
+        model.retrieve_resource(resource_id)
+
+
+def _churn(model, stop):
+    resources = [backend.resources.Resource(id=uuid.uuid4())
+                 for _ in range(100)]
+
+    while not stop.is_set():
+        for resource in resources:
+            model.register_resource(resource)
+        for resource in resources:
+            model.release_resource(resource.id)
+
+
+def _measure(model, sample_ids, thread_count, churn):
+    stop = threading.Event()
+    writer = threading.Thread(target=_churn, args=(model, stop))
+    readers = [threading.Thread(target=_retrieve, args=(model, sample_ids))
+               for _ in range(thread_count)]
+
+    if churn:
+        writer.start()
+
+    start = time.perf_counter()
+    for reader in readers:
+        reader.start()
+    for reader in readers:
+        reader.join()
+    elapsed = time.perf_counter() - start
+
+    if churn:
+        stop.set()
+        writer.join()
+
+    return thread_count * len(sample_ids) / elapsed
+
+
+def main(resource_count=100000, sample_count=20000):
+    msg = '{0:>28} x{1}: {2:>12,.0f} retrieves/s'
+
+    model, resource_ids = _populate_model(resource_count)
+    sample_ids = random.sample(resource_ids, min(sample_count, resource_count))
+    print(msg.format('unlocked', 1, _measure(model, sample_ids, 1, False)))
+
+    for fast_retrieve in (False, True):
+        model, resource_ids = _populate_model(
+            resource_count, thread_safe=True, fast_retrieve=fast_retrieve)
+        sample_ids = random.sample(resource_ids,
+                                   min(sample_count, resource_count))
+
+        for churn in (False, True):
+            label = 'thread_safe{0}{1}'.format(
+                ', fast_retrieve' if fast_retrieve else '',
+                ', writer' if churn else '')
+            for thread_count in _THREAD_COUNTS:
+                throughput = _measure(model, sample_ids, thread_count, churn)
+                print(msg.format(label, thread_count, throughput))
+
+
+if __name__ == '__main__':
+    main(*[int(arg) for arg in sys.argv[1:3]])
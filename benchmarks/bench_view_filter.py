@@ -0,0 +1,67 @@
+"""
+Measures FilterInstance evaluation over a ViewType's pool, one
+ContentInstance at a time versus one column at a time.
+
+The per-instance mode recompiles the FilterInstance's params for every
+ContentInstance, and the per-compiled mode compiles them once, so the gain of
+column evaluation alone is the difference between per-compiled and column.
+
+Usage:
+    python -m benchmarks.bench_view_filter [pool_size] [distinct_values]
+"""
+import random
+import string
+import sys
+import timeit
+
+from elemental_backend._view_evaluation import (
+    compile_filter_params,
+    match_filter_column,
+    match_filter_params,
+    match_filter_values
+)
+
+
+_KIND_PARAMS = (
+    ('equals', {'equals': 'aaaa'}),
+    ('prefix', {'prefix': 'ab'}),
+    ('match', {'match': '[a-c]+z'}),
+    ('range', {'minimum': 'b', 'maximum': 'd'})
+)
+
+
+def _build_column(pool_size, distinct_values):
+    values = [''.join(random.choice(string.ascii_lowercase) for _ in range(4))
+              for _ in range(distinct_values)]
+    return [[random.choice(values)] for _ in range(pool_size)]
+
+
+def _evaluate_per_instance(column, kind_params):
+    return [match_filter_params(values, kind_params) for values in column]
+
+
+def _evaluate_per_instance_compiled(column, kind_params):
+    predicate = compile_filter_params(kind_params)
+    return [match_filter_values(values, predicate) for values in column]
+
+
+def _evaluate_column(column, kind_params):
+    return match_filter_column(column, compile_filter_params(kind_params))
+
+
+def main(pool_size=100000, distinct_values=1000):
+    column = _build_column(pool_size, distinct_values)
+
+    for label, kind_params in _KIND_PARAMS:
+        for mode, func in (
+                ('per-instance', _evaluate_per_instance),
+                ('per-compiled', _evaluate_per_instance_compiled),
+                ('column', _evaluate_column)):
+            elapsed = min(timeit.repeat(
+                lambda: func(column, kind_params), number=1, repeat=3))
+            msg = '{0:>8} {1:>12}: {2:.1f} ms over {3} ContentInstances'
+            print(msg.format(label, mode, elapsed * 1e3, pool_size))
+
+
+if __name__ == '__main__':
+    main(*[int(arg) for arg in sys.argv[1:3]])
@@ -3,8 +3,11 @@ from . import serialization
 from . import transactions
 from . import resources
 from ._controller import Controller
+from ._async_controller import AsyncController
 from ._controller_events import ControllerEvents
 from ._model import Model
+from ._resource_store import ResourceStore
+from ._transaction_log import TransactionLog
 
 
 __title__ = 'elemental-backend'
@@ -23,5 +26,6 @@ __all__ = (
     '__title__', '__summary__', '__url__', '__version__', '__author__',
     '__email__', '__license__', '__copyright__',
     'errors', 'serialization', 'transactions', 'resources',
-    'Controller', 'ControllerEvents', 'Model'
+    'Controller', 'AsyncController', 'ControllerEvents', 'Model',
+    'ResourceStore', 'TransactionLog'
 )
@@ -0,0 +1,348 @@
+import asyncio
+import inspect
+import logging
+
+from elemental_core import ElementalError
+
+from .transactions import Actions, Batch
+from ._controller import Controller
+from ._controller_events import ControllerEvents
+from .errors import TransactionError, InvalidTransactionAction
+
+
+_LOG = logging.getLogger(__name__)
+
+
+class AsyncController(Controller):
+    """
+    A `Controller` processing `Transactions` on an `asyncio` event loop.
+
+    Handlers, serializers, deserializers and stages may be coroutine
+    functions; anything awaitable they return is awaited before the
+    `Transaction` proceeds. Plain functions are called as they are with a
+    `Controller`.
+
+    `Transactions` mutating the `Model` are queued and processed one at a
+    time by a single writer task, so their steps never interleave. `GET`
+    `Transactions` do not mutate the `Model` and are processed as soon as they
+    are received, concurrently with each other and with the writer.
+
+    `import_resource` and `export_resource` are inherited unchanged, and so
+    only support plain serializers and deserializers.
+    """
+
+    def __init__(self, model):
+        super(AsyncController, self).__init__(model)
+
+        # Handler results still to be awaited, per Transaction or Batch id.
+        self._pending_handler_results = {}
+
+        # The writer is bound to the event loop it was started on.
+        self._write_queue = None
+        self._writer_task = None
+        self._writer_loop = None
+
+    async def process_transaction(self, transaction):
+        """
+        Entry point for interaction with the `Model` managed by this `Controller`.
+
+        Args:
+            transaction (Transaction): A transaction instance specifying how
+                the `Model` should be interrogated or mutated. The
+                `Transaction` instance will be modified as it proceeds through
+                the system.
+
+        Returns:
+            The `Transaction` instance passed in, once it has been processed.
+        """
+        if transaction.action is Actions.GET:
+            return await self._process_transaction_now(transaction)
+
+        return await self._enqueue_write(self._process_transaction_now, transaction)
+
+    async def process_batch(self, transactions):
+        """
+        Processes many `Transactions` as a single `Batch`.
+
+        The `Batch` is processed by the writer as a whole, as it would be by
+        `Controller.process_batch`.
+
+        Args:
+            transactions (Iterable[Transaction]): The `Transactions` to
+                process, in order. Each is modified as it proceeds through
+                the system.
+
+        Returns:
+            The `Batch` holding the `Transactions`, once it has been processed.
+
+        Raises:
+            InvalidBatchError: If the members of a batch `Transaction` are
+                not adjacent. No `Transaction` is processed.
+        """
+        batch = Batch(transactions)
+
+        return await self._enqueue_write(self._process_batch_now, batch)
+
+    async def close(self):
+        """
+        Stops the writer once every queued `Transaction` has been processed.
+        """
+        if self._writer_task is None:
+            return
+
+        await self._write_queue.put(None)
+        await self._writer_task
+
+        self._write_queue = None
+        self._writer_task = None
+        self._writer_loop = None
+
+    async def _enqueue_write(self, process, transaction):
+        loop = asyncio.get_running_loop()
+
+        if self._writer_loop is not loop:
+            self._write_queue = asyncio.Queue()
+            self._writer_task = loop.create_task(self._run_writer())
+            self._writer_loop = loop
+
+        future = loop.create_future()
+        await self._write_queue.put((process, transaction, future))
+
+        return await future
+
+    async def _run_writer(self):
+        queue = self._write_queue
+
+        while True:
+            item = await queue.get()
+            if item is None:
+                break
+
+            process, transaction, future = item
+            try:
+                result = await process(transaction)
+            except BaseException as e:
+                if not future.cancelled():
+                    future.set_exception(e)
+                if isinstance(e, (KeyboardInterrupt, SystemExit, asyncio.CancelledError)):
+                    raise
+            else:
+                if not future.cancelled():
+                    future.set_result(result)
+
+    async def _process_transaction_now(self, transaction):
+        self._open_transaction(transaction)
+
+        await self._run_transaction(transaction, self._transaction_processes)
+
+        await self._close_transaction(transaction)
+
+        return transaction
+
+    async def _process_batch_now(self, batch):
+        if _LOG.isEnabledFor(logging.INFO):
+            msg = "Opened Batch: {0} ({1} Transactions)"
+            msg = msg.format(batch.id, len(batch.transactions))
+            _LOG.info(msg)
+
+        await self._invoke_handlers_async(ControllerEvents.batch_opened, batch)
+
+        snapshots = {}
+        applied = set()
+        unit_processes = self._build_transaction_processes(
+            snapshots=snapshots, applied=applied
+        )
+
+        for unit in batch.iter_units():
+            if len(unit) > 1:
+                processes = unit_processes
+            else:
+                processes = self._transaction_processes
+            await self._process_batch_unit(batch, unit, processes, snapshots, applied)
+
+        if batch.errors or any(t.errors for t in batch.transactions):
+            await self._invoke_handlers_async(ControllerEvents.batch_failed, batch)
+        else:
+            await self._invoke_handlers_async(ControllerEvents.batch_succeeded, batch)
+
+        await self._invoke_handlers_async(ControllerEvents.batch_closing, batch)
+
+        for error in batch.errors:
+            _LOG.error(error.message)
+
+        if _LOG.isEnabledFor(logging.INFO):
+            msg = "Closed Batch: {0}"
+            msg = msg.format(batch.id)
+            _LOG.info(msg)
+
+        return batch
+
+    async def _run_transaction(self, transaction, processes):
+        try:
+            processes = processes[transaction.action]
+        except KeyError:
+            msg = 'Failed to process Transaction "{0}": ' 'Invalid action - "{1}"'
+            msg = msg.format(transaction.id, transaction.action)
+            e = InvalidTransactionAction(
+                msg, invalid_action=transaction.action, transaction=transaction
+            )
+            transaction.errors.append(e)
+        else:
+            try:
+                await self._process_transaction(transaction, processes)
+            except Exception as e:
+                msg = 'Failed to process Transaction "{0}": ' "Unexpected error - {1}"
+                msg = msg.format(transaction.id, e)
+                e = TransactionError(msg, inner_error=e, transaction=transaction)
+                transaction.errors.append(e)
+            finally:
+                self._pending_handler_results.pop(transaction.id, None)
+
+    async def _process_transaction(self, transaction, processes):
+        await self._invoke_handlers_async(
+            ControllerEvents.transaction_opened, transaction
+        )
+
+        for process in processes:
+            if transaction.errors:
+                break
+
+            try:
+                result = process(transaction)
+                if inspect.isawaitable(result):
+                    await result
+            except ElementalError as e:
+                transaction.errors.append(e)
+            except Exception as e:
+                msg = 'Failed to process Transaction "{0}": {1}'
+                msg = msg.format(transaction.id, e)
+                e = TransactionError(msg, inner_error=e, transaction=transaction)
+                transaction.errors.append(e)
+
+            # Steps invoke handlers for the events they raise.
+            await self._await_handler_results(transaction)
+
+        if transaction.errors:
+            await self._invoke_handlers_async(
+                ControllerEvents.transaction_failed, transaction
+            )
+        else:
+            await self._invoke_handlers_async(
+                ControllerEvents.transaction_succeeded, transaction
+            )
+
+        await self._invoke_handlers_async(
+            ControllerEvents.transaction_closing, transaction
+        )
+
+    async def _close_transaction(self, transaction):
+        if self._check_outbound_payload(transaction):
+            serializer = transaction.outbound_serializer
+            resource = transaction.target_resource
+            payload = await _resolve_result(serializer(resource))
+            transaction.outbound_payload = payload
+
+        self._log_transaction_closed(transaction)
+
+    async def _process_batch_unit(self, batch, unit, processes, snapshots, applied):
+        processed = []
+        failed_transaction = None
+
+        for transaction in unit:
+            self._open_transaction(transaction)
+            await self._run_transaction(transaction, processes)
+            processed.append(transaction)
+
+            if transaction.errors:
+                failed_transaction = transaction
+                break
+
+        if failed_transaction is not None:
+            for transaction in reversed(processed):
+                await self._rollback_transaction(batch, transaction, snapshots, applied)
+
+            self._fail_batch_unit(unit, processed, failed_transaction)
+
+        for transaction in unit:
+            snapshots.pop(transaction.id, None)
+            applied.discard(transaction.id)
+            await self._close_transaction(transaction)
+
+    async def _rollback_transaction(self, batch, transaction, snapshots, applied):
+        if transaction.action is not Actions.PUT:
+            super(AsyncController, self)._rollback_transaction(
+                batch, transaction, snapshots, applied)
+            return
+
+        snapshot = snapshots.get(transaction.id)
+        if snapshot is None:
+            return
+
+        try:
+            deserializer = transaction.inbound_deserializer
+            await _resolve_result(deserializer(snapshot, transaction.target_resource))
+        except Exception as e:
+            self._fail_rollback(batch, transaction, e)
+        else:
+            if _LOG.isEnabledFor(logging.DEBUG):
+                msg = 'Transaction rolled back: "{0}"'.format(transaction.id)
+                _LOG.debug(msg)
+
+    async def _snapshot_resource(self, transaction, snapshots):
+        serializer = self._resolve_snapshot_serializer(transaction)
+        if serializer:
+            resource = transaction.target_resource
+            snapshots[transaction.id] = await _resolve_result(serializer(resource))
+
+    async def _update_resource(self, transaction):
+        if self._check_update(transaction):
+            try:
+                deserializer = transaction.inbound_deserializer
+                await _resolve_result(
+                    deserializer(transaction.inbound_payload, transaction.target_resource)
+                )
+            except Exception as e:
+                self._fail_update(transaction, e)
+
+        self._finish_update(transaction)
+
+    async def _invoke_handlers_async(self, event, transaction):
+        self._invoke_handlers(event, transaction)
+        await self._await_handler_results(transaction)
+
+    async def _await_handler_results(self, transaction):
+        try:
+            pending = self._pending_handler_results.pop(transaction.id)
+        except KeyError:
+            return
+
+        for handler, result in pending:
+            try:
+                await result
+            except ElementalError as e:
+                transaction.errors.append(e)
+            except Exception as e:
+                msg = 'Error occurred in handler "{0}.{1}" - {2}'
+                msg = msg.format(handler.__module__, handler.__name__, e)
+                e = ElementalError(msg, inner_error=e)
+                transaction.errors.append(e)
+
+    def _handle_handler_result(self, handler, transaction, result):
+        if not inspect.isawaitable(result):
+            return
+
+        try:
+            pending = self._pending_handler_results[transaction.id]
+        except KeyError:
+            pending = []
+            self._pending_handler_results[transaction.id] = pending
+        pending.append((handler, result))
+
+
+async def _resolve_result(result):
+    """
+    Awaits the result of a serializer or deserializer if it is awaitable.
+    """
+    if inspect.isawaitable(result):
+        result = await result
+    return result
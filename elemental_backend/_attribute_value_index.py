@@ -0,0 +1,270 @@
+import bisect
+import functools
+import numbers
+
+from elemental_core import NO_VALUE
+
+
+@functools.total_ordering
+class _Maximum(object):
+    """
+    Compares greater than any other object.
+    """
+    __slots__ = ()
+
+    def __eq__(self, other):
+        return other is self
+
+    def __gt__(self, other):
+        return other is not self
+
+    def __hash__(self):
+        return id(self)
+
+
+_MAXIMUM = _Maximum()
+
+
+def _compute_index_key(value):
+    """
+    Returns:
+        Key ordering `value` among other indexed values, or None if `value`
+            cannot be ordered by the index.
+    """
+    if isinstance(value, numbers.Number) and not isinstance(value, complex):
+        if value != value:
+            # NaN compares false with everything, so would break the order.
+            return None
+        return 0, value
+    elif isinstance(value, str):
+        return 1, value
+
+    return None
+
+
+class AttributeValueIndex(object):
+    """
+    Maps the values of `AttributeInstances` to the `ContentInstances` holding
+        them, kept in sorted order.
+
+    An index serves a single `FilterType`, holding the values of every
+    `AttributeInstance` of the `FilterType`'s `AttributeTypes`. Equality,
+    range and prefix `FilterInstances` are answered by bisecting the sorted
+    values instead of evaluating every `ContentInstance` in a pool.
+
+    Numbers and strings are indexed, other than NaN. Other values are held
+    aside and tested individually on every lookup.
+    """
+    LOOKUP_PARAMS = ('equals', 'minimum', 'maximum', 'prefix')
+
+    @property
+    def attribute_type_ids(self):
+        return self._attribute_type_ids
+
+    def __init__(self, attribute_type_ids):
+        super(AttributeValueIndex, self).__init__()
+
+        self._attribute_type_ids = frozenset(attribute_type_ids)
+
+        # Sorted (index key, AttributeInstance id) pairs.
+        self._entries = []
+        self._map__attribute_instance__entry = {}
+        self._unindexed_attribute_instance_ids = set()
+
+    def __len__(self):
+        return len(self._map__attribute_instance__entry)
+
+    @classmethod
+    def supports(cls, kind_params):
+        """
+        Determines whether a `FilterInstance`'s params can be answered by an
+            index lookup.
+        """
+        return any(param in kind_params for param in cls.LOOKUP_PARAMS)
+
+    @classmethod
+    def build(cls, attribute_type_ids, items):
+        """
+        Builds an index from many values at once, sorting them a single time
+            rather than inserting each in turn.
+
+        Args:
+            attribute_type_ids (Iterable): Ids of the `AttributeTypes` the
+                index serves.
+            items (Iterable): (`AttributeInstance` id, `ContentInstance` id,
+                value) for each value to index.
+
+        Returns:
+            AttributeValueIndex: The populated index.
+        """
+        result = cls(attribute_type_ids)
+        map_ai_e = result._map__attribute_instance__entry
+
+        for attribute_instance_id, content_instance_id, value in items:
+            if value is None or value is NO_VALUE:
+                continue
+
+            key = _compute_index_key(value)
+            map_ai_e[attribute_instance_id] = (key, content_instance_id, value)
+
+        for attribute_instance_id, (key, _, _) in map_ai_e.items():
+            if key is None:
+                result._unindexed_attribute_instance_ids.add(
+                    attribute_instance_id)
+            else:
+                result._entries.append((key, attribute_instance_id))
+
+        result._entries.sort()
+
+        return result
+
+    def push_value(self, attribute_instance_id, content_instance_id, value):
+        """
+        Indexes the value of an `AttributeInstance`, replacing any value
+            previously indexed for it.
+        """
+        self.pop_value(attribute_instance_id)
+
+        if value is None or value is NO_VALUE:
+            return
+
+        key = _compute_index_key(value)
+        self._map__attribute_instance__entry[attribute_instance_id] = (
+            key, content_instance_id, value)
+
+        if key is None:
+            self._unindexed_attribute_instance_ids.add(attribute_instance_id)
+        else:
+            bisect.insort(self._entries, (key, attribute_instance_id))
+
+    def pop_value(self, attribute_instance_id):
+        try:
+            key, _, _ = self._map__attribute_instance__entry.pop(
+                attribute_instance_id)
+        except KeyError:
+            return
+
+        if key is None:
+            self._unindexed_attribute_instance_ids.discard(
+                attribute_instance_id)
+            return
+
+        entry = (key, attribute_instance_id)
+        entry_idx = bisect.bisect_left(self._entries, entry)
+        if (entry_idx < len(self._entries) and
+                self._entries[entry_idx] == entry):
+            del self._entries[entry_idx]
+
+    def lookup(self, kind_params, predicate):
+        """
+        Finds the `ContentInstances` holding a value that satisfies a
+            `FilterInstance`.
+
+        The most selective supported parameter narrows the candidate values;
+        each candidate is then confirmed with `predicate`, so the remaining
+        parameters are honoured as well.
+
+        Args:
+            kind_params (dict): The `FilterInstance`'s `kind_params`.
+            predicate (callable): The `FilterInstance`'s compiled filter.
+
+        Returns:
+            Set of `ContentInstance` ids, or `NO_VALUE` if `kind_params`
+                cannot be answered by the index.
+        """
+        if 'equals' in kind_params:
+            candidates = self._iter_equal(kind_params['equals'])
+        elif 'minimum' in kind_params or 'maximum' in kind_params:
+            candidates = self._iter_range(kind_params.get('minimum', NO_VALUE),
+                                          kind_params.get('maximum', NO_VALUE))
+        elif 'prefix' in kind_params:
+            candidates = self._iter_prefixed(kind_params['prefix'])
+        else:
+            return NO_VALUE
+
+        if candidates is NO_VALUE:
+            return NO_VALUE
+
+        result = set()
+        self._match_entries(candidates, predicate, result)
+        self._match_entries(self._unindexed_attribute_instance_ids, predicate,
+                            result)
+
+        return result
+
+    def _match_entries(self, attribute_instance_ids, predicate, result):
+        map_ai_e = self._map__attribute_instance__entry
+
+        for attribute_instance_id in attribute_instance_ids:
+            try:
+                _, content_instance_id, value = map_ai_e[
+                    attribute_instance_id]
+            except KeyError:
+                # Skips entries left behind by a value that was popped.
+                continue
+
+            if predicate(value):
+                result.add(content_instance_id)
+
+    def _iter_equal(self, expected):
+        key = _compute_index_key(expected)
+        if key is None:
+            return NO_VALUE
+
+        return self._iter_between((key,), (key, _MAXIMUM))
+
+    def _iter_range(self, minimum, maximum):
+        if minimum is not NO_VALUE:
+            minimum_key = _compute_index_key(minimum)
+            if minimum_key is None:
+                return NO_VALUE
+        else:
+            minimum_key = None
+
+        if maximum is not NO_VALUE:
+            maximum_key = _compute_index_key(maximum)
+            if maximum_key is None:
+                return NO_VALUE
+        else:
+            maximum_key = None
+
+        if minimum_key and maximum_key:
+            if minimum_key[0] != maximum_key[0]:
+                # No value compares with both a number and a string.
+                return iter(())
+            lower, upper = (minimum_key,), (maximum_key, _MAXIMUM)
+        elif minimum_key:
+            lower, upper = (minimum_key,), ((minimum_key[0] + 1,),)
+        else:
+            lower, upper = ((maximum_key[0],),), (maximum_key, _MAXIMUM)
+
+        return self._iter_between(lower, upper)
+
+    def _iter_prefixed(self, prefix):
+        if not isinstance(prefix, str):
+            return NO_VALUE
+
+        return self._iter_prefixed_entries(prefix)
+
+    def _iter_prefixed_entries(self, prefix):
+        # Numbers match a prefix through their string form, so they are all
+        # candidates. Strings starting with the prefix are contiguous.
+        for attribute_instance_id in self._iter_between(((0,),), ((1,),)):
+            yield attribute_instance_id
+
+        entries = self._entries
+        entry_idx = bisect.bisect_left(entries, ((1, prefix),))
+        while entry_idx < len(entries):
+            (kind, value), attribute_instance_id = entries[entry_idx]
+            if kind != 1 or not value.startswith(prefix):
+                break
+            yield attribute_instance_id
+            entry_idx += 1
+
+    def _iter_between(self, lower, upper):
+        entries = self._entries
+        lower_idx = bisect.bisect_left(entries, lower)
+        upper_idx = bisect.bisect_left(entries, upper)
+
+        return (attribute_instance_id
+                for _, attribute_instance_id in entries[lower_idx:upper_idx])
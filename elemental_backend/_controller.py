@@ -1,18 +1,22 @@
+import json
 import logging
+import re
 import weakref
-from collections import deque
+from functools import partial
 
-from elemental_core import ElementalError
+from elemental_core import ElementalError, NO_VALUE
 from elemental_core.util import process_elemental_class_value
 
-from .transactions import Actions
+from .transactions import Actions, Batch
 from ._controller_events import ControllerEvents
 from .errors import (
     InvalidSerializerKeyError,
     SerializerNotFoundError,
     InvalidDeserializerKeyError,
+    DeserializerError,
     DeserializerNotFoundError,
     InvalidHandlerKeyError,
+    InvalidStageKeyError,
     TransactionError,
     InvalidTransactionAction,
     ResourceNotFoundError,
@@ -31,11 +35,67 @@ class Controller(object):
     A `Controller` manages `Model` access through `Transaction` processing.
     """
 
+    # Names of the steps a `Transaction` proceeds through for each `Action`.
+    # `snapshot_resource` only runs for `Transactions` processed in a `Batch`.
+    _ACTION_STEPS = {
+        Actions.POST: (
+            "resolve_inbound_deserializer",
+            "resolve_outbound_serializer",
+            "create_resource",
+            "update_resource",
+            "register_resource",
+        ),
+        Actions.GET: ("resolve_resource", "resolve_outbound_serializer"),
+        Actions.PUT: (
+            "resolve_resource",
+            "resolve_inbound_deserializer",
+            "resolve_outbound_serializer",
+            "snapshot_resource",
+            "update_resource",
+        ),
+        Actions.DELETE: (
+            "resolve_resource",
+            "resolve_outbound_serializer",
+            "delete_resource",
+        ),
+    }
+
+    @property
+    def model(self):
+        """
+        The `Model` managed by this `Controller`.
+        """
+        return self._model
+
     def __init__(self, model):
         self._model = model
         self._serializers = weakref.WeakValueDictionary()
         self._deserializers = weakref.WeakValueDictionary()
+
+        # Map the (resource type, data format) values found on Transactions
+        # to the key of the registered serializer or deserializer resolving
+        # them. Cleared whenever one is registered.
+        self._resolved_serializer_keys = {}
+        self._resolved_deserializer_keys = {}
         self._handlers = {}
+        self._stages = {}
+
+        # Maps the (event, action, resource type) of an invocation to the
+        # weak references of every handler it invokes. Built as invocations
+        # occur, and cleared when a handler is registered or collected.
+        self._handler_dispatch = {}
+
+        self_ref = weakref.ref(self)
+
+        def drop_handler(handler_ref):
+            controller = self_ref()
+            if controller is not None:
+                controller._drop_handler(handler_ref)
+
+        self._drop_handler_callback = drop_handler
+
+        # Compiled once and rebuilt only when a stage is registered.
+        self._transaction_processes = self._build_transaction_processes()
 
     def serializer(self, resource_type, data_format):
         """
@@ -46,6 +106,9 @@ class Controller(object):
 
         `serializer` functions must return a string.
 
+        A `serializer` also serializes subclasses of `resource_type` that
+        have no `serializer` of their own for `data_format`.
+
         Args:
             resource_type (Resource): The type of `Resource` handled by the
                 decorated function.
@@ -76,6 +139,7 @@ class Controller(object):
                 )
 
             self._serializers[key] = func
+            self._resolved_serializer_keys.clear()
 
             msg = 'Registered "{0}.{1}" as the "{2}" serializer to "{3}"'
             msg = msg.format(func.__module__, func.__name__, key[0].__name__, data_format)
@@ -95,6 +159,9 @@ class Controller(object):
 
         `deserializer` functions should not return any data; it will be discarded.
 
+        A `deserializer` also deserializes subclasses of `resource_type` that
+        have no `deserializer` of their own for `data_format`.
+
         Args:
             resource_type (Resource): The type of `Resource` handled by the
                 decorated function.
@@ -125,6 +192,7 @@ class Controller(object):
                 )
 
             self._deserializers[key] = func
+            self._resolved_deserializer_keys.clear()
 
             msg = 'Registered "{0}.{1}" as the "{2}" deserializer from "{3}"'
             msg = msg.format(func.__module__, func.__name__, key[0].__name__, data_format)
@@ -181,7 +249,8 @@ class Controller(object):
             except KeyError:
                 handlers = []
                 self._handlers[key] = handlers
-            handlers.append(weakref.ref(func))
+            handlers.append(weakref.ref(func, self._drop_handler_callback))
+            self._handler_dispatch.clear()
 
             msg = 'Registered "{0}.{1}" as an event handler for "{2}"'
             msg = msg.format(func.__module__, func.__name__, event)
@@ -191,6 +260,66 @@ class Controller(object):
 
         return wrap
 
+    def stage(self, action, after=None):
+        """
+        Decorator for registering functions as custom steps of the pipeline
+            `Transactions` proceed through.
+
+        Functions decorated as `stages` take one argument:
+            transaction - the transaction currently under going processing.
+
+        A `stage` fails the `Transaction` by raising an exception. Later steps
+        of the pipeline are then skipped. Functions decorated as `stages`
+        should not return anything.
+
+        Args:
+            action (Actions): The `Action` whose pipeline the function joins.
+            after (Optional[str]): Defaults to None. The name of the step of
+                the pipeline after which the function is invoked, such as
+                "resolve_resource" or "update_resource". If None, the function
+                is invoked after every other step.
+
+        Returns:
+            None
+
+        Notes:
+            The decorated function is not modified or wrapped. Unlike
+            handlers, `stages` are strongly referenced by the `Controller`.
+        """
+
+        def wrap(func):
+            try:
+                step_names = self._ACTION_STEPS[action]
+            except (KeyError, TypeError):
+                step_names = ()
+
+            if not step_names or (after is not None and after not in step_names):
+                msg = (
+                    'Failed to register "{0}.{1}" as a stage: '
+                    'Invalid action ("{2}") or step ("{3}").'
+                )
+                msg = msg.format(func.__module__, func.__name__, action, after)
+
+                _LOG.error(msg)
+                raise InvalidStageKeyError(msg)
+
+            try:
+                stages = self._stages[action, after]
+            except KeyError:
+                stages = []
+                self._stages[action, after] = stages
+            stages.append(func)
+
+            self._transaction_processes = self._build_transaction_processes()
+
+            msg = 'Registered "{0}.{1}" as a stage of "{2}" after "{3}"'
+            msg = msg.format(func.__module__, func.__name__, action, after)
+            _LOG.info(msg)
+
+            return func
+
+        return wrap
+
     def import_resource(self, resource_type, resource_data, data_format):
         """
         Create and register a `Resource` outside the `Transaction` system.
@@ -207,41 +336,17 @@ class Controller(object):
         Returns:
             None
         """
-        deserializer_key = process_deserializer_key(resource_type, data_format)
-        if not deserializer_key:
-            msg = (
-                "Failed to import resource: "
-                'Invalid resource type ("{0}") or data format ("{1}").'
-            )
-            msg = msg.format(resource_type, data_format)
-
-            _LOG.error(msg)
-            raise InvalidDeserializerKeyError(
-                msg, resource_type=resource_type, data_format=data_format
-            )
-
-        try:
-            deserializer = self._deserializers[deserializer_key]
-        except KeyError:
-            msg = (
-                "Failed to import resource: No deserializer found for "
-                'resource type "{0}" and data format "{1}".'
-            )
-            msg = msg.format(repr(resource_type), data_format)
-
-            _LOG.error(msg)
-            raise DeserializerNotFoundError(
-                msg, resource_type=resource_type, data_format=data_format
-            )
+        deserializer = self._require_deserializer(resource_type, data_format)
 
         resource_type = process_elemental_class_value(resource_type)
         resource = resource_type()
         deserializer(resource_data, resource)
         self._model.register_resource(resource)
 
-        msg = 'Imported resource "{0}" from "{1}".'
-        msg = msg.format(resource.id, data_format)
-        _LOG.info(msg)
+        if _LOG.isEnabledFor(logging.INFO):
+            msg = 'Imported resource "{0}" from "{1}".'
+            msg = msg.format(resource.id, data_format)
+            _LOG.info(msg)
 
         return resource
 
@@ -264,40 +369,149 @@ class Controller(object):
             _LOG.error(msg)
             raise e
 
-        serializer_key = process_serializer_key(type(resource), data_format)
-        if not serializer_key:
-            msg = (
-                "Failed to export resource: "
-                'Invalid resource type ("{0}") or data format ("{1}").'
-            )
-            msg = msg.format(type(resource), data_format)
+        serializer = self._require_serializer(type(resource), data_format)
+        resource_data = serializer(resource)
 
-            _LOG.error(msg)
-            raise InvalidSerializerKeyError(
-                msg, resource_type=type(resource), data_format=data_format
-            )
+        if _LOG.isEnabledFor(logging.INFO):
+            msg = 'Exported resource "{0}" to "{1}".'
+            msg = msg.format(resource_id, data_format)
+            _LOG.info(msg)
 
-        try:
-            serializer = self._serializers[serializer_key]
-        except KeyError:
-            msg = (
-                "Failed to resolve serializer for "
-                'resource type "{0}" and data format "{1}".'
-            )
-            msg = msg.format(repr(type(resource)), data_format)
+        return resource_data
 
-            _LOG.error(msg)
-            raise SerializerNotFoundError(
-                msg, resource_type=type(resource), data_format=data_format
-            )
+    def import_resource_stream(self, stream, data_format="json", batch_size=1000):
+        """
+        Create and register the `Resources` of a newline-delimited stream
+            outside the `Transaction` system.
 
-        resource_data = serializer(resource)
+        Each non-blank line holds one serialized `Resource` whose `type`
+        field, written by every `serialization.json` serializer, names its
+        `Resource` type. Lines are read one at a time and the `Resources`
+        are registered `batch_size` at a time with
+        `Model.register_resources`, so memory use does not grow with the
+        stream.
 
-        msg = 'Exported resource "{0}" to "{1}".'
-        msg = msg.format(resource_id, data_format)
-        _LOG.info(msg)
+        As with `import_resource`, no events are triggered. `Resources`
+        registered before an error remain registered.
 
-        return resource_data
+        Args:
+            stream (Iterable[str or bytes]): Lines of serialized `Resources`,
+                such as a file opened for reading.
+            data_format (str): Format of serialized data.
+            batch_size (int): Number of `Resources` registered at a time.
+
+        Returns:
+            int: The number of `Resources` imported.
+        """
+        map__type_name__codec = {}
+        batch = []
+        count = 0
+
+        for line_number, line in enumerate(stream, 1):
+            if isinstance(line, bytes):
+                line = line.decode("utf-8")
+            if not line.strip():
+                continue
+
+            try:
+                type_name = _read_resource_type_name(line)
+            except (ValueError, KeyError, TypeError) as e:
+                msg = (
+                    "Failed to import resource stream: "
+                    'Line {0} has no resource type - {1}: "{2}"'
+                )
+                msg = msg.format(line_number, type(e).__name__, e)
+
+                _LOG.error(msg)
+                raise DeserializerError(msg, inner_error=e, data_format=data_format)
+
+            try:
+                resource_type, deserializer = map__type_name__codec[type_name]
+            except KeyError:
+                deserializer = self._require_deserializer(type_name, data_format)
+                resource_type = process_elemental_class_value(type_name)
+                map__type_name__codec[type_name] = (resource_type, deserializer)
+
+            resource = resource_type()
+            deserializer(line, resource)
+            batch.append(resource)
+
+            if len(batch) >= batch_size:
+                self._model.register_resources(batch)
+                count += len(batch)
+                batch = []
+
+        if batch:
+            self._model.register_resources(batch)
+            count += len(batch)
+
+        if _LOG.isEnabledFor(logging.INFO):
+            msg = 'Imported {0} resources from "{1}" stream.'
+            msg = msg.format(count, data_format)
+            _LOG.info(msg)
+
+        return count
+
+    def iter_exported_resources(self, data_format="json"):
+        """
+        Serializes every `Resource` in the `Model` outside the `Transaction`
+            system, one line at a time.
+
+        The `Resources` are read through a `Model.snapshot`, so the `Model`
+        may keep changing while the lines are consumed, and only one
+        serialized `Resource` is held at a time. The lines can be written to
+        a file or socket as they are produced, and read back with
+        `import_resource_stream`. No events are triggered.
+
+        Args:
+            data_format (str): Format to serialize `Resources` to. Serialized
+                data must not contain newlines.
+
+        Yields:
+            str: A serialized `Resource` followed by a newline.
+
+        Raises:
+            SerializerNotFoundError: If a `Resource` type has no serializer.
+                Raised before the first line is produced.
+        """
+        map__resource_cls__serializer = {}
+
+        with self._model.snapshot() as snapshot:
+            # Resolved up front so that a missing serializer does not leave a
+            # partially written stream.
+            for resource in snapshot.iter_resources():
+                resource_cls = type(resource)
+                if resource_cls not in map__resource_cls__serializer:
+                    serializer = self._require_serializer(resource_cls, data_format)
+                    map__resource_cls__serializer[resource_cls] = serializer
+
+            for resource in snapshot.iter_resources():
+                serializer = map__resource_cls__serializer[type(resource)]
+                yield serializer(resource) + "\n"
+
+    def export_resource_stream(self, stream, data_format="json"):
+        """
+        Writes every `Resource` in the `Model` to `stream`, one serialized
+            `Resource` per line. See `iter_exported_resources`.
+
+        Args:
+            stream: A text file-like object open for writing.
+            data_format (str): Format to serialize `Resources` to.
+
+        Returns:
+            int: The number of `Resources` exported.
+        """
+        count = 0
+        for line in self.iter_exported_resources(data_format):
+            stream.write(line)
+            count += 1
+
+        if _LOG.isEnabledFor(logging.INFO):
+            msg = 'Exported {0} resources to "{1}" stream.'
+            msg = msg.format(count, data_format)
+            _LOG.info(msg)
+
+        return count
 
     def process_transaction(self, transaction):
         """
@@ -318,40 +532,149 @@ class Controller(object):
         Returns:
             The `Transaction` instance passed in.
         """
-        msg = "Opened Transaction: {0} {1}"
-        msg = msg.format(transaction.action, transaction.id)
-        _LOG.info(msg)
-
-        processes = {
-            Actions.POST: deque(
-                (
-                    self._resolve_transaction_inbound_deserializer,
-                    self._resolve_transaction_outbound_serializer,
-                    self._create_resource,
-                    self._update_resource,
-                    self._register_resource,
-                )
-            ),
-            Actions.GET: deque(
-                (self._resolve_resource, self._resolve_transaction_outbound_serializer)
-            ),
-            Actions.PUT: deque(
-                (
-                    self._resolve_resource,
-                    self._resolve_transaction_inbound_deserializer,
-                    self._resolve_transaction_outbound_serializer,
-                    self._update_resource,
-                )
+        self._open_transaction(transaction)
+
+        self._run_transaction(transaction, self._transaction_processes)
+
+        self._close_transaction(transaction)
+
+        return transaction
+
+    def process_batch(self, transactions):
+        """
+        Processes many `Transactions` as a single `Batch`.
+
+        Each `Transaction` proceeds as it would through `process_transaction`,
+        in the order given. Adjacent `Transactions` sharing a `super_id` are
+        processed as one batch `Transaction`: if any of them fails, the
+        changes made to the `Model` by all of them are rolled back, and the
+        remaining members are not processed. Only the `Resources` updated by
+        batch `Transactions` of more than one member are snapshotted, so that
+        they can be restored.
+
+        Handlers for the `batch_` `ControllerEvents` are invoked with the
+        `Batch`; handlers for the other `ControllerEvents` are invoked with
+        each `Transaction` as usual.
+
+        Args:
+            transactions (Iterable[Transaction]): The `Transactions` to
+                process, in order. Each is modified as it proceeds through
+                the system.
+
+        Returns:
+            The `Batch` holding the `Transactions`.
+
+        Raises:
+            InvalidBatchError: If the members of a batch `Transaction` are
+                not adjacent. No `Transaction` is processed.
+        """
+        batch = Batch(transactions)
+
+        if _LOG.isEnabledFor(logging.INFO):
+            msg = "Opened Batch: {0} ({1} Transactions)"
+            msg = msg.format(batch.id, len(batch.transactions))
+            _LOG.info(msg)
+
+        self._invoke_handlers(ControllerEvents.batch_opened, batch)
+
+        snapshots = {}
+        applied = set()
+        unit_processes = self._build_transaction_processes(
+            snapshots=snapshots, applied=applied
+        )
+
+        for unit in batch.iter_units():
+            # A lone Transaction has no other members to roll back with it,
+            # so it is processed without snapshots.
+            if len(unit) > 1:
+                processes = unit_processes
+            else:
+                processes = self._transaction_processes
+            self._process_batch_unit(batch, unit, processes, snapshots, applied)
+
+        if batch.errors or any(t.errors for t in batch.transactions):
+            self._invoke_handlers(ControllerEvents.batch_failed, batch)
+        else:
+            self._invoke_handlers(ControllerEvents.batch_succeeded, batch)
+
+        self._invoke_handlers(ControllerEvents.batch_closing, batch)
+
+        for error in batch.errors:
+            _LOG.error(error.message)
+
+        if _LOG.isEnabledFor(logging.INFO):
+            msg = "Closed Batch: {0}"
+            msg = msg.format(batch.id)
+            _LOG.info(msg)
+
+        return batch
+
+    def _build_transaction_processes(self, snapshots=None, applied=None):
+        """
+        Maps each `Action` to the steps a `Transaction` proceeds through.
+
+        Args:
+            snapshots (Optional[dict]): If given, `Resources` are serialized
+                into it before being updated so that the update can be rolled
+                back.
+            applied (Optional[set]): If given, the IDs of `Transactions` whose
+                `Resource` was registered with, or released from, the `Model`
+                are added to it so that the change can be rolled back.
+
+        Returns:
+            dict: Tuple of steps for each `Action`, including the stages
+                registered through `stage`.
+        """
+        steps = {
+            "resolve_resource": self._resolve_resource,
+            "resolve_inbound_deserializer": (
+                self._resolve_transaction_inbound_deserializer
             ),
-            Actions.DELETE: deque(
-                (
-                    self._resolve_resource,
-                    self._resolve_transaction_outbound_serializer,
-                    self._delete_resource,
-                )
+            "resolve_outbound_serializer": (
+                self._resolve_transaction_outbound_serializer
             ),
+            "create_resource": self._create_resource,
+            "update_resource": self._update_resource,
+            "register_resource": self._register_resource,
+            "delete_resource": self._delete_resource,
         }
 
+        if snapshots is not None:
+            steps["snapshot_resource"] = partial(
+                self._snapshot_resource, snapshots=snapshots
+            )
+
+        if applied is not None:
+            steps["register_resource"] = partial(
+                self._register_resource, applied=applied
+            )
+            steps["delete_resource"] = partial(self._delete_resource, applied=applied)
+
+        result = {}
+
+        for action, step_names in self._ACTION_STEPS.items():
+            processes = []
+
+            for step_name in step_names:
+                try:
+                    processes.append(steps[step_name])
+                except KeyError:
+                    pass
+                processes.extend(self._stages.get((action, step_name), ()))
+
+            processes.extend(self._stages.get((action, None), ()))
+
+            result[action] = tuple(processes)
+
+        return result
+
+    def _open_transaction(self, transaction):
+        if _LOG.isEnabledFor(logging.INFO):
+            msg = "Opened Transaction: {0} {1}"
+            msg = msg.format(transaction.action, transaction.id)
+            _LOG.info(msg)
+
+    def _run_transaction(self, transaction, processes):
         try:
             processes = processes[transaction.action]
         except KeyError:
@@ -370,32 +693,128 @@ class Controller(object):
                 e = TransactionError(msg, inner_error=e, transaction=transaction)
                 transaction.errors.append(e)
 
+    def _close_transaction(self, transaction):
+        if self._check_outbound_payload(transaction):
+            serializer = transaction.outbound_serializer
+            resource = transaction.target_resource
+            payload = serializer(resource)
+            transaction.outbound_payload = payload
+
+        self._log_transaction_closed(transaction)
+
+    def _check_outbound_payload(self, transaction):
+        """
+        Logs the errors of a `Transaction` being closed.
+
+        Returns:
+            bool: True if the `Transaction's` target `Resource` should be
+                serialized into its outbound payload.
+        """
         for error in transaction.errors:
             _LOG.error(error.message)
 
-        if all(
+        return all(
             [
                 not transaction.errors,
                 transaction.target_resource,
                 transaction.outbound_format,
             ]
-        ):
-            serializer = transaction.outbound_serializer
-            resource = transaction.target_resource
-            payload = serializer(resource)
-            transaction.outbound_payload = payload
+        )
 
-        msg = "Closed Transaction: {0} {1}"
-        msg = msg.format(transaction.action, transaction.id)
-        _LOG.info(msg)
+    def _log_transaction_closed(self, transaction):
+        if _LOG.isEnabledFor(logging.INFO):
+            msg = "Closed Transaction: {0} {1}"
+            msg = msg.format(transaction.action, transaction.id)
+            _LOG.info(msg)
 
-        return transaction
+    def _process_batch_unit(self, batch, unit, processes, snapshots, applied):
+        """
+        Processes the members of a batch `Transaction`, rolling all of them
+            back if any fails.
+        """
+        processed = []
+        failed_transaction = None
+
+        for transaction in unit:
+            self._open_transaction(transaction)
+            self._run_transaction(transaction, processes)
+            processed.append(transaction)
+
+            if transaction.errors:
+                failed_transaction = transaction
+                break
+
+        if failed_transaction is not None:
+            for transaction in reversed(processed):
+                self._rollback_transaction(batch, transaction, snapshots, applied)
+
+            self._fail_batch_unit(unit, processed, failed_transaction)
+
+        for transaction in unit:
+            snapshots.pop(transaction.id, None)
+            applied.discard(transaction.id)
+            self._close_transaction(transaction)
+
+    def _fail_batch_unit(self, unit, processed, failed_transaction):
+        """
+        Records on the other members of a batch `Transaction` that it failed.
+        """
+        for transaction in unit:
+            if transaction is failed_transaction:
+                continue
+
+            if transaction in processed:
+                msg = 'Transaction "{0}" rolled back: batch Transaction "{1}" failed'
+            else:
+                msg = 'Transaction "{0}" not processed: batch Transaction "{1}" failed'
+            msg = msg.format(transaction.id, transaction.super_id)
+            e = TransactionError(msg, transaction=transaction)
+            transaction.errors.append(e)
+
+    def _rollback_transaction(self, batch, transaction, snapshots, applied):
+        """
+        Reverts the changes a processed `Transaction` made to the `Model`.
+        """
+        resource = transaction.target_resource
+
+        try:
+            if transaction.action is Actions.PUT:
+                # Restored even when the update failed, as a deserializer may
+                # have partially updated the Resource before failing.
+                snapshot = snapshots.get(transaction.id)
+                if snapshot is not None:
+                    transaction.inbound_deserializer(snapshot, resource)
+            elif transaction.id not in applied:
+                # The Transaction failed before changing the Model; a later
+                # step or handler failing does not undo the change itself.
+                return
+            elif transaction.action is Actions.POST:
+                self._model.release_resource(resource.id)
+            elif transaction.action is Actions.DELETE:
+                self._model.register_resource(resource)
+            else:
+                return
+        except Exception as e:
+            self._fail_rollback(batch, transaction, e)
+        else:
+            if _LOG.isEnabledFor(logging.DEBUG):
+                msg = 'Transaction rolled back: "{0}"'.format(transaction.id)
+                _LOG.debug(msg)
+
+    def _fail_rollback(self, batch, transaction, error):
+        msg = 'Failed to roll back Transaction "{0}": {1} - {2}'
+        msg = msg.format(transaction.id, type(error).__name__, error)
+        e = TransactionError(msg, inner_error=error, transaction=transaction)
+        transaction.errors.append(e)
+        batch.errors.append(e)
 
     def _process_transaction(self, transaction, processes):
         self._invoke_handlers(ControllerEvents.transaction_opened, transaction)
 
-        while processes and not transaction.errors:
-            process = processes.popleft()
+        for process in processes:
+            if transaction.errors:
+                break
+
             try:
                 process(transaction)
             except ElementalError as e:
@@ -417,28 +836,30 @@ class Controller(object):
         transaction.inbound_deserializer = None
 
         if not transaction.resource_type:
-            msg = (
-                'Transaction "{0}" inbound deserializer not resolved: '
-                "Transaction has no resource type"
-            )
-            msg = msg.format(transaction.id)
-            _LOG.debug(msg)
+            if _LOG.isEnabledFor(logging.DEBUG):
+                msg = (
+                    'Transaction "{0}" inbound deserializer not resolved: '
+                    "Transaction has no resource type"
+                )
+                msg = msg.format(transaction.id)
+                _LOG.debug(msg)
 
         if not transaction.inbound_format:
-            msg = (
-                'Transaction "{0}" inbound serializer not resolved: '
-                "Transaction has no inbound format"
-            )
-            msg = msg.format(transaction.inbound_format)
-            _LOG.debug(msg)
+            if _LOG.isEnabledFor(logging.DEBUG):
+                msg = (
+                    'Transaction "{0}" inbound serializer not resolved: '
+                    "Transaction has no inbound format"
+                )
+                msg = msg.format(transaction.inbound_format)
+                _LOG.debug(msg)
 
         if not all([transaction.resource_type, transaction.inbound_format]):
             return
 
-        deserializer_key = process_deserializer_key(
+        deserializer = self._resolve_deserializer(
             transaction.resource_type, transaction.inbound_format
         )
-        if not deserializer_key:
+        if deserializer is NO_VALUE:
             msg = (
                 'Failed to process Transaction "{0}": '
                 'Invalid resource type ("{1}") or data format ("{2}").'
@@ -453,9 +874,7 @@ class Controller(object):
                 data_format=transaction.inbound_format,
             )
 
-        try:
-            deserializer = self._deserializers[deserializer_key]
-        except KeyError:
+        if not deserializer:
             msg = (
                 'Failed to process Transaction "{0}": '
                 'No deserializer for resource type "{1}" and data format "{2}".'
@@ -469,35 +888,37 @@ class Controller(object):
                 resource_type=transaction.resource_type,
                 data_format=transaction.inbound_format,
             )
-        else:
-            transaction.inbound_deserializer = deserializer
+
+        transaction.inbound_deserializer = deserializer
 
     def _resolve_transaction_outbound_serializer(self, transaction):
         transaction.outbound_serializer = None
 
         if not transaction.resource_type:
-            msg = (
-                'Transaction "{0}" outbound serializer not resolved: '
-                "Transaction has no resource type"
-            )
-            msg = msg.format(transaction.id)
-            _LOG.debug(msg)
+            if _LOG.isEnabledFor(logging.DEBUG):
+                msg = (
+                    'Transaction "{0}" outbound serializer not resolved: '
+                    "Transaction has no resource type"
+                )
+                msg = msg.format(transaction.id)
+                _LOG.debug(msg)
 
         if not transaction.outbound_format:
-            msg = (
-                'Transaction "{0}" outbound serializer not resolved: '
-                "Transaction has no outbound format"
-            )
-            msg = msg.format(transaction.outbound_format)
-            _LOG.debug(msg)
+            if _LOG.isEnabledFor(logging.DEBUG):
+                msg = (
+                    'Transaction "{0}" outbound serializer not resolved: '
+                    "Transaction has no outbound format"
+                )
+                msg = msg.format(transaction.outbound_format)
+                _LOG.debug(msg)
 
         if not all([transaction.resource_type, transaction.outbound_format]):
             return
 
-        serializer_key = process_serializer_key(
+        serializer = self._resolve_serializer(
             transaction.resource_type, transaction.outbound_format
         )
-        if not serializer_key:
+        if serializer is NO_VALUE:
             msg = (
                 'Failed to process Transaction "{0}": '
                 'Invalid resource type ("{1}") or data format ("{2}").'
@@ -511,9 +932,7 @@ class Controller(object):
                 data_format=transaction.inbound_format,
             )
 
-        try:
-            serializer = self._serializers[serializer_key]
-        except KeyError:
+        if not serializer:
             msg = (
                 'Failed to process Transaction "{0}": '
                 'No serializer for resource type "{1}" and data format "{2}".'
@@ -526,8 +945,183 @@ class Controller(object):
                 resource_type=transaction.resource_type,
                 data_format=transaction.inbound_format,
             )
-        else:
-            transaction.outbound_serializer = serializer
+
+        transaction.outbound_serializer = serializer
+
+    def _snapshot_resource(self, transaction, snapshots):
+        """
+        Serializes a `Transaction's` target `Resource` in its inbound format,
+            so that its update can be rolled back.
+        """
+        serializer = self._resolve_snapshot_serializer(transaction)
+        if serializer:
+            resource = transaction.target_resource
+            snapshots[transaction.id] = serializer(resource)
+
+    def _resolve_snapshot_serializer(self, transaction):
+        """
+        Returns:
+            The serializer for a `Transaction's` target `Resource` in its
+                inbound format, or None if there is nothing to snapshot.
+        """
+        resource = transaction.target_resource
+        if not resource or not transaction.inbound_format:
+            # The update fails without either, so there is nothing to restore.
+            return None
+
+        serializer = self._resolve_serializer(
+            type(resource), transaction.inbound_format
+        )
+        if not serializer:
+            msg = (
+                'Failed to process Transaction "{0}": '
+                'Update of resource type "{1}" cannot be rolled back; '
+                'no serializer for data format "{2}".'
+            )
+            msg = msg.format(transaction.id, type(resource), transaction.inbound_format)
+            raise SerializerNotFoundError(
+                msg,
+                resource_type=type(resource),
+                data_format=transaction.inbound_format,
+            )
+
+        return serializer
+
+    def _require_deserializer(self, resource_type, data_format):
+        """
+        Returns:
+            The deserializer resolved for `resource_type` and `data_format`.
+
+        Raises:
+            InvalidDeserializerKeyError: If the values are not a valid
+                deserializer key.
+            DeserializerNotFoundError: If no deserializer is registered.
+        """
+        deserializer = self._resolve_deserializer(resource_type, data_format)
+        if deserializer is NO_VALUE:
+            msg = (
+                "Failed to import resource: "
+                'Invalid resource type ("{0}") or data format ("{1}").'
+            )
+            msg = msg.format(resource_type, data_format)
+
+            _LOG.error(msg)
+            raise InvalidDeserializerKeyError(
+                msg, resource_type=resource_type, data_format=data_format
+            )
+
+        if not deserializer:
+            msg = (
+                "Failed to import resource: No deserializer found for "
+                'resource type "{0}" and data format "{1}".'
+            )
+            msg = msg.format(repr(resource_type), data_format)
+
+            _LOG.error(msg)
+            raise DeserializerNotFoundError(
+                msg, resource_type=resource_type, data_format=data_format
+            )
+
+        return deserializer
+
+    def _require_serializer(self, resource_type, data_format):
+        """
+        Returns:
+            The serializer resolved for `resource_type` and `data_format`.
+
+        Raises:
+            InvalidSerializerKeyError: If the values are not a valid
+                serializer key.
+            SerializerNotFoundError: If no serializer is registered.
+        """
+        serializer = self._resolve_serializer(resource_type, data_format)
+        if serializer is NO_VALUE:
+            msg = (
+                "Failed to export resource: "
+                'Invalid resource type ("{0}") or data format ("{1}").'
+            )
+            msg = msg.format(resource_type, data_format)
+
+            _LOG.error(msg)
+            raise InvalidSerializerKeyError(
+                msg, resource_type=resource_type, data_format=data_format
+            )
+
+        if not serializer:
+            msg = (
+                "Failed to resolve serializer for "
+                'resource type "{0}" and data format "{1}".'
+            )
+            msg = msg.format(repr(resource_type), data_format)
+
+            _LOG.error(msg)
+            raise SerializerNotFoundError(
+                msg, resource_type=resource_type, data_format=data_format
+            )
+
+        return serializer
+
+    def _resolve_serializer(self, resource_type, data_format):
+        """
+        Returns:
+            The serializer registered for `resource_type`, or for its nearest
+                ancestor, and `data_format`. None if there is none, or
+                `NO_VALUE` if the values are not a valid serializer key.
+        """
+        return self._resolve_codec(
+            self._serializers,
+            self._resolved_serializer_keys,
+            process_serializer_key,
+            resource_type,
+            data_format,
+        )
+
+    def _resolve_deserializer(self, resource_type, data_format):
+        """
+        Returns:
+            The deserializer registered for `resource_type`, or for its
+                nearest ancestor, and `data_format`. None if there is none, or
+                `NO_VALUE` if the values are not a valid deserializer key.
+        """
+        return self._resolve_codec(
+            self._deserializers,
+            self._resolved_deserializer_keys,
+            process_deserializer_key,
+            resource_type,
+            data_format,
+        )
+
+    @staticmethod
+    def _resolve_codec(codecs, resolved_keys, process_key, resource_type, data_format):
+        resolved_key = (resource_type, data_format)
+        try:
+            codec_key = resolved_keys[resolved_key]
+        except KeyError:
+            codec_key = _compute_codec_key(codecs, process_key, *resolved_key)
+            resolved_keys[resolved_key] = codec_key
+        except TypeError:
+            # Unhashable values are not cached; processing them rejects them.
+            codec_key = _compute_codec_key(codecs, process_key, *resolved_key)
+
+        if not codec_key:
+            return codec_key
+
+        result = codecs.get(codec_key)
+        if result is None:
+            # The codecs are weakly held, so the one the key was resolved to
+            # may have been collected; an ancestor's codec may still apply.
+            codec_key = _compute_codec_key(codecs, process_key, *resolved_key)
+            try:
+                resolved_keys[resolved_key] = codec_key
+            except TypeError:
+                pass
+
+            if not codec_key:
+                return codec_key
+
+            result = codecs.get(codec_key)
+
+        return result
 
     def _resolve_resource(self, transaction):
         resource_id = transaction.resource_id
@@ -549,8 +1143,9 @@ class Controller(object):
             else:
                 transaction.target_resource = resource
 
-                msg = 'Resource Resolved: "{0}"'.format(resource_id)
-                _LOG.debug(msg)
+                if _LOG.isEnabledFor(logging.DEBUG):
+                    msg = 'Resource Resolved: "{0}"'.format(resource_id)
+                    _LOG.debug(msg)
 
         if transaction.errors:
             self._invoke_handlers(ControllerEvents.resource_not_resolved, transaction)
@@ -579,15 +1174,16 @@ class Controller(object):
             else:
                 transaction.target_resource = resource
 
-                msg = 'Resource Created: "{0}"'.format(resource.id)
-                _LOG.debug(msg)
+                if _LOG.isEnabledFor(logging.DEBUG):
+                    msg = 'Resource Created: "{0}"'.format(resource.id)
+                    _LOG.debug(msg)
 
         if transaction.errors:
             self._invoke_handlers(ControllerEvents.resource_not_created, transaction)
         else:
             self._invoke_handlers(ControllerEvents.resource_created, transaction)
 
-    def _register_resource(self, transaction):
+    def _register_resource(self, transaction, applied=None):
         resource = transaction.target_resource
 
         if not resource:
@@ -608,8 +1204,12 @@ class Controller(object):
                 )
                 transaction.errors.append(e)
             else:
-                msg = 'Resource Registered: "{0}"'.format(resource.id)
-                _LOG.debug(msg)
+                if applied is not None:
+                    applied.add(transaction.id)
+
+                if _LOG.isEnabledFor(logging.DEBUG):
+                    msg = 'Resource Registered: "{0}"'.format(resource.id)
+                    _LOG.debug(msg)
 
         if transaction.errors:
             self._invoke_handlers(ControllerEvents.resource_not_registered, transaction)
@@ -617,6 +1217,22 @@ class Controller(object):
             self._invoke_handlers(ControllerEvents.resource_registered, transaction)
 
     def _update_resource(self, transaction):
+        if self._check_update(transaction):
+            try:
+                transaction.inbound_deserializer(
+                    transaction.inbound_payload, transaction.target_resource
+                )
+            except Exception as e:
+                self._fail_update(transaction, e)
+
+        self._finish_update(transaction)
+
+    def _check_update(self, transaction):
+        """
+        Returns:
+            bool: True if the `Transaction` holds everything needed to update
+                its target `Resource`. Otherwise, an error is recorded.
+        """
         deserializer = transaction.inbound_deserializer
         resource_data = transaction.inbound_payload
         resource = transaction.target_resource
@@ -640,28 +1256,38 @@ class Controller(object):
             )
             transaction.errors.append(e)
         else:
-            try:
-                deserializer(resource_data, resource)
-            except Exception as e:
-                msg = "Resource not updated: {0} - {1}"
-                msg = msg.format(type(e).__name__, e)
-                e = ResourceNotUpdatedError(
-                    msg,
-                    inner_error=e,
-                    resource_type=repr(type(resource)),
-                    resource_id=resource.id,
-                )
-                transaction.errors.append(e)
-            else:
-                msg = 'Resource updated: "{0}"'.format(resource.id)
-                _LOG.debug(msg)
+            return True
+
+        return False
+
+    def _fail_update(self, transaction, error):
+        resource = transaction.target_resource
+
+        msg = "Resource not updated: {0} - {1}"
+        msg = msg.format(type(error).__name__, error)
+        e = ResourceNotUpdatedError(
+            msg,
+            inner_error=error,
+            resource_type=repr(type(resource)),
+            resource_id=resource.id,
+        )
+        transaction.errors.append(e)
 
+    def _finish_update(self, transaction):
         if transaction.errors:
             self._invoke_handlers(ControllerEvents.resource_not_updated, transaction)
         else:
+            if _LOG.isEnabledFor(logging.DEBUG):
+                msg = 'Resource updated: "{0}"'.format(transaction.target_resource.id)
+                _LOG.debug(msg)
+
+            # Changes to a Resource materialised from a ResourceStore would
+            # be lost on eviction.
+            self._model.pin_resource(transaction.target_resource.id)
+
             self._invoke_handlers(ControllerEvents.resource_updated, transaction)
 
-    def _delete_resource(self, transaction):
+    def _delete_resource(self, transaction, applied=None):
         resource = transaction.target_resource
 
         if not resource:
@@ -682,8 +1308,12 @@ class Controller(object):
                 )
                 transaction.errors.append(e)
             else:
-                msg = 'Resource deleted: "{0}"'.format(resource.id)
-                _LOG.debug(msg)
+                if applied is not None:
+                    applied.add(transaction.id)
+
+                if _LOG.isEnabledFor(logging.DEBUG):
+                    msg = 'Resource deleted: "{0}"'.format(resource.id)
+                    _LOG.debug(msg)
 
         if transaction.errors:
             self._invoke_handlers(ControllerEvents.resource_not_deleted, transaction)
@@ -691,33 +1321,120 @@ class Controller(object):
             self._invoke_handlers(ControllerEvents.resource_deleted, transaction)
 
     def _invoke_handlers(self, event, transaction):
-        keys = [(event, None, None), (event, transaction.action, None)]
-        if transaction.resource_type:
-            keys.extend(
-                [
-                    (event, None, transaction.resource_type),
-                    (event, transaction.action, transaction.resource_type),
-                ]
-            )
+        if not self._handlers:
+            return
+
+        dispatch_key = (event, transaction.action, transaction.resource_type)
+        try:
+            handler_refs = self._handler_dispatch[dispatch_key]
+        except KeyError:
+            handler_refs = self._compute_handler_dispatch(*dispatch_key)
+            self._handler_dispatch[dispatch_key] = handler_refs
+
+        for handler_ref in handler_refs:
+            handler = handler_ref()
+            if handler is None:
+                # Collected after dispatch began; dropped by its callback.
+                continue
+
+            try:
+                result = handler(event, transaction)
+            except ElementalError as e:
+                transaction.errors.append(e)
+            except Exception as e:
+                msg = 'Error occurred in handler "{0}.{1}" - {2}'
+                msg = msg.format(handler.__module__, handler.__name__, e)
+                e = ElementalError(msg, inner_error=e)
+                transaction.errors.append(e)
+            else:
+                if result is not None:
+                    self._handle_handler_result(handler, transaction, result)
+
+    def _handle_handler_result(self, handler, transaction, result):
+        """
+        Receives anything returned by a handler. Handlers should not return
+            anything, so it is discarded.
+        """
+        pass
+
+    def _compute_handler_dispatch(self, event, action, resource_type):
+        """
+        Returns:
+            Tuple of weak references to the handlers registered for `event`,
+                for all or the given `action`, and for all or the given
+                `resource_type`, in invocation order.
+        """
+        keys = [(event, None, None), (event, action, None)]
+        if resource_type:
+            keys.extend([(event, None, resource_type), (event, action, resource_type)])
+
+        result = []
+        visited_keys = set()
 
         for key in keys:
             key = process_handler_key(*key)
+            if key in visited_keys:
+                # Without an action, the keys for all actions repeat.
+                continue
+            visited_keys.add(key)
+
+            result.extend(self._handlers.get(key, ()))
+
+        return tuple(result)
+
+    def _drop_handler(self, handler_ref):
+        """
+        Forgets a handler that has been garbage collected.
+        """
+        for key, handler_refs in list(self._handlers.items()):
+            # Dead references only compare equal to themselves.
             try:
-                handlers = self._handlers[key]
-            except KeyError:
+                handler_refs.remove(handler_ref)
+            except ValueError:
                 continue
 
-            handlers = [h() if isinstance(h, weakref.ref) else h for h in handlers]
-            handlers = [h for h in handlers if h]
-            self._handlers[key] = [weakref.ref(h) for h in handlers]
+            if not handler_refs:
+                del self._handlers[key]
 
-            for handler in handlers:
-                try:
-                    handler(event, transaction)
-                except ElementalError as e:
-                    transaction.errors.append(e)
-                except Exception as e:
-                    msg = 'Error occurred in handler "{0}.{1}" - {2}'
-                    msg = msg.format(handler.__module__, handler.__name__, e)
-                    e = ElementalError(msg, inner_error=e)
-                    transaction.errors.append(e)
+        self._handler_dispatch.clear()
+
+
+def _compute_codec_key(codecs, process_key, resource_type, data_format):
+    """
+    Finds the key of the codec registered for `resource_type`, or for its
+        nearest ancestor, and `data_format`.
+
+    Returns:
+        Tuple(`Resource`, str) if a codec is registered, None if not, or
+        `NO_VALUE` if the values cannot be processed into a valid key.
+    """
+    key = process_key(resource_type, data_format)
+    if not key:
+        return NO_VALUE
+
+    resource_type, data_format = key
+    for cls in resource_type.__mro__:
+        codec_key = (cls, data_format)
+        if codec_key in codecs:
+            return codec_key
+
+    return None
+
+
+# Matches the leading "type" field written by the `serialization.json`
+# serializers, so a line's type is known without parsing the whole line.
+_RESOURCE_TYPE_PATTERN = re.compile(r'^\s*\{\s*"type"\s*:\s*"([^"\\]+)"')
+
+
+def _read_resource_type_name(line):
+    """
+    Reads the `type` field of a serialized `Resource`.
+
+    Returns:
+        str: Name of the `Resource` type.
+    """
+    match = _RESOURCE_TYPE_PATTERN.match(line)
+    if match:
+        return match.group(1)
+
+    return json.loads(line)["type"]
@@ -17,3 +17,8 @@ class ControllerEvents(Enum):
     resource_not_updated = 12
     resource_deleted = 13
     resource_not_deleted = 14
+
+    batch_opened = 15
+    batch_succeeded = 16
+    batch_failed = 17
+    batch_closing = 18
@@ -0,0 +1,121 @@
+import weakref
+
+from elemental_core import NO_VALUE
+
+
+_NOT_PRESERVED = object()
+
+
+class CopyOnWriteView(object):
+    """
+    Base for read-only, point-in-time views over a live map.
+
+    The owner of the live map calls `preserve` on every open view before
+    changing a key. A view records the value a key held when the view was
+    taken the first time the key is changed, and ignores later changes, so
+    its memory grows with the number of keys written while it is open rather
+    than with the size of the map.
+
+    Reads consult the live map first and the preserved values second. A key
+    is preserved before it is changed, so a live value is only used when the
+    key had not been changed since the view was taken, and writers are never
+    blocked by readers.
+
+    Subclasses implement `_read_live`.
+    """
+
+    def __init__(self, live_map, views, lock=None):
+        """
+        Args:
+            live_map (Mapping): The map the view is taken of.
+            views (weakref.WeakSet): The owner's open views, which the view
+                joins until closed or collected.
+            lock (Optional[ReadWriteLock]): Lock writers hold while changing
+                the live map, held for reading while the view lists its keys.
+        """
+        super(CopyOnWriteView, self).__init__()
+
+        self._live_map = live_map
+        self._views_ref = weakref.ref(views)
+        self._lock = lock
+
+        # Values of the keys changed since the view was taken. Keys absent at
+        # the time are preserved as NO_VALUE.
+        self._preserved = {}
+
+        views.add(self)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+    def close(self):
+        """
+        Stops tracking changes to the live map. The view must not be read
+            once closed.
+        """
+        views = self._views_ref()
+        if views is not None:
+            views.discard(self)
+
+        self._preserved.clear()
+
+    def preserve(self, key):
+        """
+        Records the current value of `key` unless it was recorded already.
+            Called by the owner before changing `key`.
+        """
+        if key not in self._preserved:
+            self._preserved[key] = self._read_live(key)
+
+    def _read_live(self, key):
+        """
+        Returns:
+            The value to preserve for `key` in the live map, or NO_VALUE if
+                the map holds no `key`.
+        """
+        raise NotImplementedError()
+
+    def _get(self, key):
+        """
+        Returns:
+            The value `key` held when the view was taken, or NO_VALUE.
+        """
+        result = self._read_live(key)
+
+        # Read after the live map: a key is preserved before it is changed.
+        preserved = self._preserved.get(key, _NOT_PRESERVED)
+        if preserved is not _NOT_PRESERVED:
+            result = preserved
+
+        return result
+
+    def _iter_items(self):
+        """
+        Iterates the keys the live map held when the view was taken, along
+            with their values.
+        """
+        lock = self._lock
+        if lock is not None:
+            lock.acquire_read()
+
+        try:
+            live_map = self._live_map
+            keys = list(live_map.keys())
+            # Removed before the keys were listed, so only preserved.
+            removed_items = [
+                (key, value) for key, value in self._preserved.items()
+                if value is not NO_VALUE and key not in live_map]
+        finally:
+            if lock is not None:
+                lock.release_read()
+
+        for key in keys:
+            value = self._get(key)
+            if value is not NO_VALUE:
+                yield key, value
+
+        for key, value in removed_items:
+            yield key, value
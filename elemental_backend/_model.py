@@ -1,17 +1,20 @@
 """
 Todo
     implement ViewResults (in progress)
-    implement stale state management
-    use stale state to lazily recompute ViewResults
-    use stale state to lazily recompute ResourceReferences
 """
+import contextlib
 import logging
+import threading
 import weakref
 
 from elemental_core import Hook
 from elemental_core.util import process_uuid_value
 
+from ._model_snapshot import ModelSnapshot
 from ._resource_model_base import ResourceModelBase
+from ._resource_store import StoredResourceMap
+from ._rw_lock import ReadWriteLock
+from ._stale_state_graph import StaleStateGraph
 from ._util import iter_subclasses
 from .errors import (
     ResourceNotFoundError,
@@ -25,6 +28,9 @@ from .errors import (
 _LOG = logging.getLogger(__name__)
 
 
+_NO_LOCK = contextlib.nullcontext()
+
+
 class Model(object):
     """
     A `Model` manages `Resource` instances and their relationships.
@@ -33,42 +39,88 @@ class Model(object):
     resource_registration_failed = Hook()
     resource_retrieved = Hook()
     resource_retrieval_failed = Hook()
+    # Fires before any `ResourceModel` releases the `Resource`, while its
+    # index entries are still in place.
+    resource_releasing = Hook()
     resource_released = Hook()
     resource_release_failed = Hook()
 
-    def __init__(self):
+    def __init__(self, fast_retrieve=False, fast_retrieve_hooks=False,
+                 thread_safe=False, store=None):
         """
         Constructor for a `Model` instance.
+
+        Args:
+            fast_retrieve (bool): If True, `retrieve_resource` returns
+                `Resources` whose `ResourceModels` do not implement a
+                retrieve step with a single lookup, skipping the retrieve
+                pipeline. Defaults to False.
+            fast_retrieve_hooks (bool): If True, the `resource_retrieved`
+                Hook fires for `Resources` returned through the fast path.
+                Has no effect unless `fast_retrieve` is True.
+                Defaults to False.
+            thread_safe (bool): If True, the `Model` may be used from many
+                threads at once. Registration and release are serialised
+                through a readers-writer lock, while retrievals share it.
+                Retrievals taking the `fast_retrieve` path do not lock at
+                all, yet never return a `Resource` that is only partially
+                registered or released. Defaults to False.
+            store (ResourceStore): If given, the `Resources` in the store are
+                managed by the `Model` without being loaded up front. Each
+                is materialised and registered with its `ResourceModels` when
+                first looked up, and held weakly until pinned, so it is
+                evicted once nothing else references it. `ResourceIndexes`
+                only hold the stored `Resources` materialised so far. Cannot
+                be combined with `thread_safe`. Defaults to None.
         """
         super(Model, self).__init__()
 
+        if store is not None and thread_safe:
+            msg = 'A ResourceStore cannot back a thread-safe Model.'
+            raise ValueError(msg)
+
+        self._fast_retrieve = fast_retrieve
+        self._fast_retrieve_hooks = fast_retrieve_hooks
+
+        if thread_safe:
+            self._lock = ReadWriteLock()
+            # Guards the lazily populated ResourceModel caches, which
+            # concurrent readers may fill in.
+            self._cache_lock = threading.RLock()
+        else:
+            self._lock = None
+            self._cache_lock = _NO_LOCK
+
+        # Counts of the ids of Resources being registered or released. Only
+        # populated while holding the lock for writing; read without it.
+        self._writing_resource_ids = {}
+
         # The values of self._resources should be the only strong reference
         # Model makes to Resource objects.
-        self._resources = weakref.WeakKeyDictionary()
+        if store is None:
+            self._resources = weakref.WeakKeyDictionary()
+        else:
+            self._resources = StoredResourceMap(
+                store, self._register_materialised_resource)
         self._resource_models = weakref.WeakKeyDictionary()
         self._resource_indexes = weakref.WeakKeyDictionary()
 
         self._map__resource_cls__resources = weakref.WeakKeyDictionary()
-        self._map__resource__stale_dependencies = weakref.WeakKeyDictionary()
 
-        for resource_model_cls in iter_subclasses(ResourceModelBase):
-            resource_cls = resource_model_cls.__resource_cls__
-            resource_indexes = resource_model_cls.__resource_indexes__
+        # Open ModelSnapshots, preserving the Resources changed while open.
+        self._snapshots = weakref.WeakSet()
 
-            resource_model = resource_model_cls(
-                weakref.WeakMethod(self._resources.get),
-                weakref.WeakMethod(self._resource_indexes.get))
-            self.resource_registered += resource_model.resource_registered_handler
-            self.resource_registration_failed += resource_model.resource_registration_failed_handler
-            self.resource_retrieved += resource_model.resource_retrieved_handler
-            self.resource_retrieval_failed += resource_model.resource_retrieval_failed_handler
-            self.resource_released += resource_model.resource_released_handler
-            self.resource_release_failed += resource_model.resource_release_failed_handler
-            self._resource_models[resource_cls] = resource_model
+        # Tracks Resources whose derived data is recomputed lazily, along
+        # with the Resources they depend on.
+        self._stale_state_graph = StaleStateGraph()
 
-            for index in resource_indexes:
-                if index.key_type is resource_cls:
-                    self._resource_indexes[(index.key_type, index.value_type)] = index
+        # Ordered ResourceModels per concrete Resource class. Populated
+        # lazily and cleared whenever new ResourceModels are discovered.
+        self._map__resource_cls__resource_models = weakref.WeakKeyDictionary()
+        self._map__resource_cls__retrieves = weakref.WeakKeyDictionary()
+        self._resource_model_generation = None
+
+        self._discover_resource_models()
 
     def register_resource(self, resource):
         """
@@ -80,9 +132,17 @@ class Model(object):
         Args:
             resource (Resource): A `Resource` instance to be managed by the `Model`.
         """
-        msg = 'Registering resource: "{0}"'
-        msg = msg.format(repr(type(resource)))
-        _LOG.info(msg)
+        if self._lock is None:
+            return self._register_resource(resource)
+
+        resource_ids = (getattr(resource, 'id', None),)
+        return self._write(self._register_resource, resource_ids, resource)
+
+    def _register_resource(self, resource):
+        if _LOG.isEnabledFor(logging.INFO):
+            msg = 'Registering resource: "{0}"'
+            msg = msg.format(repr(type(resource)))
+            _LOG.info(msg)
 
         try:
             resource_id = resource.id
@@ -120,24 +180,16 @@ class Model(object):
                                          resource_type=type(resource),
                                          resource_id=resource.id)
 
+        if self._snapshots:
+            self._preserve_resource(resource.id)
         self._resources[resource.id] = resource
-        map_rc_rs = self._map__resource_cls__resources
-        try:
-            resource_type_resources = map_rc_rs[type(resource)]
-        except KeyError:
-            resource_type_resources = weakref.WeakSet()
-        resource_type_resources.add(resource.id)
+        self._track_resource_cls(resource)
 
         # The registration process iterates through all appropriate
         # ResourceModel instances, calling each model's register method.
         # In the event a register method fails, all previous models are
         # given the opportunity to release the resource.
         resource_models = self._compute_resource_models(resource)
-        resource_models = [
-            resource_models[resource_cls]
-            for resource_cls in sorted(resource_models.keys(),
-                                       key=lambda cls: len(cls.mro()))
-            ]
 
         problem_model = None
         registration_error = None
@@ -206,11 +258,203 @@ class Model(object):
                                              resource_type=type(resource),
                                              resource_id=resource_id)
 
-        msg = 'Registered resource: "{0}" - "{1}"'
-        msg = msg.format(repr(type(resource)), resource.id)
-        _LOG.info(msg)
+        if _LOG.isEnabledFor(logging.INFO):
+            msg = 'Registered resource: "{0}" - "{1}"'
+            msg = msg.format(repr(type(resource)), resource.id)
+            _LOG.info(msg)
         return resource
 
+    def register_resources(self, resources):
+        """
+        Registers multiple elemental Resource instances in a single pass.
+
+        All ids are validated before any `ResourceModel` is invoked. Resources
+        are then grouped by class and each `ResourceModel` registers its
+        group in turn. The `resource_registered` Hook, and with it the
+        resolution of forward references, fires only once every `Resource`
+        has been registered with every `ResourceModel`.
+
+        Registration is all-or-nothing: if any `ResourceModel` fails, every
+        registration made by this call is released in reverse order.
+
+        Args:
+            resources (Iterable[Resource]): `Resource` instances to be managed
+                by the `Model`.
+
+        Returns:
+            List of the registered `Resource` instances, in the order given.
+        """
+        resources = list(resources)
+
+        if self._lock is None:
+            return self._register_resources(resources)
+
+        resource_ids = [getattr(resource, 'id', None) for resource in resources]
+        return self._write(self._register_resources, resource_ids, resources)
+
+    def _register_resources(self, resources):
+
+        if _LOG.isEnabledFor(logging.INFO):
+            msg = 'Registering {0} resources'
+            msg = msg.format(len(resources))
+            _LOG.info(msg)
+
+        batch_resource_ids = set()
+        for resource in resources:
+            try:
+                resource_id = resource.id
+            except AttributeError:
+                msg = (
+                    'Failed to register resources: '
+                    'Object "{0}" has no attribute "id".'
+                )
+                msg = msg.format(repr(resource))
+
+                _LOG.error(msg)
+                raise ResourceNotRegisteredError(msg,
+                                                 resource_type=type(resource))
+
+            if not resource_id:
+                msg = (
+                    'Failed to register resources: '
+                    'Object "{0}" has invalid id - "{1}"'
+                )
+                msg = msg.format(repr(resource), resource_id)
+
+                _LOG.error(msg)
+                raise ResourceNotRegisteredError(msg,
+                                                 resource_type=type(resource),
+                                                 resource_id=resource_id)
+            elif (resource_id in self._resources or
+                    resource_id in batch_resource_ids):
+                msg = (
+                    'Failed to register resources with id "{0}": '
+                    'Resource already exists with id "{0}"'
+                )
+                msg = msg.format(resource_id)
+
+                _LOG.error(msg)
+                raise ResourceCollisionError(msg,
+                                             resource_type=type(resource),
+                                             resource_id=resource_id)
+
+            batch_resource_ids.add(resource_id)
+
+        map__resource_cls__batch = {}
+        for resource in resources:
+            try:
+                batch = map__resource_cls__batch[type(resource)]
+            except KeyError:
+                batch = []
+                map__resource_cls__batch[type(resource)] = batch
+            batch.append(resource)
+
+        for resource in resources:
+            if self._snapshots:
+                self._preserve_resource(resource.id)
+            self._resources[resource.id] = resource
+            self._track_resource_cls(resource)
+
+        problem_model = None
+        registration_error = None
+        registrations = []
+
+        for batch in map__resource_cls__batch.values():
+            resource_models = self._compute_resource_models(batch[0])
+            for resource_model in resource_models:
+                for resource in batch:
+                    try:
+                        resource_model.register(resource)
+                    except Exception as e:
+                        registration_error = e
+                        problem_model = resource_model
+                        break
+                    registrations.append((resource_model, resource))
+
+                if registration_error:
+                    break
+
+            if registration_error:
+                break
+
+        release_errors = []
+        notified_resources = []
+
+        if not registration_error:
+            for resource in resources:
+                notified_resources.append(resource)
+                try:
+                    self.resource_registered(self, resource)
+                except Exception as e:
+                    registration_error = e
+                    break
+
+            if registration_error:
+                for resource in notified_resources:
+                    try:
+                        self.resource_registration_failed(self, resource)
+                    except Exception as e:
+                        release_errors.append(str(e))
+
+        if registration_error:
+            for resource_model, resource in reversed(registrations):
+                try:
+                    resource_model.release(resource)
+                except Exception as e:
+                    msg = '"{0}" release failed - "{1}"'
+                    msg = msg.format(type(resource_model).__name__, e)
+                    release_errors.append(msg)
+
+            for resource in resources:
+                if self._snapshots:
+                    self._preserve_resource(resource.id)
+                self._resources.pop(resource.id, None)
+                self._untrack_resource_cls(resource)
+
+            if problem_model:
+                problem_model_name = type(problem_model).__name__
+            else:
+                problem_model_name = type(self).__name__
+
+            if release_errors:
+                msg = (
+                    'Failed to register resources: '
+                    'ResourceModel "{0}" failed - {1}: "{2}"\n'
+                    'Model Integrity Compromised: '
+                    'Registration rollback failed\n\t{3}'
+                )
+                msg = msg.format(problem_model_name,
+                                 type(registration_error).__name__,
+                                 str(registration_error),
+                                 '\n\t'.join(release_errors))
+            else:
+                msg = (
+                    'Failed to register resources: '
+                    'ResourceModel "{0}" failed - "{1}"\n'
+                    'Model integrity recovered: '
+                    'Registration rollback succeeded'
+                )
+                msg = msg.format(problem_model_name,
+                                 str(registration_error))
+
+            _LOG.error(msg)
+            raise ResourceNotRegisteredError(msg,
+                                             inner_error=registration_error)
+
+        if _LOG.isEnabledFor(logging.INFO):
+            msg = 'Registered {0} resources'
+            msg = msg.format(len(resources))
+            _LOG.info(msg)
+        return resources
+
+    def __contains__(self, resource_id):
+        try:
+            resource_id = self._process_requested_resource_id(resource_id)
+        except ValueError:
+            return False
+
+        return resource_id in self._resources
+
     def retrieve_resource(self, resource_id):
         """
         Retrieves a `Resource` instance managed by the `Model`.
@@ -221,8 +465,66 @@ class Model(object):
         Returns:
             A `Resource` instance.
         """
-        msg = 'Retrieving resource: "{0}"'.format(resource_id)
-        _LOG.info(msg)
+        if self._fast_retrieve:
+            result = self._fast_retrieve_resource(resource_id)
+            if result is not None:
+                return result
+
+        lock = self._lock
+        if lock is None:
+            return self._retrieve_resource(resource_id)
+
+        lock.acquire_read()
+        try:
+            if not self._retrieve_requires_write(resource_id):
+                return self._retrieve_resource(resource_id)
+        finally:
+            lock.release_read()
+
+        # Retrieve steps may bring derived state up to date, so they are
+        # serialised with registration and release.
+        return self._write(self._retrieve_resource, (), resource_id)
+
+    def _fast_retrieve_resource(self, resource_id):
+        """
+        Retrieves a `Resource` with a single lookup, if possible.
+
+        Returns:
+            The `Resource` instance, or None if the regular retrieve path must
+                be taken.
+        """
+        try:
+            result = self._resources[resource_id]
+        except (KeyError, TypeError):
+            # Unknown or unprocessed ids take the regular path, which
+            # owns id processing and error reporting.
+            return None
+
+        # Checked after the lookup: an id is marked before a writer adds or
+        # removes its Resource, and unmarked only once it is done.
+        if resource_id in self._writing_resource_ids:
+            return None
+
+        if self._compute_resource_retrieves(result):
+            return None
+
+        if self._fast_retrieve_hooks:
+            self.resource_retrieved(self, result)
+        return result
+
+    def _retrieve_requires_write(self, resource_id):
+        try:
+            resource_id = self._process_requested_resource_id(resource_id)
+            resource = self._resources[resource_id]
+        except (KeyError, TypeError, ValueError):
+            return False
+
+        return self._compute_resource_retrieves(resource)
+
+    def _retrieve_resource(self, resource_id):
+        if _LOG.isEnabledFor(logging.INFO):
+            msg = 'Retrieving resource: "{0}"'.format(resource_id)
+            _LOG.info(msg)
 
         try:
             resource_id = self._process_requested_resource_id(resource_id)
@@ -250,17 +552,10 @@ class Model(object):
                                         resource_id=resource_id)
 
         resource_models = self._compute_resource_models(result)
-        resource_models = [
-            resource_models[resource_cls]
-            for resource_cls in sorted(resource_models.keys(),
-                                       key=lambda cls: len(cls.mro()))
-        ]
         problem_model = None
         retrieval_errors = []
 
-        while not retrieval_errors and resource_models:
-            resource_model = resource_models.pop(0)
-
+        for resource_model in resource_models:
             try:
                 result = resource_model.retrieve(resource_id, resource=result)
             except ResourceNotFoundError:
@@ -268,6 +563,7 @@ class Model(object):
             except Exception as e:
                 retrieval_errors.append(e)
                 problem_model = resource_model
+                break
 
         if not retrieval_errors:
             try:
@@ -292,9 +588,10 @@ class Model(object):
                                             resource_type=type(result),
                                             resource_id=resource_id)
 
-        msg = 'Retrieved resource: "{0}" - "{1}"'
-        msg = msg.format(repr(type(result)), result.id)
-        _LOG.info(msg)
+        if _LOG.isEnabledFor(logging.INFO):
+            msg = 'Retrieved resource: "{0}" - "{1}"'
+            msg = msg.format(repr(type(result)), result.id)
+            _LOG.info(msg)
         return result
 
     def release_resource(self, resource_id):
@@ -312,8 +609,20 @@ class Model(object):
         Returns:
             The released `Resource` instance.
         """
-        msg = 'Releasing resource: "{0}"'.format(resource_id)
-        _LOG.info(msg)
+        if self._lock is None:
+            return self._release_resource(resource_id)
+
+        try:
+            resource_ids = (self._process_requested_resource_id(resource_id),)
+        except ValueError:
+            # Reported by the release itself.
+            resource_ids = ()
+        return self._write(self._release_resource, resource_ids, resource_id)
+
+    def _release_resource(self, resource_id):
+        if _LOG.isEnabledFor(logging.INFO):
+            msg = 'Releasing resource: "{0}"'.format(resource_id)
+            _LOG.info(msg)
 
         try:
             resource_id = self._process_requested_resource_id(resource_id)
@@ -327,9 +636,11 @@ class Model(object):
             _LOG.error(msg)
             raise ValueError(msg)
 
+        if self._snapshots:
+            self._preserve_resource(resource_id)
+
         try:
-            result = self._resources.pop(resource_id)
-            self._map__resource_cls__resources[type(result)].discard(result)
+            result = self._resources[resource_id]
         except KeyError:
             msg = (
                 'Failed to release resource:'
@@ -342,16 +653,16 @@ class Model(object):
                                         resource_type=None,
                                         resource_id=resource_id)
 
+        self.resource_releasing(self, result)
+
+        self._resources.pop(resource_id)
+        self._untrack_resource_cls(result)
+
         # The release process iterates through all appropriate
         # ResourceModel instances, calling each model's release method.
         # In the event a release method fails, all previous models are
         # given the opportunity to re-register the resource.
         resource_models = self._compute_resource_models(result)
-        resource_models = [
-            resource_models[resource_cls]
-            for resource_cls in sorted(resource_models.keys(),
-                                       key=lambda cls: len(cls.mro()))
-        ]
 
         problem_model = None
         release_error = None
@@ -418,11 +729,108 @@ class Model(object):
             raise ResourceNotReleasedError(msg, resource_type=type(result),
                                            resource_id=resource_id)
 
-        msg = 'Released resource: "{0}" - "{1}"'
-        msg = msg.format(repr(type(result)), result.id)
-        _LOG.info(msg)
+        self._stale_state_graph.pop_resource(result.id)
+
+        if _LOG.isEnabledFor(logging.INFO):
+            msg = 'Released resource: "{0}" - "{1}"'
+            msg = msg.format(repr(type(result)), result.id)
+            _LOG.info(msg)
         return result
 
+    def pin_resource(self, resource_id):
+        """
+        Holds a `Resource` materialised from the `Model`'s `ResourceStore`
+            strongly, as if it had been registered.
+
+        Changes made to a stored `Resource` are lost once it is evicted;
+        pinning it keeps it, and its changes, until it is released.
+
+        Args:
+            resource_id (str or uuid): The ID of the `Resource` to pin.
+
+        Returns:
+            bool: True if a materialised `Resource` was pinned. False if the
+                `Resource` is not materialised from a store or already held
+                strongly.
+        """
+        pin = getattr(self._resources, 'pin', None)
+        if pin is None:
+            return False
+
+        try:
+            resource_id = self._process_requested_resource_id(resource_id)
+        except ValueError:
+            return False
+
+        return pin(resource_id)
+
+    def snapshot(self):
+        """
+        Takes a read-only, point-in-time view of the `Model`.
+
+        The snapshot sees the `Resources` registered, and the
+        `ResourceIndexes` as they were, when it was taken, however the
+        `Model` changes afterwards. It copies nothing up front; entries the
+        `Model` changes while the snapshot is open are copied into it first.
+
+        Returns:
+            ModelSnapshot
+        """
+        lock = self._lock
+        if lock is None:
+            return ModelSnapshot(self._resources, self._snapshots,
+                                 self._resource_indexes)
+
+        # Held so that no registration or release is half done.
+        lock.acquire_read()
+        try:
+            return ModelSnapshot(self._resources, self._snapshots,
+                                 self._resource_indexes, lock=lock)
+        finally:
+            lock.release_read()
+
+    def _register_materialised_resource(self, resource):
+        """
+        Registers a `Resource` materialised from the `ResourceStore` with its
+            `ResourceModels`.
+
+        The `resource_registered` Hook does not fire: the `Resource` was
+        registered, as far as observers are concerned, when the `Model` was
+        created.
+        """
+        self._track_resource_cls(resource)
+
+        for resource_model in self._compute_resource_models(resource):
+            resource_model.register(resource)
+
+    def _preserve_resource(self, resource_id):
+        for snapshot in self._snapshots:
+            snapshot.preserve(resource_id)
+
+    def _write(self, func, resource_ids, *args):
+        """
+        Calls `func` while holding the lock for writing, marking
+            `resource_ids` as being written for lock-free readers.
+        """
+        writing = self._writing_resource_ids
+
+        self._lock.acquire_write()
+        try:
+            for resource_id in resource_ids:
+                writing[resource_id] = writing.get(resource_id, 0) + 1
+
+            try:
+                return func(*args)
+            finally:
+                for resource_id in resource_ids:
+                    count = writing[resource_id] - 1
+                    if count:
+                        writing[resource_id] = count
+                    else:
+                        del writing[resource_id]
+        finally:
+            self._lock.release_write()
+
     @staticmethod
     def _process_requested_resource_id(resource_id):
         result = process_uuid_value(resource_id)
@@ -432,11 +840,130 @@ class Model(object):
 
         return result
 
+    def _track_resource_cls(self, resource):
+        map_rc_rs = self._map__resource_cls__resources
+        try:
+            resource_cls_resources = map_rc_rs[type(resource)]
+        except KeyError:
+            resource_cls_resources = weakref.WeakSet()
+            map_rc_rs[type(resource)] = resource_cls_resources
+        resource_cls_resources.add(resource.id)
+
+    def _untrack_resource_cls(self, resource):
+        try:
+            self._map__resource_cls__resources[type(resource)].discard(
+                resource.id)
+        except KeyError:
+            pass
+
+    def _discover_resource_models(self):
+        """
+        Instantiates any `ResourceModelBase` subclasses not yet known to the
+            `Model`.
+
+        Dispatch plans computed before the discovery are discarded, as a new
+        `ResourceModel` may apply to classes that already have a plan.
+        """
+        generation = ResourceModelBase.__resource_model_generation__
+        if generation == self._resource_model_generation:
+            return
+
+        with self._cache_lock:
+            if generation != self._resource_model_generation:
+                self._discover_new_resource_models(generation)
+
+    def _discover_new_resource_models(self, generation):
+        known_model_classes = set(
+            type(resource_model)
+            for resource_model in self._resource_models.values())
+
+        for resource_model_cls in iter_subclasses(ResourceModelBase):
+            if resource_model_cls in known_model_classes:
+                continue
+
+            resource_cls = resource_model_cls.__resource_cls__
+            resource_indexes = resource_model_cls.__resource_indexes__
+
+            resource_model = resource_model_cls(
+                weakref.ref(self._resources),
+                weakref.ref(self._resource_indexes),
+                weakref.ref(self._stale_state_graph))
+            self.resource_registered += resource_model.resource_registered_handler
+            self.resource_registration_failed += resource_model.resource_registration_failed_handler
+            self.resource_retrieved += resource_model.resource_retrieved_handler
+            self.resource_retrieval_failed += resource_model.resource_retrieval_failed_handler
+            self.resource_releasing += resource_model.resource_releasing_handler
+            self.resource_released += resource_model.resource_released_handler
+            self.resource_release_failed += resource_model.resource_release_failed_handler
+            self._resource_models[resource_cls] = resource_model
+
+            for index in resource_indexes:
+                if index.key_type is resource_cls:
+                    self._resource_indexes[(index.key_type, index.value_type)] = index
+
+        self._map__resource_cls__resource_models.clear()
+        self._map__resource_cls__retrieves.clear()
+        self._resource_model_generation = generation
+
     def _compute_resource_models(self, resource):
-        result = {}
+        """
+        Resolves the `ResourceModel` instances that manage `resource`.
+
+        The result is ordered from the most general to the most specific
+        `Resource` class and is cached per concrete class, so repeated calls
+        cost a single lookup.
 
-        for resource_cls, resource_model in self._resource_models.iteritems():
-            if isinstance(resource, resource_cls):
-                result[resource_cls] = resource_model
+        Returns:
+            Tuple of `ResourceModel` instances.
+        """
+        self._discover_resource_models()
+
+        resource_cls = type(resource)
+        map_rc_rms = self._map__resource_cls__resource_models
+        try:
+            return map_rc_rms[resource_cls]
+        except KeyError:
+            pass
+
+        with self._cache_lock:
+            return self._compute_new_resource_models(resource)
+
+    def _compute_new_resource_models(self, resource):
+        resource_cls = type(resource)
+        map_rc_rms = self._map__resource_cls__resource_models
+
+        resource_models = [
+            (model_resource_cls, resource_model)
+            for model_resource_cls, resource_model in self._resource_models.items()
+            if isinstance(resource, model_resource_cls)
+        ]
+        resource_models.sort(key=lambda item: len(item[0].mro()))
+
+        result = tuple(resource_model for _, resource_model in resource_models)
+        map_rc_rms[resource_cls] = result
+
+        return result
+
+    def _compute_resource_retrieves(self, resource):
+        """
+        Determines whether any `ResourceModel` managing `resource` implements
+            a retrieve step.
+
+        Returns:
+            bool
+        """
+        self._discover_resource_models()
+
+        resource_cls = type(resource)
+        map_rc_r = self._map__resource_cls__retrieves
+        try:
+            return map_rc_r[resource_cls]
+        except KeyError:
+            pass
+
+        resource_models = self._compute_resource_models(resource)
+        result = any(type(resource_model).__resource_model_retrieves__
+                     for resource_model in resource_models)
+        map_rc_r[resource_cls] = result
 
         return result
@@ -0,0 +1,121 @@
+import logging
+
+from elemental_core import NO_VALUE
+from elemental_core.util import process_uuid_value
+
+from ._copy_on_write import CopyOnWriteView
+from .errors import ResourceNotFoundError
+
+
+_LOG = logging.getLogger(__name__)
+
+
+class ModelSnapshot(CopyOnWriteView):
+    """
+    A read-only, point-in-time view of the `Resources` managed by a `Model`
+        and of its `ResourceIndexes`.
+
+    Taking a snapshot copies nothing. While it is open, the `Model` copies
+    the entries it changes into the snapshot before changing them, so the
+    snapshot costs memory in proportion to the writes made during its
+    lifetime. Readers never block writers, and writers never block readers.
+
+    A snapshot tracks which `Resources` are registered and how they are
+    indexed. `Resources` are not copied: changes made to a `Resource`
+    instance in place, such as by a `PUT` `Transaction`, are visible through
+    the snapshot. `Resources` are returned as registered, without running
+    `ResourceModel` retrieve steps.
+
+    Snapshots should be closed once read, either through `close` or by using
+    them as context managers; otherwise they are closed when collected.
+    """
+
+    def __init__(self, resources, snapshots, resource_indexes, lock=None):
+        """
+        Args:
+            resources (Mapping): The `Model`'s map of ids to `Resources`.
+            snapshots (weakref.WeakSet): The `Model`'s open snapshots.
+            resource_indexes (Mapping): The `Model`'s map of
+                (key type, value type) to `ResourceIndexes`.
+            lock (Optional[ReadWriteLock]): The `Model`'s lock, if any.
+        """
+        super(ModelSnapshot, self).__init__(resources, snapshots, lock=lock)
+
+        self._index_snapshots = dict(
+            (index_key, resource_index.snapshot(lock=lock))
+            for index_key, resource_index in resource_indexes.items())
+
+    def close(self):
+        super(ModelSnapshot, self).close()
+
+        for index_snapshot in self._index_snapshots.values():
+            index_snapshot.close()
+
+    def __contains__(self, resource_id):
+        try:
+            resource_id = process_uuid_value(resource_id)
+        except ValueError:
+            return False
+
+        return self._get(resource_id) is not NO_VALUE
+
+    def retrieve_resource(self, resource_id):
+        """
+        Retrieves a `Resource` registered when the snapshot was taken.
+
+        Args:
+            resource_id (str or uuid): The ID of the `Resource` to retrieve.
+
+        Returns:
+            A `Resource` instance.
+        """
+        try:
+            processed_id = process_uuid_value(resource_id)
+        except ValueError:
+            processed_id = None
+
+        if not processed_id:
+            msg = (
+                'Failed to retrieve resource with id "{0}" from snapshot: '
+                'Invalid UUID value.'
+            )
+            msg = msg.format(resource_id)
+
+            _LOG.error(msg)
+            raise ValueError(msg)
+
+        result = self._get(processed_id)
+        if result is NO_VALUE:
+            msg = (
+                'Failed to retrieve resource from snapshot: '
+                'No resource found matching id "{0}"'
+            )
+            msg = msg.format(processed_id)
+
+            _LOG.error(msg)
+            raise ResourceNotFoundError(msg,
+                                        resource_type=None,
+                                        resource_id=processed_id)
+
+        return result
+
+    def iter_resources(self):
+        """
+        Iterates the `Resources` registered when the snapshot was taken.
+        """
+        for _, resource in self._iter_items():
+            yield resource
+
+    def get_index(self, key_type, value_type):
+        """
+        Returns:
+            The `ResourceIndexSnapshot` of the `ResourceIndex` mapping
+                `key_type` to `value_type`, or None if there is none.
+        """
+        return self._index_snapshots.get((key_type, value_type))
+
+    def _read_live(self, key):
+        try:
+            return self._live_map[key]
+        except (KeyError, TypeError):
+            return NO_VALUE
@@ -1,8 +1,60 @@
 import weakref
-from collections import deque
+
+from elemental_core import NO_VALUE
+
+from ._copy_on_write import CopyOnWriteView
+
+
+class _IndexedValues(object):
+    """
+    Insertion-ordered set used to hold the values of a single index key.
+
+    Backed by a dict, so adding, removing and membership tests are O(1)
+    while iteration preserves insertion order. The oldest value can be
+    evicted in O(1) to honour a `ResourceIndex`'s capacity.
+    """
+    __slots__ = ('_values',)
+
+    def __init__(self):
+        self._values = {}
+
+    def __contains__(self, value):
+        return value in self._values
+
+    def __iter__(self):
+        return iter(self._values)
+
+    def __len__(self):
+        return len(self._values)
+
+    def add(self, value):
+        self._values[value] = None
+
+    def discard(self, value):
+        try:
+            del self._values[value]
+        except KeyError:
+            return False
+        return True
+
+    def pop_oldest(self):
+        value = next(iter(self._values))
+        del self._values[value]
+        return value
 
 
 class ResourceIndex(object):
+    """
+    Maps index keys to insertion-ordered collections of indexed values.
+
+    Keys and values are typically `Resource` instances or their ids; when a
+    `Resource` is given, its id is used.
+
+    A bidirectional index also maintains a mapping from each value to the
+    keys holding it. Removing a value from every key, or asking which keys
+    hold a value, then costs O(number of keys holding the value) instead of
+    O(number of keys), at the price of a second mapping in memory.
+    """
     @property
     def key_type(self):
         return self._key_type
@@ -11,23 +63,41 @@ class ResourceIndex(object):
     def value_type(self):
         return self._value_type
 
+    @property
+    def bidirectional(self):
+        return self._map__indexed_value__index_keys is not None
+
     def __init__(self, index_key_type, indexed_value_type,
-                 indexed_capacity=None):
+                 indexed_capacity=None, bidirectional=False):
         super(ResourceIndex, self).__init__()
 
-        try:
-            self._index_key_type = weakref.ref(index_key_type)
-        except TypeError:
-            self._index_key_type = index_key_type
-
-        try:
-            self._value_type = weakref.ref(indexed_value_type)
-        except TypeError:
-            self._value_type = indexed_value_type
+        self._key_type = index_key_type
+        self._value_type = indexed_value_type
 
-        self._indexed_capacity = int(indexed_capacity)
+        self._indexed_capacity = int(indexed_capacity or 0)
         self._eternal_keys = weakref.WeakSet()
-        self._map__index_key__indexed_data = weakref.WeakKeyDictionary()
+        self._map__index_key__indexed_values = weakref.WeakKeyDictionary()
+        if bidirectional:
+            self._map__indexed_value__index_keys = weakref.WeakKeyDictionary()
+        else:
+            self._map__indexed_value__index_keys = None
+
+        # Open ResourceIndexSnapshots, preserving the keys changed while open.
+        self._snapshots = weakref.WeakSet()
+
+    def snapshot(self, lock=None):
+        """
+        Takes a read-only, point-in-time view of the index's keys and their
+            indexed values.
+
+        Args:
+            lock (Optional[ReadWriteLock]): Lock held for writing while the
+                index is changed, if it is changed from many threads.
+
+        Returns:
+            ResourceIndexSnapshot
+        """
+        return ResourceIndexSnapshot(self, lock=lock)
 
     def push_index(self, key):
         try:
@@ -35,17 +105,18 @@ class ResourceIndex(object):
         except AttributeError:
             key = key
 
-        if key in self._map__idx_resource_id__resource_ids:
+        if key in self._map__index_key__indexed_values:
             if key in self._eternal_keys:
                 msg = 'Index already has eternal key'
                 raise ValueError(msg)
-            self._set_eternal_key(key)
+            self._set_eternal_key(key, key)
         else:
-            value_collection = deque()
-            self._map__idx_resource_id__resource_ids[key] = value_collection
+            if self._snapshots:
+                self._preserve_key(key)
+            self._map__index_key__indexed_values[key] = _IndexedValues()
 
     def iter_index_keys(self):
-        for key in self._map__index_key__indexed_data:
+        for key in self._map__index_key__indexed_values:
             yield key
 
     def pop_index(self, key):
@@ -54,14 +125,18 @@ class ResourceIndex(object):
         except AttributeError:
             key = key
 
+        if self._snapshots:
+            self._preserve_key(key)
+
         try:
-            result = self._map__idx_resource_id__resource_ids.pop(key)
+            result = self._map__index_key__indexed_values.pop(key)
         except KeyError:
-            result = NO_VALUE
-        else:
-            result = tuple(result)
+            return NO_VALUE
 
-        return result
+        for value in result:
+            self._discard_value_key(value, key)
+
+        return tuple(result)
 
     def push_indexed_value(self, key, value):
         try:
@@ -74,15 +149,21 @@ class ResourceIndex(object):
         except AttributeError:
             value = value
 
+        if self._snapshots:
+            self._preserve_key(key)
+
         try:
-            value_collection = self._map__idx_resource_id__resource_ids[key]
+            value_collection = self._map__index_key__indexed_values[key]
         except KeyError:
-            value_collection = deque()
-            self._map__idx_resource_id__resource_ids[key] = value_collection
+            value_collection = _IndexedValues()
+            self._map__index_key__indexed_values[key] = value_collection
+
+        value_collection.add(value)
+        self._add_value_key(value, key)
 
-        value_collection.append(value)
         while 0 < self._indexed_capacity < len(value_collection):
-            value_collection.popleft()
+            evicted_value = value_collection.pop_oldest()
+            self._discard_value_key(evicted_value, key)
 
     def iter_indexed_values(self, key):
         try:
@@ -91,16 +172,43 @@ class ResourceIndex(object):
             key = key
 
         try:
-            collection = self._map__idx_resource_id__resource_ids[key]
+            collection = self._map__index_key__indexed_values[key]
         except KeyError:
-            raise StopIteration()
+            return
 
-        for item in collection:
+        for item in tuple(collection):
             yield item
 
+    def get_indexed_values(self, key):
+        try:
+            key = key.id
+        except AttributeError:
+            key = key
+
+        try:
+            return tuple(self._map__index_key__indexed_values[key])
+        except KeyError:
+            return tuple()
+
+    def has_indexed_value(self, key, value):
+        try:
+            key = key.id
+        except AttributeError:
+            key = key
+
+        try:
+            value = value.id
+        except AttributeError:
+            value = value
+
+        try:
+            return value in self._map__index_key__indexed_values[key]
+        except KeyError:
+            return False
+
     def move_indexed_value(self, value, source_key, target_key):
-        self.remove(source_key, value)
-        self.add(target_key, value)
+        self.pop_indexed_value(source_key, value)
+        self.push_indexed_value(target_key, value)
 
     def pop_indexed_value(self, key, value):
         try:
@@ -109,16 +217,105 @@ class ResourceIndex(object):
             key = key
 
         try:
-            value_collection = self._map__idx_resource_id__resource_ids[key]
-        except KeyError:
-            return NO_VALUE
+            value = value.id
+        except AttributeError:
+            value = value
 
         try:
-            value_collection.remove(value)
+            value_collection = self._map__index_key__indexed_values[key]
         except KeyError:
+            return NO_VALUE
+
+        if self._snapshots and value in value_collection:
+            self._preserve_key(key)
+
+        if not value_collection.discard(value):
             return None
+
+        self._discard_value_key(value, key)
+        return value
+
+    def iter_value_keys(self, value):
+        """
+        Iterates the keys `value` is indexed under.
+
+        Bidirectional indexes answer from the reverse mapping; others scan
+        every key.
+        """
+        try:
+            value = value.id
+        except AttributeError:
+            value = value
+
+        map_iv_iks = self._map__indexed_value__index_keys
+        if map_iv_iks is None:
+            keys = [key for key, values
+                    in self._map__index_key__indexed_values.items()
+                    if value in values]
         else:
-            return value
+            try:
+                keys = tuple(map_iv_iks[value])
+            except KeyError:
+                return
+
+        for key in keys:
+            yield key
+
+    def pop_value(self, value):
+        """
+        Removes `value` from every key it is indexed under.
+
+        Returns:
+            Tuple of the keys `value` was removed from.
+        """
+        try:
+            value = value.id
+        except AttributeError:
+            value = value
+
+        keys = tuple(self.iter_value_keys(value))
+
+        map_ik_ivs = self._map__index_key__indexed_values
+        for key in keys:
+            if self._snapshots:
+                self._preserve_key(key)
+
+            try:
+                map_ik_ivs[key].discard(value)
+            except KeyError:
+                pass
+
+        map_iv_iks = self._map__indexed_value__index_keys
+        if map_iv_iks is not None:
+            map_iv_iks.pop(value, None)
+
+        return keys
+
+    def _add_value_key(self, value, key):
+        map_iv_iks = self._map__indexed_value__index_keys
+        if map_iv_iks is None:
+            return
+
+        try:
+            keys = map_iv_iks[value]
+        except KeyError:
+            keys = _IndexedValues()
+            map_iv_iks[value] = keys
+        keys.add(key)
+
+    def _discard_value_key(self, value, key):
+        map_iv_iks = self._map__indexed_value__index_keys
+        if map_iv_iks is None:
+            return
+
+        try:
+            keys = map_iv_iks[value]
+        except KeyError:
+            return
+
+        keys.discard(key)
+        if not keys:
+            del map_iv_iks[value]
 
     def _set_eternal_key(self, current_key, eternal_key):
         """
@@ -131,10 +328,71 @@ class ResourceIndex(object):
         function allows the dependency to insert its own object as the key.
         This is especially important when using a WeakKeyDictionary as the map.
         """
+        if self._snapshots:
+            self._preserve_key(current_key)
+
+        map_ik_ivs = self._map__index_key__indexed_values
         try:
-            value_collection = self._map__idx_resource_id__resource_ids.pop(current_key)
+            value_collection = map_ik_ivs.pop(current_key)
         except KeyError:
-            value_collection = deque
+            value_collection = _IndexedValues()
 
-        self._map__idx_resource_id__resource_ids[eternal_key] = value_collection
+        map_ik_ivs[eternal_key] = value_collection
         self._eternal_keys.add(eternal_key)
+
+    def _preserve_key(self, key):
+        for snapshot in self._snapshots:
+            snapshot.preserve(key)
+
+
+class ResourceIndexSnapshot(CopyOnWriteView):
+    """
+    A read-only, point-in-time view of a `ResourceIndex`.
+
+    Changes made to the index after the snapshot is taken are not visible
+    through it. Only the keys changed while the snapshot is open are copied.
+    """
+    @property
+    def key_type(self):
+        return self._index.key_type
+
+    @property
+    def value_type(self):
+        return self._index.value_type
+
+    def __init__(self, index, lock=None):
+        super(ResourceIndexSnapshot, self).__init__(
+            index._map__index_key__indexed_values, index._snapshots,
+            lock=lock)
+
+        self._index = index
+
+    def iter_index_keys(self):
+        for key, _ in self._iter_items():
+            yield key
+
+    def get_indexed_values(self, key):
+        try:
+            key = key.id
+        except AttributeError:
+            key = key
+
+        result = self._get(key)
+        if result is NO_VALUE:
+            return tuple()
+
+        return result
+
+    def has_indexed_value(self, key, value):
+        try:
+            value = value.id
+        except AttributeError:
+            value = value
+
+        return value in self.get_indexed_values(key)
+
+    def _read_live(self, key):
+        try:
+            return tuple(self._live_map[key])
+        except KeyError:
+            return NO_VALUE
@@ -1,7 +1,6 @@
 from weakref import (
     ref as WeakRef,
     WeakKeyDictionary,
-    WeakMethod,
     WeakSet
 )
 from functools import partial
@@ -15,35 +14,66 @@ class ResourceModelBase(object):
     __resource_cls__ = None
     __resource_indexes__ = None
 
+    # Incremented whenever a new subclass is defined. A `Model` compares this
+    # against the value it last saw to know when its dispatch plans are stale.
+    __resource_model_generation__ = 0
+
+    # True when the class (or an ancestor) overrides `retrieve`. Resources
+    # whose ResourceModels all leave this False can be retrieved without
+    # running the retrieve pipeline.
+    __resource_model_retrieves__ = False
+
+    def __init_subclass__(cls, **kwargs):
+        super(ResourceModelBase, cls).__init_subclass__(**kwargs)
+
+        cls.__resource_model_retrieves__ = (
+            cls.retrieve is not ResourceModelBase.retrieve)
+        ResourceModelBase.__resource_model_generation__ += 1
+
     @property
     def resource_registered_handler(self):
-        return WeakMethod(self._handle_resource_registered)
+        # Hooks hold handlers weakly, so the bound method is returned as is.
+        return self._handle_resource_registered
 
     @property
     def resource_registration_failed_handler(self):
-        return WeakMethod(self._handle_resource_registration_failed)
+        return self._handle_resource_registration_failed
 
     @property
     def resource_retrieved_handler(self):
-        return WeakMethod(self._handle_resource_retrieved)
+        return self._handle_resource_retrieved
 
     @property
     def resource_retrieval_failed_handler(self):
-        return WeakMethod(self._handle_resource_retrieval_failed)
+        return self._handle_resource_retrieval_failed
+
+    @property
+    def resource_releasing_handler(self):
+        return self._handle_resource_releasing
 
     @property
     def resource_released_handler(self):
-        return WeakMethod(self._handle_resource_released)
+        return self._handle_resource_released
 
     @property
     def resource_release_failed_handler(self):
-        return WeakMethod(self._handle_resource_release_failed)
+        return self._handle_resource_release_failed
 
-    def __init__(self, resource_getter, index_getter):
+    def __init__(self, resources_ref, resource_indexes_ref, stale_state_ref):
+        """
+        Args:
+            resources_ref (weakref.ref): Weak reference to the owning
+                `Model`'s map of resource ids to `Resources`.
+            resource_indexes_ref (weakref.ref): Weak reference to the owning
+                `Model`'s map of (key type, value type) to `ResourceIndexes`.
+            stale_state_ref (weakref.ref): Weak reference to the owning
+                `Model`'s `StaleStateGraph`.
+        """
         super(ResourceModelBase, self).__init__()
 
-        self._get_resource = resource_getter
-        self._get_index = index_getter
+        self._resources_ref = resources_ref
+        self._resource_indexes_ref = resource_indexes_ref
+        self._stale_state_ref = stale_state_ref
         self._map__hook__handler = WeakKeyDictionary()
         self._map__hook__ref = WeakKeyDictionary()
         self._unresolved_reference_maps = WeakKeyDictionary()
@@ -68,15 +98,37 @@ class ResourceModelBase(object):
             self._resolved_reference_maps[fwd_ref] = WeakKeyDictionary()
             fwd_ref.reference_resolver = self._get_resource
 
+    def _get_resource(self, resource_id):
+        resources = self._resources_ref()
+        if resources is None:
+            return None
+
+        try:
+            return resources.get(resource_id)
+        except TypeError:
+            # Raised by the weak map for ids that cannot be weakly referenced,
+            # such as None.
+            return None
+
+    def _get_index(self, key_type, value_type):
+        resource_indexes = self._resource_indexes_ref()
+        if resource_indexes is None:
+            return None
+
+        return resource_indexes.get((key_type, value_type))
+
+    def _get_stale_state(self):
+        return self._stale_state_ref()
+
     def register(self, resource):
-        for hook, fwd_ref in self._map__hook__ref.iteritems():
+        for hook, fwd_ref in self._map__hook__ref.items():
             hook = hook.__get__(resource)
             fwd_ref = WeakRef(fwd_ref)
             handler = partial(self._handle_forward_reference_key_changed,
                               fwd_ref)
             hook += handler
 
-        for hook, handler in self._map__hook__handler.iteritems():
+        for hook, handler in self._map__hook__handler.items():
             hook = hook.__get__(resource)
             hook += handler
 
@@ -91,7 +143,7 @@ class ResourceModelBase(object):
         return resource
 
     def release(self, resource):
-        for hook, handler in self._map__hook__handler.iteritems():
+        for hook, handler in self._map__hook__handler.items():
             hook = hook.__get__(resource)
             hook -= handler
 
@@ -109,6 +161,9 @@ class ResourceModelBase(object):
     def _handle_resource_retrieval_failed(self, sender, data):
         pass
 
+    def _handle_resource_releasing(self, sender, data):
+        pass
+
     def _handle_resource_released(self, sender, data):
         self._break_forward_references(data)
 
@@ -0,0 +1,351 @@
+import logging
+import mmap
+import os
+import struct
+import uuid
+import weakref
+
+from elemental_core import NO_VALUE
+
+from .serialization import binary
+from .errors import ResourceStoreError
+
+
+_LOG = logging.getLogger(__name__)
+
+
+_MAGIC = b'ELRS'
+_VERSION = 1
+_TEMP_SUFFIX = '.tmp'
+
+# magic | version | resource count | index offset
+_HEADER = struct.Struct('<4sHQQ')
+# resource id | record offset | record length
+_INDEX_ENTRY = struct.Struct('<16sQI')
+
+
+class ResourceStore(object):
+    """
+    A read-only file of serialized `Resources`, memory-mapped so that only
+        the pages holding the `Resources` read are loaded.
+
+    Each `Resource` is stored as its own record, encoded with
+    `serialization.binary.dumps_resource`. The records are followed by an
+    index of ids to record offsets, sorted by id, which is searched in place:
+    neither the records nor the index are held as Python objects.
+
+    Stores are written with `ResourceStore.write` and served by passing them
+    to a `Model`.
+    """
+    @property
+    def path(self):
+        return self._path
+
+    def __init__(self, path):
+        """
+        Opens the store at `path`.
+
+        Args:
+            path (str): Path of a file written by `ResourceStore.write`.
+
+        Raises:
+            ResourceStoreError: If the file is not a valid store.
+        """
+        super(ResourceStore, self).__init__()
+
+        self._path = path
+        self._file = open(path, 'rb')
+        try:
+            self._mmap = mmap.mmap(self._file.fileno(), 0,
+                                   access=mmap.ACCESS_READ)
+        except ValueError:
+            # Raised for empty files.
+            self._file.close()
+            self._mmap = None
+
+        header = self._mmap[:_HEADER.size] if self._mmap is not None else b''
+        try:
+            magic, version, count, index_offset = _HEADER.unpack(header)
+        except struct.error:
+            magic = version = None
+
+        if magic != _MAGIC or version != _VERSION:
+            self.close()
+
+            msg = 'Failed to open resource store "{0}": Unsupported header.'
+            msg = msg.format(path)
+            raise ResourceStoreError(msg)
+
+        self._count = count
+        self._index_offset = index_offset
+
+    @classmethod
+    def write(cls, path, resources):
+        """
+        Writes `resources` to a new store at `path`, replacing any file there
+            once the store is complete.
+
+        Args:
+            path (str): Path of the store.
+            resources (Iterable[Resource]): The `Resources` to be stored.
+
+        Returns:
+            int: The number of `Resources` written.
+        """
+        temp_path = path + _TEMP_SUFFIX
+        index_entries = []
+
+        with open(temp_path, 'wb') as stream:
+            stream.write(_HEADER.pack(_MAGIC, _VERSION, 0, 0))
+
+            offset = _HEADER.size
+            for resource in resources:
+                record = binary.dumps_resource(resource)
+                stream.write(record)
+                index_entries.append((resource.id.bytes, offset, len(record)))
+                offset += len(record)
+
+            index_entries.sort()
+            for index_entry in index_entries:
+                stream.write(_INDEX_ENTRY.pack(*index_entry))
+
+            stream.seek(0)
+            stream.write(_HEADER.pack(_MAGIC, _VERSION, len(index_entries),
+                                      offset))
+            stream.flush()
+            os.fsync(stream.fileno())
+
+        os.replace(temp_path, path)
+
+        if _LOG.isEnabledFor(logging.INFO):
+            msg = 'Wrote {0} resources to resource store "{1}"'
+            msg = msg.format(len(index_entries), path)
+            _LOG.info(msg)
+
+        return len(index_entries)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+    def __len__(self):
+        return self._count
+
+    def __contains__(self, resource_id):
+        return self._find(resource_id) is not None
+
+    def close(self):
+        if self._mmap is not None:
+            self._mmap.close()
+            self._mmap = None
+        self._file.close()
+
+    def iter_ids(self):
+        """
+        Iterates the ids of the stored `Resources`, in the order of their
+            bytes.
+        """
+        mm = self._mmap
+        start = self._index_offset
+        for idx in range(self._count):
+            offset = start + idx * _INDEX_ENTRY.size
+            yield uuid.UUID(bytes=mm[offset:offset + 16])
+
+    def materialise(self, resource_id):
+        """
+        Decodes the stored `Resource` with `resource_id`.
+
+        Every call returns a new, unregistered `Resource` instance.
+
+        Returns:
+            The `Resource`, or None if the store holds no `resource_id`.
+        """
+        entry = self._find(resource_id)
+        if entry is None:
+            return None
+
+        offset, length = entry
+        return binary.loads_resource(self._mmap[offset:offset + length])
+
+    def _find(self, resource_id):
+        """
+        Binary searches the index for `resource_id`.
+
+        Returns:
+            Tuple of the record offset and length, or None.
+        """
+        try:
+            key = resource_id.bytes
+        except AttributeError:
+            return None
+
+        mm = self._mmap
+        start = self._index_offset
+        entry_size = _INDEX_ENTRY.size
+
+        low = 0
+        high = self._count
+        while low < high:
+            middle = (low + high) // 2
+            offset = start + middle * entry_size
+            entry_key = mm[offset:offset + 16]
+            if entry_key < key:
+                low = middle + 1
+            elif entry_key > key:
+                high = middle
+            else:
+                _, record_offset, record_length = _INDEX_ENTRY.unpack_from(
+                    mm, offset)
+                return record_offset, record_length
+
+        return None
+
+
+class StoredResourceMap(object):
+    """
+    The map of ids to `Resources` of a `Model` backed by a `ResourceStore`.
+
+    `Resources` registered with the `Model` are held strongly, as by a plain
+    `Model`. `Resources` in the store are materialised on first lookup and
+    held weakly, so they are evicted once nothing else references them and
+    materialised anew on the next lookup. Releasing a stored `Resource` hides
+    it from the store for the lifetime of the map.
+    """
+    def __init__(self, store, materialised_handler):
+        """
+        Args:
+            store (ResourceStore): The store `Resources` are read from.
+            materialised_handler (Callable): Called with each materialised
+                `Resource` before it is returned. Held weakly.
+        """
+        super(StoredResourceMap, self).__init__()
+
+        self._store = store
+        self._materialised_handler = weakref.WeakMethod(materialised_handler)
+
+        self._registered = weakref.WeakKeyDictionary()
+        self._materialised = weakref.WeakValueDictionary()
+        # Ids in the store no longer served from it, either released or
+        # registered with the Model since.
+        self._hidden_ids = set()
+
+    def __getitem__(self, resource_id):
+        try:
+            return self._registered[resource_id]
+        except KeyError:
+            pass
+
+        result = self._materialised.get(resource_id)
+        if result is None:
+            result = self._materialise(resource_id)
+
+        return result
+
+    def __setitem__(self, resource_id, resource):
+        if resource_id in self._store:
+            self._hidden_ids.add(resource_id)
+        self._materialised.pop(resource_id, None)
+        self._registered[resource_id] = resource
+
+    def __contains__(self, resource_id):
+        if resource_id in self._registered or resource_id in self._materialised:
+            return True
+
+        try:
+            if resource_id in self._hidden_ids:
+                return False
+        except TypeError:
+            return False
+
+        return resource_id in self._store
+
+    def __iter__(self):
+        registered_ids = list(self._registered.keys())
+        for resource_id in registered_ids:
+            yield resource_id
+
+        hidden_ids = self._hidden_ids
+        for resource_id in self._store.iter_ids():
+            if resource_id not in hidden_ids:
+                yield resource_id
+
+    def __len__(self):
+        return (len(self._registered) + len(self._store) -
+                len(self._hidden_ids))
+
+    def get(self, resource_id, default=None):
+        try:
+            return self[resource_id]
+        except KeyError:
+            return default
+
+    def pop(self, resource_id, default=NO_VALUE):
+        try:
+            result = self._registered.pop(resource_id)
+        except KeyError:
+            try:
+                result = self[resource_id]
+            except KeyError:
+                if default is NO_VALUE:
+                    raise
+                return default
+
+            self._materialised.pop(resource_id, None)
+            self._hidden_ids.add(resource_id)
+
+        return result
+
+    def keys(self):
+        return iter(self)
+
+    def values(self):
+        for _, resource in self.items():
+            yield resource
+
+    def items(self):
+        for resource_id in self:
+            try:
+                yield resource_id, self[resource_id]
+            except KeyError:
+                # Released while iterating.
+                continue
+
+    def pin(self, resource_id):
+        """
+        Holds a materialised `Resource` strongly from now on, so changes
+            made to it are not lost when nothing else references it.
+
+        Returns:
+            bool: True if a materialised `Resource` was pinned.
+        """
+        resource = self._materialised.pop(resource_id, None)
+        if resource is None:
+            return False
+
+        self[resource_id] = resource
+        return True
+
+    def _materialise(self, resource_id):
+        try:
+            hidden = resource_id in self._hidden_ids
+        except TypeError:
+            hidden = True
+
+        result = None if hidden else self._store.materialise(resource_id)
+        if result is None:
+            raise KeyError(resource_id)
+
+        self._materialised[result.id] = result
+
+        handler = self._materialised_handler()
+        if handler is not None:
+            handler(result)
+
+        if _LOG.isEnabledFor(logging.DEBUG):
+            msg = 'Materialised resource: "{0}" - "{1}"'
+            msg = msg.format(repr(type(result)), result.id)
+            _LOG.debug(msg)
+
+        return result
@@ -0,0 +1,108 @@
+import threading
+
+
+class ReadWriteLock(object):
+    """
+    A readers-writer lock.
+
+    Any number of threads may hold the lock for reading at once, while a
+    single thread holds it for writing to the exclusion of all others.
+    Waiting readers and writers take turns: a thread waiting to write holds
+    back threads that start reading after it, and the threads waiting to read
+    when a writer finishes are let in before the next writer. Neither a
+    steady stream of readers nor of writers can starve the other.
+
+    The lock is reentrant: a thread holding it may acquire it again for
+    reading, and a thread holding it for writing may acquire it again for
+    either. A thread holding it only for reading cannot acquire it for
+    writing; `RuntimeError` is raised rather than deadlocking.
+    """
+
+    def __init__(self):
+        super(ReadWriteLock, self).__init__()
+
+        self._condition = threading.Condition(threading.Lock())
+        self._reader_count = 0
+        self._waiting_reader_count = 0
+        self._waiting_writer_count = 0
+        self._readers_turn = False
+        self._writer_ident = None
+        self._write_depth = 0
+
+        # Per-thread read depth, so that reentrant reads do not wait on
+        # writers the thread itself is blocking.
+        self._local = threading.local()
+
+    def acquire_read(self):
+        ident = threading.get_ident()
+        if self._writer_ident == ident:
+            self._write_depth += 1
+            return
+
+        read_depth = getattr(self._local, 'read_depth', 0)
+        if read_depth:
+            self._local.read_depth = read_depth + 1
+            return
+
+        with self._condition:
+            self._waiting_reader_count += 1
+            try:
+                while self._writer_ident is not None or (
+                        self._waiting_writer_count and not self._readers_turn):
+                    self._condition.wait()
+            finally:
+                self._waiting_reader_count -= 1
+                if not self._waiting_reader_count:
+                    self._readers_turn = False
+
+            self._reader_count += 1
+
+        self._local.read_depth = 1
+
+    def release_read(self):
+        if self._writer_ident == threading.get_ident():
+            self._write_depth -= 1
+            return
+
+        read_depth = self._local.read_depth - 1
+        self._local.read_depth = read_depth
+        if read_depth:
+            return
+
+        with self._condition:
+            self._reader_count -= 1
+            if not self._reader_count:
+                self._condition.notify_all()
+
+    def acquire_write(self):
+        ident = threading.get_ident()
+        if self._writer_ident == ident:
+            self._write_depth += 1
+            return
+
+        if getattr(self._local, 'read_depth', 0):
+            raise RuntimeError(
+                'Cannot acquire a ReadWriteLock for writing while holding it '
+                'for reading.')
+
+        with self._condition:
+            self._waiting_writer_count += 1
+            try:
+                while (self._writer_ident is not None or self._reader_count or
+                       self._readers_turn):
+                    self._condition.wait()
+            finally:
+                self._waiting_writer_count -= 1
+
+            self._writer_ident = ident
+            self._write_depth = 1
+
+    def release_write(self):
+        self._write_depth -= 1
+        if self._write_depth:
+            return
+
+        with self._condition:
+            self._writer_ident = None
+            self._readers_turn = bool(self._waiting_reader_count)
+            self._condition.notify_all()
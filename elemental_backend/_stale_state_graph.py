@@ -0,0 +1,155 @@
+import weakref
+
+from elemental_core import NO_VALUE
+
+from ._resource_index import ResourceIndex
+from .resources import Resource
+
+
+class StaleStateGraph(object):
+    """
+    Tracks which `Resources` hold derived data that is out of date.
+
+    Data derived from other `Resources`, such as the `ContentInstances` of a
+    `ViewResult`, is not recomputed when those `Resources` change. Instead,
+    the derived `Resource` is marked stale and recomputed the next time it is
+    read.
+
+    A `Resource` may be marked stale with details describing what changed,
+    allowing the reader to recompute only the affected parts. A `Resource`
+    marked stale without details must be recomputed in full.
+
+    Dependencies between `Resources` form a graph. Marking the dependents of
+    a `Resource` stale propagates through the graph, marking every `Resource`
+    that transitively depends on it stale in full.
+    """
+    def __init__(self):
+        super(StaleStateGraph, self).__init__()
+
+        # Maps the id of a Resource to the ids of the Resources depending on
+        # it. Bidirectional so that a dependent's edges can be dropped without
+        # scanning every Resource.
+        self._map__resource__stale_dependencies = ResourceIndex(
+            Resource, Resource, bidirectional=True)
+
+        # Maps the id of a stale Resource to a set of details, or to None
+        # when the Resource must be recomputed in full.
+        self._map__resource__stale_details = weakref.WeakKeyDictionary()
+
+    def push_dependency(self, resource_id, dependent_id):
+        """
+        Records that `dependent_id` becomes stale whenever `resource_id`
+            changes.
+        """
+        self._map__resource__stale_dependencies.push_indexed_value(
+            resource_id, dependent_id)
+
+    def pop_dependency(self, resource_id, dependent_id):
+        self._map__resource__stale_dependencies.pop_indexed_value(
+            resource_id, dependent_id)
+
+    def pop_dependent(self, dependent_id):
+        """
+        Removes every dependency recorded for `dependent_id`.
+        """
+        self._map__resource__stale_dependencies.pop_value(dependent_id)
+
+    def pop_resource(self, resource_id):
+        """
+        Removes all stale state recorded for a released `Resource`.
+        """
+        self._map__resource__stale_dependencies.pop_index(resource_id)
+        self._map__resource__stale_dependencies.pop_value(resource_id)
+        self._pop_stale_details(resource_id)
+
+    def is_stale(self, resource_id):
+        try:
+            resource_id = resource_id.id
+        except AttributeError:
+            pass
+
+        try:
+            return resource_id in self._map__resource__stale_details
+        except TypeError:
+            return False
+
+    def mark_stale(self, resource_id, detail=NO_VALUE):
+        """
+        Marks a `Resource` stale.
+
+        Args:
+            resource_id: Id of the stale `Resource`.
+            detail: Hashable description of what changed. If omitted, the
+                `Resource` must be recomputed in full.
+
+        Returns:
+            bool: True if the `Resource` was not already stale.
+        """
+        try:
+            resource_id = resource_id.id
+        except AttributeError:
+            pass
+
+        map_r_sd = self._map__resource__stale_details
+        try:
+            details = map_r_sd[resource_id]
+        except KeyError:
+            if detail is NO_VALUE:
+                map_r_sd[resource_id] = None
+            else:
+                map_r_sd[resource_id] = {detail}
+            return True
+
+        if details is not None:
+            if detail is NO_VALUE:
+                map_r_sd[resource_id] = None
+            else:
+                details.add(detail)
+
+        return False
+
+    def mark_dependents_stale(self, resource_id):
+        """
+        Marks every `Resource` depending, directly or transitively, on a
+            `Resource` stale in full.
+
+        Propagation stops at `Resources` already stale in full, as their own
+        dependents were marked when they became stale.
+        """
+        idx_r_deps = self._map__resource__stale_dependencies
+        map_r_sd = self._map__resource__stale_details
+
+        pending = list(idx_r_deps.iter_indexed_values(resource_id))
+        while pending:
+            dependent_id = pending.pop()
+            if map_r_sd.get(dependent_id, NO_VALUE) is None:
+                continue
+
+            map_r_sd[dependent_id] = None
+            pending.extend(idx_r_deps.iter_indexed_values(dependent_id))
+
+    def pop_stale(self, resource_id):
+        """
+        Clears the stale state of a `Resource` about to be recomputed.
+
+        Returns:
+            `NO_VALUE` if the `Resource` is not stale, None if it must be
+                recomputed in full, or a tuple of the details it was marked
+                stale with.
+        """
+        try:
+            resource_id = resource_id.id
+        except AttributeError:
+            pass
+
+        details = self._pop_stale_details(resource_id)
+        if details:
+            details = tuple(details)
+
+        return details
+
+    def _pop_stale_details(self, resource_id):
+        try:
+            return self._map__resource__stale_details.pop(resource_id)
+        except (KeyError, TypeError):
+            return NO_VALUE
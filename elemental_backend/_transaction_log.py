@@ -0,0 +1,516 @@
+import json
+import logging
+import os
+import threading
+import time
+import uuid
+import weakref
+import zlib
+
+from elemental_core.util import process_elemental_class_value
+
+from .transactions import Actions
+from ._controller_events import ControllerEvents
+from .errors import TransactionLogError
+
+
+_LOG = logging.getLogger(__name__)
+
+
+_SEGMENT_SUFFIX = '.log'
+_CHECKPOINT_SUFFIX = '.checkpoint'
+_TEMP_SUFFIX = '.tmp'
+
+_LOGGED_ACTIONS = frozenset((Actions.POST, Actions.PUT, Actions.DELETE))
+
+
+class TransactionLog(object):
+    """
+    An append-only, write-ahead log of the changes made to a `Model` through
+        a `Controller`.
+
+    Once bound to a `Controller`, every `POST`, `PUT` and `DELETE`
+    `Transaction` reaching `ControllerEvents.transaction_succeeded` is
+    appended to the log as the target `Resource` serialized in the log's data
+    format. The `Transactions` of a `Batch` are appended when the `Batch`
+    closes, in the order they were processed, leaving out the members of
+    batch `Transactions` that were rolled back.
+
+    Records are written to the operating system as they are appended, and
+    flushed to disk in groups: once `group_size` records are pending, or at
+    most `sync_interval` seconds after the first of them was appended, by a
+    timer thread if no further record is appended. A crash loses at most the
+    records appended since the last flush; a partially written record is
+    detected and discarded on replay.
+
+    Every `checkpoint_interval` records, the whole `Model` is written to a
+    checkpoint from a `ModelSnapshot`, and the log segments preceding it are
+    removed. `recover` loads the latest checkpoint and replays only the
+    records appended after it, so restarting costs time in proportion to the
+    changes since the last checkpoint rather than to the log's history.
+
+    The checkpoint is written synchronously, by the handler appending the
+    record that reaches `checkpoint_interval`, so the `Transaction` appending
+    it is not closed until the whole `Model` has been written. Services that
+    cannot afford the pause should pass None for `checkpoint_interval` and
+    call `checkpoint` outside of request processing instead.
+
+    Directory layout:
+        <seq>.checkpoint: The `Resources` of the `Model` after record <seq>.
+        <seq>.log: Records following record <seq>, one per line.
+    """
+
+    @property
+    def directory(self):
+        return self._directory
+
+    @property
+    def data_format(self):
+        return self._data_format
+
+    @property
+    def seq(self):
+        """
+        int: Sequence number of the last record appended.
+        """
+        return self._seq
+
+    def __init__(self, directory, data_format='json', group_size=64,
+                 sync_interval=0.05, checkpoint_interval=10000):
+        """
+        Args:
+            directory (str): Directory holding the log. Created if missing.
+            data_format (str): Format `Resources` are serialized to, which
+                must have serializers and deserializers registered with the
+                `Controller`. Defaults to "json".
+            group_size (int): Number of records flushed to disk together.
+                1 flushes every record as it is appended. Defaults to 64.
+            sync_interval (Optional[float]): Seconds after which pending
+                records are flushed regardless of `group_size`. If None, only
+                `group_size` triggers a flush. Defaults to 0.05.
+            checkpoint_interval (Optional[int]): Number of records between
+                checkpoints, written while processing the `Transaction` that
+                reaches the interval. If None, checkpoints are only written
+                through `checkpoint`. Defaults to 10000.
+        """
+        super(TransactionLog, self).__init__()
+
+        self._directory = directory
+        self._data_format = data_format
+        self._group_size = max(int(group_size), 1)
+        self._sync_interval = sync_interval
+        self._checkpoint_interval = checkpoint_interval
+
+        self._controller_ref = None
+        self._handlers = ()
+        self._lock = threading.RLock()
+
+        self._seq = 0
+        self._checkpoint_seq = 0
+        self._segment = None
+        self._pending_count = 0
+        self._last_sync = time.monotonic()
+        self._sync_timer = None
+
+        # Records of the Transactions of a Batch, held until it closes.
+        self._batched_transaction_ids = set()
+        self._map__transaction__record = {}
+
+        os.makedirs(directory, exist_ok=True)
+
+    def bind_to_controller(self, controller):
+        """
+        Appends the changes made through `controller` to the log.
+
+        `recover` should be called first when the log already holds records.
+        """
+        self._controller_ref = weakref.ref(controller)
+
+        # Controllers hold handlers weakly, so the bound methods are kept.
+        self._handlers = (
+            (ControllerEvents.transaction_succeeded,
+             self._handle_transaction_succeeded),
+            (ControllerEvents.batch_opened, self._handle_batch_opened),
+            (ControllerEvents.batch_closing, self._handle_batch_closing),
+        )
+        for event, handler in self._handlers:
+            controller.handler(event)(handler)
+
+    def recover(self, controller):
+        """
+        Restores the `Model` managed by `controller` from the log.
+
+        The latest checkpoint is loaded into the `Model`, then every record
+        appended after it is replayed. A partially written record at the end
+        of the log is discarded.
+
+        Returns:
+            int: The number of records replayed.
+        """
+        with self._lock:
+            self._close_segment()
+
+            checkpoint_seqs = self._list_seqs(_CHECKPOINT_SUFFIX)
+            if checkpoint_seqs:
+                self._checkpoint_seq = checkpoint_seqs[-1]
+                self._load_checkpoint(controller, self._checkpoint_seq)
+            self._seq = self._checkpoint_seq
+
+            replayed_count = 0
+            segment_seqs = self._list_seqs(_SEGMENT_SUFFIX)
+            for segment_idx, segment_seq in enumerate(segment_seqs):
+                path = self._compute_path(segment_seq, _SEGMENT_SUFFIX)
+                is_last = segment_idx == len(segment_seqs) - 1
+
+                for record in self._read_records(path, truncate=is_last):
+                    if record['seq'] <= self._seq:
+                        continue
+
+                    self._replay_record(controller, record)
+                    self._seq = record['seq']
+                    replayed_count += 1
+
+            if _LOG.isEnabledFor(logging.INFO):
+                msg = 'Recovered Model from "{0}": checkpoint {1}, {2} records replayed'
+                msg = msg.format(self._directory, self._checkpoint_seq,
+                                 replayed_count)
+                _LOG.info(msg)
+
+            return replayed_count
+
+    def sync(self):
+        """
+        Flushes every appended record to disk.
+        """
+        with self._lock:
+            if self._sync_timer is not None:
+                self._sync_timer.cancel()
+                self._sync_timer = None
+
+            if self._segment is not None and self._pending_count:
+                self._segment.flush()
+                os.fsync(self._segment.fileno())
+
+            self._pending_count = 0
+            self._last_sync = time.monotonic()
+
+    def checkpoint(self):
+        """
+        Writes the whole `Model` to a checkpoint and removes the records and
+            checkpoints it supersedes.
+
+        Raises:
+            TransactionLogError: If a `Resource` cannot be written. The
+                previous checkpoint and the records following it are kept.
+        """
+        controller = self._get_controller()
+
+        with self._lock:
+            if self._map__transaction__record:
+                # The Model holds changes of a batch Transaction that may
+                # still be rolled back.
+                return
+
+            self.sync()
+
+            seq = self._seq
+            path = self._compute_path(seq, _CHECKPOINT_SUFFIX)
+            temp_path = path + _TEMP_SUFFIX
+
+            # A failed write leaves only the temporary file behind.
+            with controller.model.snapshot() as snapshot:
+                with open(temp_path, 'w', encoding='utf-8') as stream:
+                    for resource in snapshot.iter_resources():
+                        record = self._compute_resource_record(
+                            controller, resource)
+                        stream.write(_frame_record(record))
+                    stream.flush()
+                    os.fsync(stream.fileno())
+
+            os.replace(temp_path, path)
+            _sync_directory(self._directory)
+
+            self._close_segment()
+            self._checkpoint_seq = seq
+            self._remove_superseded(seq)
+
+            if _LOG.isEnabledFor(logging.INFO):
+                msg = 'Wrote checkpoint {0} to "{1}"'
+                msg = msg.format(seq, self._directory)
+                _LOG.info(msg)
+
+    def close(self):
+        with self._lock:
+            self._close_segment()
+
+    def _get_controller(self):
+        controller = None
+        if self._controller_ref is not None:
+            controller = self._controller_ref()
+
+        if controller is None:
+            msg = 'TransactionLog is not bound to a Controller'
+            raise TransactionLogError(msg)
+
+        return controller
+
+    def _handle_transaction_succeeded(self, event, transaction):
+        if transaction.action not in _LOGGED_ACTIONS:
+            return
+
+        record = self._compute_transaction_record(transaction)
+        if record is None:
+            return
+
+        if transaction.id in self._batched_transaction_ids:
+            self._map__transaction__record[transaction.id] = record
+        else:
+            self._append(record)
+
+    def _handle_batch_opened(self, event, batch):
+        # Every record is held, so that standalone Transactions are not
+        # appended ahead of the batch Transaction members preceding them.
+        for transaction in batch.transactions:
+            self._batched_transaction_ids.add(transaction.id)
+
+    def _handle_batch_closing(self, event, batch):
+        for transaction in batch.transactions:
+            self._batched_transaction_ids.discard(transaction.id)
+            record = self._map__transaction__record.pop(transaction.id, None)
+
+            # Members of a failed batch Transaction hold an error, having
+            # been rolled back.
+            if record is not None and not transaction.errors:
+                self._append(record)
+
+    def _compute_transaction_record(self, transaction):
+        resource = transaction.target_resource
+
+        if transaction.action is Actions.DELETE:
+            return {'action': Actions.DELETE.name, 'id': str(resource.id)}
+
+        try:
+            record = self._compute_resource_record(
+                self._get_controller(), resource)
+        except TransactionLogError:
+            # Reported by the record itself.
+            return None
+
+        record['action'] = transaction.action.name
+
+        return record
+
+    def _compute_resource_record(self, controller, resource):
+        serializer = controller._resolve_serializer(
+            type(resource), self._data_format)
+        if not serializer:
+            msg = (
+                'Failed to log resource "{0}": No serializer found for '
+                'resource type "{1}" and data format "{2}".'
+            )
+            msg = msg.format(resource.id, repr(type(resource)),
+                             self._data_format)
+
+            _LOG.error(msg)
+            raise TransactionLogError(msg)
+
+        return {
+            'type': type(resource).__name__,
+            'id': str(resource.id),
+            'payload': serializer(resource)
+        }
+
+    def _append(self, record):
+        with self._lock:
+            if self._segment is None:
+                path = self._compute_path(self._seq, _SEGMENT_SUFFIX)
+                self._segment = open(path, 'a', encoding='utf-8')
+
+            self._seq += 1
+            record['seq'] = self._seq
+            self._segment.write(_frame_record(record))
+            self._pending_count += 1
+
+            if self._pending_count >= self._group_size or (
+                    self._sync_interval is not None and
+                    time.monotonic() - self._last_sync >= self._sync_interval):
+                self.sync()
+            elif self._sync_interval is not None and self._sync_timer is None:
+                # Flushes the pending records should no other be appended.
+                self._sync_timer = threading.Timer(self._sync_interval,
+                                                   self._handle_sync_timer)
+                self._sync_timer.daemon = True
+                self._sync_timer.start()
+
+            if (self._checkpoint_interval and
+                    self._seq - self._checkpoint_seq >= self._checkpoint_interval):
+                self.checkpoint()
+
+    def _handle_sync_timer(self):
+        with self._lock:
+            # A timer that fired while `sync` was cancelling it has nothing
+            # left to flush, and must not release its successor.
+            if self._sync_timer is not threading.current_thread():
+                return
+
+            self._sync_timer = None
+            self.sync()
+
+    def _close_segment(self):
+        if self._segment is None:
+            return
+
+        self.sync()
+        self._segment.close()
+        self._segment = None
+
+    def _load_checkpoint(self, controller, seq):
+        path = self._compute_path(seq, _CHECKPOINT_SUFFIX)
+        resources = [self._load_resource(controller, record)
+                     for record in self._read_records(path, truncate=False)]
+
+        controller.model.register_resources(resources)
+
+    def _replay_record(self, controller, record):
+        model = controller.model
+        action = Actions[record['action']]
+        resource_id = uuid.UUID(record['id'])
+
+        if action is Actions.DELETE:
+            if resource_id in model:
+                model.release_resource(resource_id)
+        elif resource_id in model:
+            resource = model.retrieve_resource(resource_id)
+            deserializer = self._resolve_deserializer(controller, type(resource))
+            deserializer(record['payload'], resource)
+            model.pin_resource(resource_id)
+        else:
+            model.register_resource(self._load_resource(controller, record))
+
+    def _load_resource(self, controller, record):
+        resource_type = process_elemental_class_value(record['type'])
+        resource = resource_type()
+        deserializer = self._resolve_deserializer(controller, resource_type)
+        deserializer(record['payload'], resource)
+
+        return resource
+
+    def _resolve_deserializer(self, controller, resource_type):
+        deserializer = controller._resolve_deserializer(
+            resource_type, self._data_format)
+        if not deserializer:
+            msg = (
+                'Failed to replay TransactionLog: No deserializer found for '
+                'resource type "{0}" and data format "{1}".'
+            )
+            msg = msg.format(repr(resource_type), self._data_format)
+
+            _LOG.error(msg)
+            raise TransactionLogError(msg)
+
+        return deserializer
+
+    def _read_records(self, path, truncate):
+        """
+        Iterates the records held in a log segment or checkpoint.
+
+        Args:
+            truncate (bool): If True, a damaged record is taken to be the
+                partially written end of the log, and it is cut off along with
+                anything following it. Otherwise, `TransactionLogError` is
+                raised.
+        """
+        with open(path, 'rb') as stream:
+            offset = 0
+            for line in stream:
+                record = _unframe_record(line)
+                if record is None:
+                    break
+                offset += len(line)
+                yield record
+            else:
+                return
+
+        if not truncate:
+            msg = 'Failed to read TransactionLog: "{0}" is damaged at byte {1}'
+            msg = msg.format(path, offset)
+
+            _LOG.error(msg)
+            raise TransactionLogError(msg)
+
+        msg = 'Discarding partially written record in "{0}" at byte {1}'
+        msg = msg.format(path, offset)
+        _LOG.warning(msg)
+
+        with open(path, 'r+b') as stream:
+            stream.truncate(offset)
+            os.fsync(stream.fileno())
+
+    def _remove_superseded(self, seq):
+        for checkpoint_seq in self._list_seqs(_CHECKPOINT_SUFFIX):
+            if checkpoint_seq < seq:
+                os.remove(self._compute_path(checkpoint_seq, _CHECKPOINT_SUFFIX))
+
+        for segment_seq in self._list_seqs(_SEGMENT_SUFFIX):
+            if segment_seq < seq:
+                os.remove(self._compute_path(segment_seq, _SEGMENT_SUFFIX))
+
+    def _list_seqs(self, suffix):
+        result = []
+
+        for file_name in os.listdir(self._directory):
+            if not file_name.endswith(suffix):
+                continue
+
+            try:
+                result.append(int(file_name[:-len(suffix)]))
+            except ValueError:
+                continue
+
+        result.sort()
+        return result
+
+    def _compute_path(self, seq, suffix):
+        file_name = '{0:020d}{1}'.format(seq, suffix)
+        return os.path.join(self._directory, file_name)
+
+
+def _frame_record(record):
+    """
+    Encodes a record as a line prefixed with its checksum.
+    """
+    data = json.dumps(record, separators=(',', ':'))
+    checksum = zlib.crc32(data.encode('utf-8'))
+    return '{0:08x} {1}\n'.format(checksum, data)
+
+
+def _unframe_record(line):
+    """
+    Returns:
+        The record encoded in `line`, or None if it is incomplete or damaged.
+    """
+    if not line.endswith(b'\n'):
+        return None
+
+    checksum, _, data = line[:-1].partition(b' ')
+    try:
+        if int(checksum, 16) != zlib.crc32(data):
+            return None
+        return json.loads(data.decode('utf-8'))
+    except ValueError:
+        return None
+
+
+def _sync_directory(directory):
+    # Persists renames within the directory; not supported on every platform.
+    try:
+        fd = os.open(directory, os.O_RDONLY)
+    except OSError:
+        return
+
+    try:
+        os.fsync(fd)
+    except OSError:
+        pass
+    finally:
+        os.close(fd)
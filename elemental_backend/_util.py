@@ -76,7 +76,7 @@ def iter_subclasses(base_class):
 
     while classes:
         cls = classes.popleft()
-        classes.extend(cls.__subclassess__())
+        classes.extend(cls.__subclasses__())
         if cls is base_class:
             continue
         yield cls
@@ -0,0 +1,220 @@
+"""
+Evaluation of `FilterInstance` and `SorterInstance` parameters against
+`AttributeInstance` values.
+
+A `FilterInstance`'s `kind_params` may contain any of the following; every
+parameter present must be satisfied by a value for it to match:
+
+    match (str): Regular expression matched against the start of the value.
+    equals: The value must equal this.
+    prefix (str): The value must start with this.
+    minimum: The value must be greater than or equal to this.
+    maximum: The value must be less than or equal to this.
+
+A `SorterInstance`'s `kind_params` may contain:
+
+    descending (bool): Sort from the greatest value to the least.
+"""
+import functools
+import numbers
+import re
+
+
+def compile_filter_params(kind_params):
+    """
+    Compiles a `FilterInstance`'s params into a predicate over a single value.
+
+    Args:
+        kind_params (dict): The `FilterInstance`'s `kind_params`.
+
+    Returns:
+        callable: Predicate returning True for values satisfying every
+            parameter, or None if `kind_params` holds no recognised
+            parameters, in which case every `ContentInstance` matches.
+    """
+    checks = []
+
+    if 'match' in kind_params:
+        pattern = re.compile(kind_params['match'])
+        checks.append(lambda value: pattern.match(str(value)) is not None)
+
+    if 'equals' in kind_params:
+        expected = kind_params['equals']
+        checks.append(lambda value: value == expected)
+
+    if 'prefix' in kind_params:
+        prefix = kind_params['prefix']
+        checks.append(lambda value: str(value).startswith(prefix))
+
+    if 'minimum' in kind_params:
+        minimum = kind_params['minimum']
+        checks.append(lambda value: value >= minimum)
+
+    if 'maximum' in kind_params:
+        maximum = kind_params['maximum']
+        checks.append(lambda value: value <= maximum)
+
+    if not checks:
+        return None
+
+    def predicate(value):
+        if value is None:
+            return False
+
+        try:
+            for check in checks:
+                if not check(value):
+                    return False
+        except TypeError:
+            # Values that cannot be compared to the params do not match.
+            return False
+
+        return True
+
+    # A lone equality check costs no more than the memo lookup that would
+    # replace it, so `match_filter_column` evaluates it directly.
+    predicate.memoize = len(checks) > 1 or 'equals' not in kind_params
+
+    return predicate
+
+
+def match_filter_params(values, kind_params):
+    """
+    Determines whether any of `values` satisfies a `FilterInstance`'s params.
+
+    Args:
+        values (Sequence): `AttributeInstance` values of a `ContentInstance`
+            for the `FilterType`'s `AttributeTypes`.
+        kind_params (dict): The `FilterInstance`'s `kind_params`.
+
+    Returns:
+        bool: True if `kind_params` holds no recognised parameters or any
+            value satisfies all of them.
+    """
+    return match_filter_values(values, compile_filter_params(kind_params))
+
+
+def match_filter_values(values, predicate):
+    """
+    Determines whether any of `values` satisfies a compiled filter.
+    """
+    if predicate is None:
+        return True
+
+    for value in values:
+        if predicate(value):
+            return True
+
+    return False
+
+
+def match_filter_column(column, predicate):
+    """
+    Evaluates a compiled filter over a whole pool of `ContentInstances`.
+
+    Each distinct value is evaluated once, so pools sharing values across
+    `ContentInstances` cost one evaluation per distinct value rather than one
+    per `ContentInstance`. Filters holding only `equals` are evaluated per
+    value instead, as they are no dearer than the memo lookup.
+
+    Args:
+        column (Sequence[Sequence]): For each `ContentInstance`, its
+            `AttributeInstance` values for the `FilterType`'s
+            `AttributeTypes`.
+        predicate (callable): Filter compiled by `compile_filter_params`.
+
+    Returns:
+        bytearray: Mask holding 1 for each `ContentInstance` with a value
+            satisfying the filter and 0 otherwise.
+    """
+    if predicate is None:
+        return bytearray(b'\x01') * len(column)
+
+    result = bytearray(len(column))
+
+    if not getattr(predicate, 'memoize', True):
+        for column_idx, values in enumerate(column):
+            for value in values:
+                if predicate(value):
+                    result[column_idx] = 1
+                    break
+
+        return result
+
+    map_value__matched = {}
+
+    for column_idx, values in enumerate(column):
+        for value in values:
+            # The type is part of the key so that values which compare equal
+            # across types, such as 1 and True, are evaluated separately.
+            try:
+                value_key = (type(value), value)
+                matched = map_value__matched[value_key]
+            except KeyError:
+                matched = predicate(value)
+                map_value__matched[value_key] = matched
+            except TypeError:
+                matched = predicate(value)
+
+            if matched:
+                result[column_idx] = 1
+                break
+
+    return result
+
+
+def compute_sort_key(values, kind_params):
+    """
+    Computes the key a `SorterInstance` sorts a `ContentInstance` by.
+
+    The first value is used. Numbers sort before strings, strings before any
+    other value, and missing values sort last regardless of direction.
+
+    Args:
+        values (Sequence): `AttributeInstance` values of a `ContentInstance`
+            for the `SorterType`'s `AttributeTypes`.
+        kind_params (dict): The `SorterInstance`'s `kind_params`.
+
+    Returns:
+        A totally ordered key.
+    """
+    value = values[0] if values else None
+
+    if value is None:
+        return (1,)
+
+    if isinstance(value, numbers.Number) and not isinstance(value, complex):
+        key = (0, value)
+    elif isinstance(value, str):
+        key = (1, value)
+    else:
+        key = (2, repr(value))
+
+    if kind_params.get('descending'):
+        key = _Descending(key)
+
+    return (0, key)
+
+
+@functools.total_ordering
+class _Descending(object):
+    """
+    Wraps a sort key so that it orders in reverse.
+    """
+    __slots__ = ('key',)
+
+    def __init__(self, key):
+        self.key = key
+
+    def __eq__(self, other):
+        if not isinstance(other, _Descending):
+            return NotImplemented
+        return self.key == other.key
+
+    def __lt__(self, other):
+        if not isinstance(other, _Descending):
+            return NotImplemented
+        return other.key < self.key
+
+    def __hash__(self):
+        return hash(self.key)
@@ -77,6 +77,14 @@ class InvalidTransactionAction(TransactionError):
         self._invalid_action = invalid_action
 
 
+class InvalidBatchError(TransactionError):
+    """
+    Raised when a `Batch` cannot be processed as given, such as when the
+        members of a batch `Transaction` are not adjacent.
+    """
+    pass
+
+
 class DeserializerError(ElementalError):
     """
     Base class for Errors that relate to deserialization.
@@ -200,6 +208,21 @@ class InvalidHandlerKeyError(HandlerError):
     pass
 
 
+class StageError(ElementalError):
+    """
+    Base class for Errors relating to custom `Transaction` pipeline stages.
+    """
+    pass
+
+
+class InvalidStageKeyError(StageError):
+    """
+    Raised when values representing an `Action` and pipeline step cannot be
+        processed into a valid position for a stage.
+    """
+    pass
+
+
 class ResourceError(ElementalError):
     """
     Base class for Errors relating to Resources.
@@ -302,3 +325,17 @@ class ResourceIndexError(ElementalError):
 
 class ResourceIndexNotFoundError(ResourceIndexError):
     pass
+
+
+class TransactionLogError(ElementalError):
+    """
+    Raised when a `TransactionLog` cannot be written or replayed.
+    """
+    pass
+
+
+class ResourceStoreError(ElementalError):
+    """
+    Raised when a `ResourceStore` cannot be written or read.
+    """
+    pass
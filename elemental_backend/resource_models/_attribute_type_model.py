@@ -21,9 +21,6 @@ class AttributeTypeModel(ResourceModelBase):
         idx_at_sts = self._get_index(AttributeType, SorterType)
         idx_at_sts.push_index(resource)
 
-        raise RuntimeError('TODO: Add ViewInstanceModel hook')
-        # self._update_view_instance_content_instances()
-
         hook = resource.default_value_changed
         handler = self._handle_attribute_type_default_value_changed
         hook.add_handler(handler)
@@ -44,9 +41,6 @@ class AttributeTypeModel(ResourceModelBase):
         resolver = self._resolve_attribute_type_sorter_types
         ref.add_resolver(resource, resolver)
 
-    def retrieve(self, resource_id, resource=None):
-        return resource
-
     def release(self, resource):
         idx_at_fts = self._get_index(AttributeType, FilterType)
         idx_at_fts.pop_index(resource)
@@ -54,8 +48,8 @@ class AttributeTypeModel(ResourceModelBase):
         idx_at_sts = self._get_index(AttributeType, SorterType)
         idx_at_sts.pop_index(resource)
 
-        raise RuntimeError('TODO: Add ViewInstanceModel hook')
-        # self._update_view_instance_content_instances()
+        stale_state = self._get_stale_state()
+        stale_state.mark_dependents_stale(resource.id)
 
         hook = resource.default_value_changed
         handler = self._handle_attribute_type_default_value_changed
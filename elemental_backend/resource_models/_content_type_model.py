@@ -16,11 +16,8 @@ class ContentTypeModel(ResourceModelBase):
         idx_ct_vts = self._get_index(ContentType, ViewType)
         idx_ct_vts.push_index(resource)
 
-        raise RuntimeError('TODO: Add ViewTypeModel hook')
-        view_types = idx_ct_vts.iter_indexed_values(resource)
-        view_types = self._get_resources(view_types)
-        for view_type in view_types:
-            view_type.stale = True
+        stale_state = self._get_stale_state()
+        stale_state.mark_dependents_stale(resource.id)
 
         hook = resource.base_ids_changed
         handler = self._handle_content_type_base_ids_changed
@@ -38,18 +35,12 @@ class ContentTypeModel(ResourceModelBase):
         resolver = self._resolve_content_type_view_types
         ref.add_resolver(resource, resolver)
 
-    def retrieve(self, resource_id, resource=None):
-        return resource
-
     def release(self, resource):
         idx_ct_vts = self._get_index(ContentType, ViewType)
         idx_ct_vts.pop_index(resource)
 
-        raise RuntimeError('TODO: Add ViewTypeModel hook')
-        view_types = idx_ct_vts.iter_indexed_values(resource)
-        view_types = self._get_resources(view_types)
-        for view_type in view_types:
-            view_type.stale = True
+        stale_state = self._get_stale_state()
+        stale_state.mark_dependents_stale(resource.id)
 
         hook = resource.base_ids_changed
         handler = self._handle_content_type_base_ids_changed
@@ -66,10 +57,12 @@ class ContentTypeModel(ResourceModelBase):
         ref.remove_resolver(resource)
 
     def _handle_content_type_base_ids_changed(self, sender, data):
-        pass
+        stale_state = self._get_stale_state()
+        stale_state.mark_dependents_stale(sender.id)
 
     def _handle_content_type_attribute_type_ids_changed(self, sender, data):
-        pass
+        stale_state = self._get_stale_state()
+        stale_state.mark_dependents_stale(sender.id)
 
     def _resolve_content_type_view_types(self, content_type_id):
         idx_ct_vts = self._get_index(ContentType, ViewType)
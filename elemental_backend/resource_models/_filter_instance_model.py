@@ -14,16 +14,13 @@ _LOG = logging.getLogger(__name__)
 class FilterInstanceModel(ResourceModelBase):
     __resource_cls__ = FilterInstance
     __resource_indexes__ = (
-        ResourceIndex(FilterInstance, ViewInstance, indexed_capacity=1)
+        ResourceIndex(FilterInstance, ViewInstance, indexed_capacity=1),
     )
 
     def register(self, resource):
         idx_fi_vi = self._get_index(FilterInstance, ViewInstance)
         idx_fi_vi.push_index(resource)
 
-        raise RuntimeError('TODO: Add ViewInstanceModel hook')
-        # self._update_view_instance_content_instances()
-
         hook = resource.kind_params_changed
         handler = self._handler_filter_instance_kind_params_changed
         hook.add_handler(handler)
@@ -32,16 +29,10 @@ class FilterInstanceModel(ResourceModelBase):
         resolver = self._resolve_filter_instance_view_instance
         ref.add_resolver(resource, resolver)
 
-    def retrieve(self, resource_id, resource=None):
-        return resource
-
     def release(self, resource):
         idx_fi_vi = self._get_index(FilterInstance, ViewInstance)
         idx_fi_vi.pop_index(resource)
 
-        raise RuntimeError('TODO: Add ViewInstanceModel hook')
-        # self._update_view_instance_content_instances()
-
         hook = resource.kind_params_changed
         handler = self._handler_filter_instance_kind_params_changed
         hook.remove_handler(handler)
@@ -50,21 +41,14 @@ class FilterInstanceModel(ResourceModelBase):
         ref.remove_resolver(resource)
 
     def _handler_filter_instance_kind_params_changed(self, sender, event_data):
-        idx_fi_vi = self._get_index(FilterInstance, ViewInstance)
-
-        try:
-            view_inst_id = idx_fi_vi.get_indexed_value(sender)[0]
-        except IndexError:
-            return
-
-        raise RuntimeError('TODO: Add ViewInstanceModel hook')
-        # self._update_view_instance_content_instances(view_inst_id)
+        # ViewResultModel re-evaluates the affected ViewResults.
+        pass
 
     def _resolve_filter_instance_view_instance(self, filter_instance_id):
         idx_fi_vi = self._get_index(FilterInstance, ViewInstance)
 
         try:
-            result = idx_fi_vi.get_indexed_value(filter_instance_id)[0]
+            result = idx_fi_vi.get_indexed_values(filter_instance_id)[0]
         except IndexError:
             result = None
         else:
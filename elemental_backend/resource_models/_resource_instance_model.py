@@ -19,7 +19,7 @@ class ResourceInstanceModel(ResourceModelBase):
 
     def register(self, resource):
         idx_rt_ris = self._get_index(ResourceType, ResourceInstance)
-        idx_rt_ris.push_index_value(resource.type_id, resource)
+        idx_rt_ris.push_indexed_value(resource.type_id, resource)
 
         hook = resource.type_id_changed
         handler = self._handle_resource_instance_type_id_changed
@@ -29,12 +29,9 @@ class ResourceInstanceModel(ResourceModelBase):
         resolver = self._get_resource
         ref.add_resolver(resource, resolver)
 
-    def retrieve(self, resource_id, resource=None):
-        return resource
-
     def release(self, resource):
         idx_rt_ris = self._get_index(ResourceType, ResourceInstance)
-        idx_rt_ris.pop_index_value(resource.type_id, resource)
+        idx_rt_ris.pop_indexed_value(resource.type_id, resource)
 
         hook = resource.type_id_changed
         handler = self._handle_resource_instance_type_id_changed
@@ -47,4 +44,4 @@ class ResourceInstanceModel(ResourceModelBase):
         original_value, current_value = data
 
         idx_rt_ris = self._get_index(ResourceType, ResourceInstance)
-        idx_rt_ris.move_index_value(sender.id, original_value, current_value)
+        idx_rt_ris.move_indexed_value(sender, original_value, current_value)
@@ -1,6 +1,4 @@
 import logging
-from typing import Union
-from uuid import UUID
 
 from .._resource_model_base import ResourceModelBase
 from ..resources import Resource
@@ -22,11 +20,6 @@ class ResourceModel(ResourceModelBase):
         handler = self._handle_resource_id_changed
         hook.add_handler(handler)
 
-    def retrieve(self,
-                 resource_id: UUID,
-                 resource: Union[None, Resource] = None):
-        return resource
-
     def release(self,
                 resource: Resource):
         hook = resource.id_changed
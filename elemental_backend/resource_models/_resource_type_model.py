@@ -19,7 +19,7 @@ class ResourceTypeModel(ResourceModelBase):
 
     def register(self, resource):
         idx_rt_ris = self._get_index(ResourceType, ResourceInstance)
-        idx_rt_ris.create_index(resource)
+        idx_rt_ris.push_index(resource)
 
         hook = resource.name_changed
         handler = self._handle_resource_type_name_changed
@@ -29,9 +29,6 @@ class ResourceTypeModel(ResourceModelBase):
         resolver = self._resolve_resource_type_resource_instances
         ref.add_resolver(resource, resolver)
 
-    def retrieve(self, resource_id, resource=None):
-        return resource
-
     def release(self, resource):
         idx_rt_ris = self._get_index(ResourceType, ResourceInstance)
         idx_rt_ris.pop_index(resource)
@@ -49,7 +46,7 @@ class ResourceTypeModel(ResourceModelBase):
     def _resolve_resource_type_resource_instances(self, resource_type_id):
         idx_rt_ris = self._get_index(ResourceType, ResourceInstance)
 
-        result = idx_rt_ris.iter_index_values(resource_type_id)
+        result = idx_rt_ris.iter_indexed_values(resource_type_id)
         result = self._get_resources(result)
 
         return result
@@ -14,17 +14,18 @@ _LOG = logging.getLogger(__name__)
 class SorterTypeModel(ResourceModelBase):
     __resource_cls__ = SorterType
     __resource_indexes__ = (
-        ResourceIndex(AttributeType, SorterType)
+        ResourceIndex(AttributeType, SorterType),
     )
 
     def register(self, resource):
         idx_at_sts = self._get_index(AttributeType, SorterType)
 
         for attribute_type_id in resource.attribute_type_ids:
-            idx_at_sts.push_index_value(attribute_type_id, resource)
+            idx_at_sts.push_indexed_value(attribute_type_id, resource)
 
-        raise RuntimeError('TODO: Add ViewInstance Hook.')
-        # self._update_view_instance_content_instances()
+        stale_state = self._get_stale_state()
+        for attribute_type_id in resource.attribute_type_ids:
+            stale_state.push_dependency(attribute_type_id, resource.id)
 
         hook = resource.attribute_type_ids_changed
         handler = self._handle_sorter_type_attribute_type_ids_changed
@@ -34,17 +35,14 @@ class SorterTypeModel(ResourceModelBase):
         resolver = self._get_resources
         ref.add_resolver(resource, resolver)
 
-    def retrieve(self, resource_id, resource=None):
-        return resource
-
     def release(self, resource):
         idx_at_sts = self._get_index(AttributeType, SorterType)
 
         for attribute_type_id in resource.attribute_type_ids:
-            idx_at_sts.pop_index_value(attribute_type_id, resource)
+            idx_at_sts.pop_indexed_value(attribute_type_id, resource)
 
-        raise RuntimeError('TODO: Add ViewInstance Hook.')
-        # self._update_view_instance_content_instances()
+        stale_state = self._get_stale_state()
+        stale_state.mark_dependents_stale(resource.id)
 
         hook = resource.attribute_type_ids_changed
         handler = self._handle_sorter_type_attribute_type_ids_changed
@@ -62,14 +60,14 @@ class SorterTypeModel(ResourceModelBase):
         idx_at_sts = self._get_index(AttributeType, SorterType)
 
         for attribute_type_id in removed_attr_type_ids:
-            idx_at_sts.pop_index_value(attribute_type_id, sender)
+            idx_at_sts.pop_indexed_value(attribute_type_id, sender)
 
         for attribute_type_id in added_attr_type_ids:
-            idx_at_sts.push_index_value(attribute_type_id, sender)
-
-        raise RuntimeError('TODO: Add ViewInstance Hook.')
-        map_rt_ri = self._map__resource_type__resource_instances
-        map_si_vi = self._map__sorter_instance__view_instance
-        for sorter_inst_id in map_rt_ri[sender.id]:
-            view_inst_id = map_si_vi[sorter_inst_id]
-            # self._update_view_instance_content_instances(view_inst_id)
\ No newline at end of file
+            idx_at_sts.push_indexed_value(attribute_type_id, sender)
+
+        stale_state = self._get_stale_state()
+        for attribute_type_id in removed_attr_type_ids:
+            stale_state.pop_dependency(attribute_type_id, sender.id)
+        for attribute_type_id in added_attr_type_ids:
+            stale_state.push_dependency(attribute_type_id, sender.id)
+        stale_state.mark_dependents_stale(sender.id)
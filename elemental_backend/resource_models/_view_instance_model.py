@@ -23,12 +23,16 @@ class ViewInstanceModel(ResourceModelBase):
 
     def register(self, resource):
         idx_fi_vi = self._get_index(FilterInstance, ViewInstance)
-
         for filter_instance_id in resource.filter_ids:
-            idx_fi_vi.push_index_value(filter_instance_id, resource)
+            idx_fi_vi.push_indexed_value(filter_instance_id, resource)
+
+        idx_si_vi = self._get_index(SorterInstance, ViewInstance)
+        for sorter_instance_id in resource.sorter_ids:
+            idx_si_vi.push_indexed_value(sorter_instance_id, resource)
 
-        map_vr_vi = self._map__view_result__view_instance
-        map_vr_vi[resource.result_id] = resource.id
+        if resource.result_id:
+            idx_vr_vi = self._get_index(ViewResult, ViewInstance)
+            idx_vr_vi.push_indexed_value(resource.result_id, resource)
 
         hook = resource.filter_ids_changed
         handler = self._handle_view_instance_filter_ids_changed
@@ -54,10 +58,19 @@ class ViewInstanceModel(ResourceModelBase):
         resolver = self._get_resource
         ref.add_resolver(resource, resolver)
 
-    def retrieve(self, resource_id, resource=None):
-        return resource
-
     def release(self, resource):
+        idx_fi_vi = self._get_index(FilterInstance, ViewInstance)
+        for filter_instance_id in resource.filter_ids:
+            idx_fi_vi.pop_indexed_value(filter_instance_id, resource)
+
+        idx_si_vi = self._get_index(SorterInstance, ViewInstance)
+        for sorter_instance_id in resource.sorter_ids:
+            idx_si_vi.pop_indexed_value(sorter_instance_id, resource)
+
+        if resource.result_id:
+            idx_vr_vi = self._get_index(ViewResult, ViewInstance)
+            idx_vr_vi.pop_indexed_value(resource.result_id, resource)
+
         hook = resource.filter_ids_changed
         handler = self._handle_view_instance_filter_ids_changed
         hook.remove_handler(handler)
@@ -87,13 +100,10 @@ class ViewInstanceModel(ResourceModelBase):
         idx_fi_vi = self._get_index(FilterInstance, ViewInstance)
 
         for filter_instance_id in removed_filter_instance_ids:
-            idx_fi_vi.pop_index_value(filter_instance_id, sender)
+            idx_fi_vi.pop_indexed_value(filter_instance_id, sender)
 
         for filter_instance_id in added_filter_instance_ids:
-            idx_fi_vi.push_index_value(filter_instance_id, sender)
-
-        raise RuntimeError('TODO: Add ViewInstance Hook.')
-        # self._update_view_instance_content_instances(sender.id)
+            idx_fi_vi.push_indexed_value(filter_instance_id, sender)
 
     def _handle_view_instance_sorter_ids_changed(self, sender, event_data):
         original_value, current_value = event_data
@@ -103,16 +113,16 @@ class ViewInstanceModel(ResourceModelBase):
         idx_si_vi = self._get_index(SorterInstance, ViewInstance)
 
         for sorter_instance_id in removed_sorter_instance_ids:
-            idx_si_vi.pop_index_value(sorter_instance_id, sender)
+            idx_si_vi.pop_indexed_value(sorter_instance_id, sender)
 
         for sorter_instance_id in added_sorter_instance_ids:
-            idx_si_vi.push_index_value(sorter_instance_id, sender)
-
-        raise RuntimeError('TODO: Add ViewInstance Hook.')
-        # self._update_view_instance_content_instances(sender.id)
+            idx_si_vi.push_indexed_value(sorter_instance_id, sender)
 
     def _handle_view_instance_result_id_changed(self, sender, event_data):
         original_value, current_value = event_data
 
-        raise RuntimeError('TODO: Add ViewInstance Hook.')
-        # self._update_view_instance_content_instances(sender.id)
\ No newline at end of file
+        idx_vr_vi = self._get_index(ViewResult, ViewInstance)
+        if original_value:
+            idx_vr_vi.pop_indexed_value(original_value, sender)
+        if current_value:
+            idx_vr_vi.push_indexed_value(current_value, sender)
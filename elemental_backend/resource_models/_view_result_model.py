@@ -1,13 +1,32 @@
+import bisect
+import heapq
+import itertools
 import logging
-import collections
+from weakref import WeakKeyDictionary
 
 from elemental_core import NO_VALUE
 
 from .._resource_model_base import ResourceModelBase
 from .._resource_index import ResourceIndex
+from .._attribute_value_index import AttributeValueIndex
+from .._view_evaluation import (
+    compile_filter_params,
+    match_filter_values,
+    match_filter_column,
+    compute_sort_key
+)
 from ..resources import (
     ViewResult,
-    ViewInstance
+    ViewInstance,
+    ViewType,
+    ContentType,
+    ContentInstance,
+    ResourceType,
+    ResourceInstance,
+    FilterType,
+    FilterInstance,
+    SorterInstance,
+    AttributeInstance
 )
 
 
@@ -15,15 +34,63 @@ _LOG = logging.getLogger(__name__)
 
 
 class ViewResultModel(ResourceModelBase):
+    """
+    Maintains the `ContentInstances` referenced by each `ViewResult`.
+
+    Results are maintained incrementally: each `ViewResult` keeps a sorted
+    list of (sort key, `ContentInstance` id) entries. A registered, released
+    or modified `ContentInstance` or `AttributeInstance` only re-evaluates the
+    affected `ContentInstances` against the `ViewInstances` whose `ViewType`
+    pools them. A `ViewResult` is only fully rebuilt when the
+    `FilterInstances` or `SorterInstances` of its `ViewInstance` change.
+
+    Re-evaluation is lazy. Changes only mark the affected `ViewResults`
+    stale, recording the `ContentInstances` to re-evaluate. The work is done
+    when the `ViewResult` is next retrieved from the `Model` or read through
+    its `content_instances` reference.
+
+    Rebuilds answer equality, range and prefix `FilterInstances` from an
+    `AttributeValueIndex` per `FilterType`. An index is built the first time
+    a rebuild can use it, and is then kept up to date as `AttributeInstances`
+    change.
+
+    A `ViewInstance` with a `limit` pages its `ViewResult`. Only the first
+    `offset` + `limit` entries are kept sorted, selected with a heap when the
+    `ViewResult` is rebuilt, while the sort keys of every accepted
+    `ContentInstance` are kept to refill the page as entries leave it.
+
+    The composite sort key of each `ContentInstance` is cached per
+    `ViewResult` for its `ViewInstance's` current `SorterInstances`, so
+    rebuilds caused by `FilterInstance` changes reuse them. A cached key is
+    dropped when its `ContentInstance` is re-evaluated, and the whole cache
+    when the `SorterInstances` or their params change.
+    """
     __resource_cls__ = ViewResult
     __resource_indexes__ = (
-        ResourceIndex(ViewResult, ViewInstance, indexed_capacity=1)
+        ResourceIndex(ViewResult, ViewInstance, indexed_capacity=1),
     )
 
+    def __init__(self, resources_ref, resource_indexes_ref, stale_state_ref):
+        super(ViewResultModel, self).__init__(
+            resources_ref, resource_indexes_ref, stale_state_ref)
+
+        self._map__view_result__entries = WeakKeyDictionary()
+        self._map__view_result__content_instance_keys = WeakKeyDictionary()
+        self._map__view_result__window = WeakKeyDictionary()
+        self._map__view_result__sort_keys = WeakKeyDictionary()
+        self._map__view_result__sorters = WeakKeyDictionary()
+        self._map__content_instance__view_results = WeakKeyDictionary()
+        self._map__filter_type__value_index = WeakKeyDictionary()
+
     def register(self, resource):
         idx_vr_vi = self._get_index(ViewResult, ViewInstance)
         idx_vr_vi.push_index(resource)
 
+        self._map__view_result__entries[resource.id] = []
+        self._map__view_result__content_instance_keys[resource.id] = {}
+        self._map__view_result__window[resource.id] = (0, None)
+        self._map__view_result__sort_keys[resource.id] = {}
+
         hook = resource.content_instance_ids_changed
         handler = self._handle_view_result_content_instance_ids_changed
         hook.add_handler(handler)
@@ -33,20 +100,26 @@ class ViewResultModel(ResourceModelBase):
         ref.add_resolver(resource, resolver)
 
         ref = type(resource).content_instances
-        resolver = self._get_resources
+        resolver = self._resolve_view_result_content_instances
         ref.add_resolver(resource, resolver)
 
     def retrieve(self, resource_id, resource=None):
-        result = resource
-
-        self._update_view_result_content_instances(resource.id)
+        if resource is not None:
+            self._refresh_view_result(resource)
 
-        return result
+        return resource
 
     def release(self, resource):
         idx_vr_vi = self._get_index(ViewResult, ViewInstance)
         idx_vr_vi.pop_index(resource)
 
+        self._clear_view_result_entries(resource.id)
+        self._map__view_result__entries.pop(resource.id, None)
+        self._map__view_result__content_instance_keys.pop(resource.id, None)
+        self._map__view_result__window.pop(resource.id, None)
+        self._map__view_result__sort_keys.pop(resource.id, None)
+        self._map__view_result__sorters.pop(resource.id, None)
+
         hook = resource.content_instance_ids_changed
         handler = self._handle_view_result_content_instance_ids_changed
         hook.remove_handler(handler)
@@ -65,7 +138,7 @@ class ViewResultModel(ResourceModelBase):
         idx_vr_vi = self._get_index(ViewResult, ViewInstance)
 
         try:
-            result = idx_vr_vi.get_indexed_value(view_result_id)[0]
+            result = idx_vr_vi.get_indexed_values(view_result_id)[0]
         except IndexError:
             result = NO_VALUE
         else:
@@ -73,78 +146,819 @@ class ViewResultModel(ResourceModelBase):
 
         return result
 
-    def _update_view_result_content_instances(
-            self, view_result_id, content_instance_ids=None,
-            filter_instance_ids=None, sorter_instance_ids=None):
+    def _resolve_view_result_content_instances(self, view_result_id):
+        view_result = self._get_resource(view_result_id)
+        if not view_result:
+            return NO_VALUE
+
+        self._refresh_view_result(view_result)
+
+        return self._get_resources(view_result.content_instance_ids)
+
+    def _handle_resource_registered(self, sender, data):
+        super(ViewResultModel, self)._handle_resource_registered(sender, data)
+
+        if isinstance(data, ViewResult):
+            self._invalidate_view_result(data)
+        elif isinstance(data, ViewInstance):
+            self._handle_view_instance_registered(data)
+        elif isinstance(data, (FilterInstance, SorterInstance)):
+            self._handle_criteria_instance_registered(data)
+        elif isinstance(data, ContentInstance):
+            self._handle_content_instance_registered(data)
+        elif isinstance(data, AttributeInstance):
+            self._handle_attribute_instance_registered(data)
+        elif isinstance(data, FilterType):
+            self._handle_filter_type_registered(data)
+
+    def _handle_resource_releasing(self, sender, data):
+        super(ViewResultModel, self)._handle_resource_releasing(sender, data)
+
+        # Handled before the release pops the index entries leading to the
+        # affected ViewResults.
+        if isinstance(data, (FilterInstance, SorterInstance)):
+            self._rebuild_criteria_instance_view_results(data)
+        elif isinstance(data, AttributeInstance):
+            self._update_attribute_instance_entries(data)
+
+    def _handle_resource_released(self, sender, data):
+        super(ViewResultModel, self)._handle_resource_released(sender, data)
+
+        if isinstance(data, ViewInstance):
+            self._handle_view_instance_released(data)
+        elif isinstance(data, (FilterInstance, SorterInstance)):
+            self._handle_criteria_instance_released(data)
+        elif isinstance(data, ContentInstance):
+            self._handle_content_instance_released(data)
+        elif isinstance(data, AttributeInstance):
+            self._handle_attribute_instance_released(data)
+        elif isinstance(data, FilterType):
+            self._handle_filter_type_released(data)
+
+    def _handle_view_instance_registered(self, view_instance):
+        hook = view_instance.filter_ids_changed
+        handler = self._handle_view_instance_criteria_ids_changed
+        hook.add_handler(handler)
+
+        hook = view_instance.sorter_ids_changed
+        handler = self._handle_view_instance_sorter_ids_changed
+        hook.add_handler(handler)
+
+        hook = view_instance.result_id_changed
+        handler = self._handle_view_instance_result_id_changed
+        hook.add_handler(handler)
+
+        hook = view_instance.limit_changed
+        handler = self._handle_view_instance_window_changed
+        hook.add_handler(handler)
+
+        hook = view_instance.offset_changed
+        handler = self._handle_view_instance_window_changed
+        hook.add_handler(handler)
+
+        view_result = self._get_resource(view_instance.result_id)
+        if view_result:
+            self._invalidate_view_result(view_result)
+
+    def _handle_view_instance_released(self, view_instance):
+        hook = view_instance.filter_ids_changed
+        handler = self._handle_view_instance_criteria_ids_changed
+        hook.remove_handler(handler)
+
+        hook = view_instance.sorter_ids_changed
+        handler = self._handle_view_instance_sorter_ids_changed
+        hook.remove_handler(handler)
+
+        hook = view_instance.result_id_changed
+        handler = self._handle_view_instance_result_id_changed
+        hook.remove_handler(handler)
+
+        hook = view_instance.limit_changed
+        handler = self._handle_view_instance_window_changed
+        hook.remove_handler(handler)
+
+        hook = view_instance.offset_changed
+        handler = self._handle_view_instance_window_changed
+        hook.remove_handler(handler)
+
+        view_result = self._get_resource(view_instance.result_id)
+        if view_result:
+            self._invalidate_view_result(view_result)
+
+    def _handle_view_instance_criteria_ids_changed(self, sender, event_data):
+        view_result = self._get_resource(sender.result_id)
+        if view_result:
+            self._invalidate_view_result(view_result)
+
+    def _handle_view_instance_sorter_ids_changed(self, sender, event_data):
+        view_result = self._get_resource(sender.result_id)
+        if view_result:
+            self._clear_view_result_sort_keys(view_result.id)
+            self._invalidate_view_result(view_result)
+
+    def _handle_view_instance_result_id_changed(self, sender, event_data):
+        original_value, current_value = event_data
+
+        for view_result_id in (original_value, current_value):
+            view_result = self._get_resource(view_result_id)
+            if view_result:
+                self._invalidate_view_result(view_result)
+
+    def _handle_view_instance_window_changed(self, sender, event_data):
         """
-        Computes the ContentInstances referenced by a ViewResult.
+        Moves a ViewResult to a new page without re-evaluating its pool.
 
-        A ViewResult references ContentInstances that match criteria defined
-        by FilterInstances that are managed by the ViewResult's corresponding
-        ViewInstance.
+        A smaller page is cut from the current entries. A larger one is
+        refilled from the kept sort keys when the ViewResult is next read,
+        as is one whose window was removed.
         """
-        view_result = self._resources.get(view_result_id)
+        view_result = self._get_resource(sender.result_id)
         if not view_result:
             return
 
-        view_instance = view_result.view_instance
-        if not view_instance:
+        window = self._compute_view_instance_window(sender)
+        self._map__view_result__window[view_result.id] = window
+
+        window_size = self._get_view_result_window_size(view_result.id)
+        if window_size is not None:
+            del self._map__view_result__entries[view_result.id][window_size:]
+
+        self._publish_view_result(view_result)
+
+        stale_state = self._get_stale_state()
+        stale_state.mark_dependents_stale(view_result.id)
+
+    def _handle_criteria_instance_registered(self, criteria_instance):
+        hook = criteria_instance.kind_params_changed
+        handler = self._handle_criteria_instance_kind_params_changed
+        hook.add_handler(handler)
+
+        self._rebuild_criteria_instance_view_results(criteria_instance)
+
+    def _handle_criteria_instance_released(self, criteria_instance):
+        hook = criteria_instance.kind_params_changed
+        handler = self._handle_criteria_instance_kind_params_changed
+        hook.remove_handler(handler)
+
+    def _handle_criteria_instance_kind_params_changed(
+            self, sender, event_data):
+        self._rebuild_criteria_instance_view_results(sender)
+
+    def _rebuild_criteria_instance_view_results(self, criteria_instance):
+        idx_ci_vi = self._get_index(type(criteria_instance), ViewInstance)
+
+        for view_instance_id in idx_ci_vi.get_indexed_values(criteria_instance):
+            view_instance = self._get_resource(view_instance_id)
+            if not view_instance:
+                continue
+
+            view_result = self._get_resource(view_instance.result_id)
+            if view_result:
+                if isinstance(criteria_instance, SorterInstance):
+                    self._clear_view_result_sort_keys(view_result.id)
+                self._invalidate_view_result(view_result)
+
+    def _handle_content_instance_registered(self, content_instance):
+        hook = content_instance.attribute_ids_changed
+        handler = self._handle_content_instance_attribute_ids_changed
+        hook.add_handler(handler)
+
+        for attribute_instance_id in content_instance.attribute_ids:
+            attribute_instance = self._get_resource(attribute_instance_id)
+            if attribute_instance:
+                self._push_attribute_value_indexes(attribute_instance,
+                                                   content_instance.id)
+
+        self._update_content_instance_entries(content_instance)
+
+    def _handle_content_instance_released(self, content_instance):
+        hook = content_instance.attribute_ids_changed
+        handler = self._handle_content_instance_attribute_ids_changed
+        hook.remove_handler(handler)
+
+        for attribute_instance_id in content_instance.attribute_ids:
+            self._pop_attribute_value_indexes(attribute_instance_id)
+
+        map_ci_vrs = self._map__content_instance__view_results
+        view_result_ids = map_ci_vrs.get(content_instance.id, ())
+
+        for view_result_id in tuple(view_result_ids):
+            view_result = self._get_resource(view_result_id)
+            if view_result:
+                self._invalidate_view_result_entry(
+                    view_result, content_instance.id)
+
+    def _handle_content_instance_attribute_ids_changed(
+            self, sender, event_data):
+        original_value, current_value = event_data
+
+        for attribute_instance_id in set(original_value).difference(
+                current_value):
+            self._pop_attribute_value_indexes(attribute_instance_id)
+
+        for attribute_instance_id in set(current_value).difference(
+                original_value):
+            attribute_instance = self._get_resource(attribute_instance_id)
+            if attribute_instance:
+                self._push_attribute_value_indexes(attribute_instance,
+                                                   sender.id)
+
+        self._update_content_instance_entries(sender)
+
+    def _handle_attribute_instance_registered(self, attribute_instance):
+        hook = attribute_instance.value_changed
+        handler = self._handle_attribute_instance_value_changed
+        hook.add_handler(handler)
+
+        self._update_attribute_value_indexes(attribute_instance)
+        self._update_attribute_instance_entries(attribute_instance)
+
+    def _handle_attribute_instance_released(self, attribute_instance):
+        hook = attribute_instance.value_changed
+        handler = self._handle_attribute_instance_value_changed
+        hook.remove_handler(handler)
+
+        self._pop_attribute_value_indexes(attribute_instance.id)
+
+    def _handle_attribute_instance_value_changed(self, sender, event_data):
+        self._update_attribute_value_indexes(sender)
+        self._update_attribute_instance_entries(sender)
+
+    def _handle_filter_type_registered(self, filter_type):
+        hook = filter_type.attribute_type_ids_changed
+        handler = self._handle_filter_type_attribute_type_ids_changed
+        hook.add_handler(handler)
+
+    def _handle_filter_type_released(self, filter_type):
+        hook = filter_type.attribute_type_ids_changed
+        handler = self._handle_filter_type_attribute_type_ids_changed
+        hook.remove_handler(handler)
+
+        self._map__filter_type__value_index.pop(filter_type.id, None)
+
+    def _handle_filter_type_attribute_type_ids_changed(
+            self, sender, event_data):
+        # Rebuilt for the new AttributeTypes the next time it is needed.
+        self._map__filter_type__value_index.pop(sender.id, None)
+
+    def _update_attribute_value_indexes(self, attribute_instance):
+        idx_ai_ci = self._get_index(AttributeInstance, ContentInstance)
+        content_instance_ids = idx_ai_ci.get_indexed_values(attribute_instance)
+
+        if content_instance_ids:
+            self._push_attribute_value_indexes(attribute_instance,
+                                               content_instance_ids[0])
+        else:
+            self._pop_attribute_value_indexes(attribute_instance.id)
+
+    def _push_attribute_value_indexes(self, attribute_instance,
+                                      content_instance_id):
+        if not self._map__filter_type__value_index:
             return
 
-        view_result_content_instance_ids = view_result.content_instance_ids.copy()
+        value = attribute_instance.value
+        if value is NO_VALUE:
+            value = None
 
-        if not content_instance_ids:
-            map_vt_cis = self._map__view_type__content_instances
-            content_instance_ids = map_vt_cis.get(view_instance.type_id, set())
+        for value_index in self._map__filter_type__value_index.values():
+            if attribute_instance.type_id in value_index.attribute_type_ids:
+                value_index.push_value(
+                    attribute_instance.id, content_instance_id, value)
 
-            # This intersection update accounts for when a ViewType no longer
-            # references a ContentType. The ContentInstance Ids of the discarded
-            # ContentType need to be purged from the ViewResult.
-            view_result_content_instance_ids.intersection_update(
-                content_instance_ids)
-        elif not isinstance(content_instance_ids, collections.Iterable):
-            content_instance_ids = [content_instance_ids]
+    def _pop_attribute_value_indexes(self, attribute_instance_id):
+        for value_index in self._map__filter_type__value_index.values():
+            value_index.pop_value(attribute_instance_id)
 
-        if filter_instance_ids:
-            if isinstance(filter_instance_ids, collections.Iterable):
-                filter_instances = self._resolve_resources(filter_instance_ids)
-            else:
-                try:
-                    filter_instances = self._resources[filter_instance_ids]
-                except KeyError:
-                    msg = 'Invalid value for filter_instance_ids: {0}'
-                    msg = msg.format(filter_instance_ids)
-
-                    _LOG.error(msg)
-                    raise ValueError(msg)
+    def _lookup_filter_value_index(self, filter_instance, predicate):
+        """
+        Answers a FilterInstance from its FilterType's AttributeValueIndex.
+
+        Returns:
+            Set of the ids of the ContentInstances matching the
+                FilterInstance, or `NO_VALUE` if the index cannot answer it.
+        """
+        kind_params = filter_instance.kind_params or {}
+        if not AttributeValueIndex.supports(kind_params):
+            return NO_VALUE
+
+        filter_type = self._get_resource(filter_instance.type_id)
+        if not filter_type:
+            return NO_VALUE
+
+        map_ft_vi = self._map__filter_type__value_index
+        try:
+            value_index = map_ft_vi[filter_type.id]
+        except KeyError:
+            value_index = self._build_filter_value_index(filter_type)
+            map_ft_vi[filter_type.id] = value_index
+
+        return value_index.lookup(kind_params, predicate)
+
+    def _build_filter_value_index(self, filter_type):
+        return AttributeValueIndex.build(
+            filter_type.attribute_type_ids,
+            self._iter_filter_value_items(filter_type.attribute_type_ids))
+
+    def _iter_filter_value_items(self, attribute_type_ids):
+        idx_rt_ris = self._get_index(ResourceType, ResourceInstance)
+        idx_ai_ci = self._get_index(AttributeInstance, ContentInstance)
+
+        for attribute_type_id in set(attribute_type_ids):
+            for attribute_instance_id in idx_rt_ris.iter_indexed_values(
+                    attribute_type_id):
+                attribute_instance = self._get_resource(attribute_instance_id)
+                if not attribute_instance:
+                    continue
+
+                content_instance_ids = idx_ai_ci.get_indexed_values(
+                    attribute_instance)
+                if not content_instance_ids:
+                    continue
+
+                yield (attribute_instance.id, content_instance_ids[0],
+                       attribute_instance.value)
+
+    def _update_attribute_instance_entries(self, attribute_instance):
+        idx_ai_ci = self._get_index(AttributeInstance, ContentInstance)
+
+        for content_instance_id in idx_ai_ci.get_indexed_values(
+                attribute_instance):
+            content_instance = self._get_resource(content_instance_id)
+            if content_instance:
+                self._update_content_instance_entries(content_instance)
+
+    def _update_content_instance_entries(self, content_instance):
+        """
+        Schedules a single ContentInstance for re-evaluation by every
+            ViewResult whose ViewInstance's ViewType pools its ContentType.
+        """
+        for view_instance in self._iter_pooling_view_instances(
+                content_instance):
+            view_result = self._get_resource(view_instance.result_id)
+            if view_result:
+                self._invalidate_view_result_entry(
+                    view_result, content_instance.id)
+
+    def _iter_pooling_view_instances(self, content_instance):
+        idx_ct_vts = self._get_index(ContentType, ViewType)
+        idx_rt_ris = self._get_index(ResourceType, ResourceInstance)
+
+        view_type_ids = idx_ct_vts.iter_indexed_values(content_instance.type_id)
+        for view_type_id in view_type_ids:
+            for view_instance_id in idx_rt_ris.iter_indexed_values(view_type_id):
+                view_instance = self._get_resource(view_instance_id)
+                if view_instance:
+                    yield view_instance
+
+    def _iter_view_instance_pool(self, view_instance):
+        view_type = self._get_resource(view_instance.type_id)
+        if not view_type:
+            return
+
+        idx_rt_ris = self._get_index(ResourceType, ResourceInstance)
+        for content_type_id in view_type.content_type_ids:
+            for content_instance_id in idx_rt_ris.iter_indexed_values(
+                    content_type_id):
+                content_instance = self._get_resource(content_instance_id)
+                if content_instance:
+                    yield content_instance
+
+    def _invalidate_view_result(self, view_result):
+        stale_state = self._get_stale_state()
+        stale_state.mark_stale(view_result)
+        stale_state.mark_dependents_stale(view_result.id)
+
+    def _invalidate_view_result_entry(self, view_result, content_instance_id):
+        # Dropped now, as a later full invalidation discards the details.
+        sort_keys = self._map__view_result__sort_keys.get(view_result.id)
+        if sort_keys:
+            sort_keys.pop(content_instance_id, None)
+
+        stale_state = self._get_stale_state()
+        stale_state.mark_stale(view_result, content_instance_id)
+        stale_state.mark_dependents_stale(view_result.id)
+
+    def _refresh_view_result(self, view_result):
+        """
+        Brings a stale ViewResult up to date.
+
+        ContentInstances recorded when the ViewResult was marked stale are
+        re-evaluated individually. Without such a record, the ViewResult is
+        rebuilt in full. A page left short by entries leaving it is then
+        refilled.
+        """
+        stale_state = self._get_stale_state()
+        content_instance_ids = stale_state.pop_stale(view_result)
+        if content_instance_ids is None:
+            self._rebuild_view_result(view_result)
+            return
+
+        changed = False
+
+        if content_instance_ids is not NO_VALUE:
+            view_instance = self._resolve_view_result_view_instance(
+                view_result.id)
+            if not view_instance:
+                self._rebuild_view_result(view_result)
+                return
+
+            criteria = self._compute_view_instance_criteria(view_instance)
+
+            for content_instance_id in content_instance_ids:
+                content_instance = self._get_resource(content_instance_id)
+                if content_instance:
+                    changed |= self._update_view_result_entry(
+                        view_result, content_instance, criteria)
                 else:
-                    filter_instances = [filter_instances]
+                    changed |= self._discard_view_result_entry(
+                        view_result.id, content_instance_id)
+
+        changed |= self._fill_view_result_entries(view_result.id)
+
+        if changed:
+            self._publish_view_result(view_result)
+
+    def _rebuild_view_result(self, view_result):
+        """
+        Recomputes every entry of a ViewResult from its ViewType's pool.
+        """
+        self._clear_view_result_entries(view_result.id)
+
+        stale_state = self._get_stale_state()
+        stale_state.pop_dependent(view_result.id)
+
+        view_instance = self._resolve_view_result_view_instance(
+            view_result.id)
+
+        window = self._compute_view_instance_window(view_instance)
+        self._map__view_result__window[view_result.id] = window
+
+        if view_instance:
+            # Changes to the ViewType's pool, or to the AttributeTypes its
+            # FilterTypes and SorterTypes read, are picked up on the next read.
+            stale_state.push_dependency(view_instance.type_id, view_result.id)
+            for criteria_instance_id in itertools.chain(
+                    view_instance.filter_ids, view_instance.sorter_ids):
+                criteria_instance = self._get_resource(criteria_instance_id)
+                if criteria_instance:
+                    stale_state.push_dependency(
+                        criteria_instance.type_id, view_result.id)
+
+            entries = self._map__view_result__entries[view_result.id]
+            keys = self._map__view_result__content_instance_keys[view_result.id]
+            map_ci_vrs = self._map__content_instance__view_results
+
+            filters, sorters = self._compute_view_instance_criteria(
+                view_instance)
+            sort_keys = self._get_view_result_sort_keys(view_result.id,
+                                                        sorters)
+
+            content_instances = list(
+                self._iter_view_instance_pool(view_instance))
+            evaluated = self._evaluate_content_instance_pool(
+                content_instances, filters, sorters, sort_keys)
+            for content_instance, sort_key in evaluated:
+                keys[content_instance.id] = sort_key
+                map_ci_vrs.setdefault(content_instance.id, set()).add(
+                    view_result.id)
+
+            # Only accepted ContentInstances keep their cached keys.
+            sort_keys.clear()
+            sort_keys.update(keys)
+
+            entries[:] = self._select_view_result_entries(
+                keys, self._get_view_result_window_size(view_result.id))
+
+        self._publish_view_result(view_result)
+
+    def _clear_view_result_entries(self, view_result_id):
+        try:
+            keys = self._map__view_result__content_instance_keys[view_result_id]
+        except KeyError:
+            return
+
+        map_ci_vrs = self._map__content_instance__view_results
+        for content_instance_id in keys:
+            try:
+                map_ci_vrs[content_instance_id].discard(view_result_id)
+            except KeyError:
+                pass
+
+        keys.clear()
+        del self._map__view_result__entries[view_result_id][:]
+
+    def _update_view_result_entry(self, view_result, content_instance,
+                                  criteria):
+        """
+        Inserts, moves or removes a single ContentInstance's entry.
+
+        Returns:
+            bool: True if the ViewResult's entries changed.
+        """
+        sort_key = self._evaluate_content_instance(content_instance, *criteria)
+
+        sort_keys = self._map__view_result__sort_keys[view_result.id]
+        if sort_key is NO_VALUE:
+            sort_keys.pop(content_instance.id, None)
         else:
-            filter_instances = view_instance.filter_instances
+            sort_keys[content_instance.id] = sort_key
 
-        if sorter_instance_ids:
-            if isinstance(sorter_instance_ids, collections.Iterable):
-                sorter_instances = self._resolve_resources(sorter_instance_ids)
-            else:
-                try:
-                    sorter_instances = self._resources[sorter_instance_ids]
-                except KeyError:
-                    msg = 'Invalid value for sorter_instance_ids: {0}'
-                    msg = msg.format(sorter_instance_ids)
-
-                    _LOG.error(msg)
-                    raise ValueError(msg)
-                else:
-                    sorter_instances = [sorter_instances]
+        keys = self._map__view_result__content_instance_keys[view_result.id]
+        original_key = keys.get(content_instance.id, NO_VALUE)
+        if sort_key is NO_VALUE and original_key is NO_VALUE:
+            return False
+        elif (sort_key is not NO_VALUE and original_key is not NO_VALUE and
+              sort_key == original_key):
+            return False
+
+        if original_key is not NO_VALUE:
+            self._discard_view_result_entry(view_result.id, content_instance.id)
+
+        if sort_key is not NO_VALUE:
+            entries = self._map__view_result__entries[view_result.id]
+            entry = (sort_key, content_instance.id)
+
+            # Entries outside a full page are only recorded in the keys, to
+            # be picked up if the page is refilled.
+            if len(entries) == len(keys) or (entries and entry < entries[-1]):
+                bisect.insort(entries, entry)
+
+                window_size = self._get_view_result_window_size(
+                    view_result.id)
+                if window_size is not None:
+                    del entries[window_size:]
+
+            keys[content_instance.id] = sort_key
+            # Discarding the original entry also dropped its cached key.
+            sort_keys[content_instance.id] = sort_key
+
+            map_ci_vrs = self._map__content_instance__view_results
+            map_ci_vrs.setdefault(content_instance.id, set()).add(
+                view_result.id)
+
+        return True
+
+    def _discard_view_result_entry(self, view_result_id, content_instance_id):
+        self._map__view_result__sort_keys[view_result_id].pop(
+            content_instance_id, None)
+
+        try:
+            keys = self._map__view_result__content_instance_keys[view_result_id]
+            sort_key = keys.pop(content_instance_id)
+        except KeyError:
+            return False
+
+        entries = self._map__view_result__entries[view_result_id]
+        entry = (sort_key, content_instance_id)
+        entry_idx = bisect.bisect_left(entries, entry)
+        if entry_idx < len(entries) and entries[entry_idx] == entry:
+            del entries[entry_idx]
+
+        try:
+            self._map__content_instance__view_results[
+                content_instance_id].discard(view_result_id)
+        except KeyError:
+            pass
+
+        return True
+
+    def _get_view_result_sort_keys(self, view_result_id, sorters):
+        """
+        Returns:
+            The ViewResult's cache of composite sort keys by ContentInstance
+                id, emptied first if `sorters` differ from those the keys
+                were computed with.
+        """
+        result = self._map__view_result__sort_keys[view_result_id]
+
+        # Copied, as kind params are compared with those seen on the next
+        # rebuild.
+        sorters = [(attribute_type_ids, dict(kind_params))
+                   for attribute_type_ids, kind_params in sorters]
+        if self._map__view_result__sorters.get(view_result_id) != sorters:
+            result.clear()
+            self._map__view_result__sorters[view_result_id] = sorters
+
+        return result
+
+    def _clear_view_result_sort_keys(self, view_result_id):
+        try:
+            self._map__view_result__sort_keys[view_result_id].clear()
+        except KeyError:
+            pass
+
+    def _fill_view_result_entries(self, view_result_id):
+        """
+        Refills a page left short by entries leaving it, or by its window
+        being widened or removed.
+
+        Returns:
+            bool: True if the ViewResult's entries changed.
+        """
+        entries = self._map__view_result__entries[view_result_id]
+        keys = self._map__view_result__content_instance_keys[view_result_id]
+
+        window_size = self._get_view_result_window_size(view_result_id)
+        if window_size is None:
+            if len(entries) >= len(keys):
+                return False
+        elif len(entries) >= min(window_size, len(keys)):
+            return False
+
+        entries[:] = self._select_view_result_entries(keys, window_size)
+
+        return True
+
+    def _select_view_result_entries(self, keys, window_size):
+        """
+        Returns:
+            Sorted list of the first `window_size` (sort key, ContentInstance
+                id) entries, or of every entry if `window_size` is None.
+        """
+        entries = ((sort_key, content_instance_id)
+                   for content_instance_id, sort_key in keys.items())
+
+        if window_size is None:
+            return sorted(entries)
+
+        return heapq.nsmallest(window_size, entries)
+
+    def _compute_view_instance_window(self, view_instance):
+        """
+        Returns:
+            (offset, limit) of the page a ViewInstance's ViewResult holds.
+        """
+        if not view_instance:
+            return 0, None
+
+        return view_instance.offset, view_instance.limit
+
+    def _get_view_result_window_size(self, view_result_id):
+        """
+        Returns:
+            Number of entries kept sorted for a ViewResult, or None to keep
+                every entry sorted.
+        """
+        offset, limit = self._map__view_result__window.get(
+            view_result_id, (0, None))
+        if limit is None:
+            return None
+
+        return offset + limit
+
+    def _publish_view_result(self, view_result):
+        entries = self._map__view_result__entries.get(view_result.id, ())
+        offset, _ = self._map__view_result__window.get(
+            view_result.id, (0, None))
+        view_result.content_instance_ids = [
+            content_instance_id for _, content_instance_id in entries[offset:]]
+
+    def _compute_view_instance_criteria(self, view_instance):
+        """
+        Resolves a ViewInstance's FilterInstances to (AttributeType ids,
+            compiled filter, FilterInstance) and its SorterInstances to
+            (AttributeType ids, kind params) pairs.
+
+        Unregistered criteria are skipped.
+        """
+        filters = []
+        for filter_instance_id in view_instance.filter_ids:
+            filter_instance = self._get_resource(filter_instance_id)
+            if filter_instance:
+                attribute_type_ids, kind_params = self._compute_criteria(
+                    filter_instance)
+                predicate = compile_filter_params(kind_params)
+                filters.append((attribute_type_ids, predicate, filter_instance))
+
+        sorters = []
+        for sorter_instance_id in view_instance.sorter_ids:
+            sorter_instance = self._get_resource(sorter_instance_id)
+            if sorter_instance:
+                sorters.append(self._compute_criteria(sorter_instance))
+
+        return filters, sorters
+
+    def _compute_criteria(self, criteria_instance):
+        criteria_type = self._get_resource(criteria_instance.type_id)
+        if criteria_type:
+            attribute_type_ids = frozenset(criteria_type.attribute_type_ids)
         else:
-            sorter_instances = view_instance.sorter_instances
+            attribute_type_ids = frozenset()
+
+        kind_params = criteria_instance.kind_params or {}
+
+        return attribute_type_ids, kind_params
 
-        adds, discards = self._apply_filters(content_instance_ids,
-                                             filter_instances)
-        view_result_content_instance_ids.difference_update(discards)
-        view_result_content_instance_ids.update(adds)
+    def _evaluate_content_instance(self, content_instance, filters, sorters):
+        """
+        Returns:
+            The ContentInstance's sort key, or `NO_VALUE` if it is rejected
+                by a FilterInstance.
+        """
+        for attribute_type_ids, predicate, _ in filters:
+            values = self._get_attribute_values(content_instance,
+                                                attribute_type_ids)
+            if not match_filter_values(values, predicate):
+                return NO_VALUE
+
+        result = []
+        for attribute_type_ids, kind_params in sorters:
+            values = self._get_attribute_values(content_instance,
+                                                attribute_type_ids)
+            result.append(compute_sort_key(values, kind_params))
+
+        return tuple(result)
+
+    def _evaluate_content_instance_pool(self, content_instances, filters,
+                                        sorters, sort_keys=None):
+        """
+        Evaluates a pool of ContentInstances one FilterInstance at a time.
 
-        view_result_content_instance_ids = self._apply_sorters(
-            view_result_content_instance_ids, sorter_instances)
+        FilterInstances answerable by an AttributeValueIndex narrow the pool
+        first. AttributeInstance values are then gathered once per remaining
+        ContentInstance, each other FilterInstance is evaluated over every
+        remaining ContentInstance at once, and only those passing every
+        filter are given sort keys. Sort keys found in `sort_keys` are reused
+        rather than computed.
 
-        view_result.content_instance_ids = view_result_content_instance_ids
+        Yields:
+            (ContentInstance, sort key) for each accepted ContentInstance.
+        """
+        scanned_filters = []
+        for attribute_type_ids, predicate, filter_instance in filters:
+            if predicate is None:
+                continue
+
+            content_instance_ids = self._lookup_filter_value_index(
+                filter_instance, predicate)
+            if content_instance_ids is NO_VALUE:
+                scanned_filters.append((attribute_type_ids, predicate))
+            else:
+                content_instances = [
+                    content_instance for content_instance in content_instances
+                    if content_instance.id in content_instance_ids]
+
+        if sort_keys is None:
+            sort_keys = {}
+
+        attribute_type_ids = set()
+        for criteria_attribute_type_ids, _ in scanned_filters:
+            attribute_type_ids.update(criteria_attribute_type_ids)
+
+        rows = [self._get_attribute_items(content_instance, attribute_type_ids)
+                for content_instance in content_instances]
+        row_idxs = range(len(rows))
+
+        # Sorter values are only gathered for ContentInstances without a
+        # cached sort key.
+        sorters_attribute_type_ids = set()
+        for criteria_attribute_type_ids, _ in sorters:
+            sorters_attribute_type_ids.update(criteria_attribute_type_ids)
+
+        for filter_attribute_type_ids, predicate in scanned_filters:
+            column = [
+                [value for type_id, value in rows[row_idx]
+                 if type_id in filter_attribute_type_ids]
+                for row_idx in row_idxs]
+            mask = match_filter_column(column, predicate)
+            row_idxs = list(itertools.compress(row_idxs, mask))
+
+        for row_idx in row_idxs:
+            content_instance = content_instances[row_idx]
+            try:
+                sort_key = sort_keys[content_instance.id]
+            except KeyError:
+                row = self._get_attribute_items(content_instance,
+                                                sorters_attribute_type_ids)
+                sort_key = tuple(
+                    compute_sort_key(
+                        [value for type_id, value in row
+                         if type_id in sorter_attribute_type_ids],
+                        kind_params)
+                    for sorter_attribute_type_ids, kind_params in sorters)
+
+            yield content_instance, sort_key
+
+    def _get_attribute_values(self, content_instance, attribute_type_ids):
+        items = self._get_attribute_items(content_instance, attribute_type_ids)
+        return [value for _, value in items]
+
+    def _get_attribute_items(self, content_instance, attribute_type_ids):
+        """
+        Returns:
+            List of (AttributeType id, value) for each of the
+                ContentInstance's AttributeInstances of `attribute_type_ids`.
+        """
+        result = []
+
+        for attribute_id in content_instance.attribute_ids:
+            attribute = self._get_resource(attribute_id)
+            if not attribute or attribute.type_id not in attribute_type_ids:
+                continue
+
+            value = attribute.value
+            if value is NO_VALUE:
+                value = None
+            result.append((attribute.type_id, value))
+
+        return result
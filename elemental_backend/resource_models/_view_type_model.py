@@ -1,5 +1,7 @@
 import logging
 
+from elemental_core import NO_VALUE
+
 from .._resource_model_base import ResourceModelBase
 from .._resource_index import ResourceIndex
 from ..resources import (
@@ -17,18 +19,22 @@ _LOG = logging.getLogger(__name__)
 class ViewTypeModel(ResourceModelBase):
     __resource_cls__ = ViewType
     __resource_indexes__ = (
-        ResourceIndex(ViewType, ContentInstance),
+        ResourceIndex(ViewType, ContentInstance, bidirectional=True),
         ResourceIndex(ContentType, ViewType),
         ResourceIndex(ContentType, ContentInstance)
     )
 
     def register(self, resource):
         idx_vt_cis = self._get_index(ViewType, ContentInstance)
-        idx_vt_cis.create_index(resource)
+        idx_vt_cis.push_index(resource)
 
         self._populate_content_type_view_types_index(resource)
         self._populate_view_type_content_instances_index(resource)
 
+        stale_state = self._get_stale_state()
+        for content_type_id in resource.content_type_ids:
+            stale_state.push_dependency(content_type_id, resource.id)
+
         hook = resource.content_type_ids_changed
         handler = self._handle_view_type_content_type_ids_changed
         hook.add_handler(handler)
@@ -57,16 +63,16 @@ class ViewTypeModel(ResourceModelBase):
         resolver = self._resolve_view_type_content_instances
         ref.add_resolver(resource, resolver)
 
-    def retrieve(self, resource_id, resource=None):
-        return resource
-
     def release(self, resource):
         idx_vt_cis = self._get_index(ViewType, ContentInstance)
         idx_vt_cis.pop_index(resource)
 
         idx_ct_vts = self._get_index(ContentType, ViewType)
         for content_type_id in resource.content_type_ids:
-            idx_ct_vts.pop_index_value(content_type_id, resource)
+            idx_ct_vts.pop_indexed_value(content_type_id, resource)
+
+        stale_state = self._get_stale_state()
+        stale_state.mark_dependents_stale(resource.id)
 
         hook = resource.content_type_ids_changed
         handler = self._handle_view_type_content_type_ids_changed
@@ -92,17 +98,50 @@ class ViewTypeModel(ResourceModelBase):
         ref = type(resource).content_instances
         ref.remove_resolver(resource)
 
+    def _handle_view_type_content_type_ids_changed(
+            self, sender, event_data):
+        original_value, current_value = event_data
+        added_content_type_ids = set(current_value).difference(original_value)
+        removed_content_type_ids = set(original_value).difference(current_value)
+
+        idx_ct_vts = self._get_index(ContentType, ViewType)
+        idx_rt_ri = self._get_index(ResourceType, ResourceInstance)
+        idx_vt_cis = self._get_index(ViewType, ContentInstance)
+
+        for content_type_id in removed_content_type_ids:
+            idx_ct_vts.pop_indexed_value(content_type_id, sender)
+
+            content_inst_ids = idx_rt_ri.iter_indexed_values(content_type_id)
+            for content_inst_id in content_inst_ids:
+                idx_vt_cis.pop_indexed_value(sender, content_inst_id)
+
+        for content_type_id in added_content_type_ids:
+            idx_ct_vts.push_indexed_value(content_type_id, sender)
+
+            content_inst_ids = idx_rt_ri.iter_indexed_values(content_type_id)
+            for content_inst_id in content_inst_ids:
+                idx_vt_cis.push_indexed_value(sender, content_inst_id)
+
+        stale_state = self._get_stale_state()
+        for content_type_id in removed_content_type_ids:
+            stale_state.pop_dependency(content_type_id, sender.id)
+        for content_type_id in added_content_type_ids:
+            stale_state.push_dependency(content_type_id, sender.id)
+        stale_state.mark_dependents_stale(sender.id)
+
     def _handle_view_type_filter_type_ids_changed(
             self, sender, event_data):
-        map_rt_ri = self._map__resource_type__resource_instances
-        # for view_inst_id in map_rt_ri[sender.id]:
-        #     self._update_view_instance_content_instances(view_inst_id)
+        stale_state = self._get_stale_state()
+        stale_state.mark_dependents_stale(sender.id)
 
     def _handle_view_type_sorter_type_ids_changed(
             self, sender, event_data):
-        pass
+        stale_state = self._get_stale_state()
+        stale_state.mark_dependents_stale(sender.id)
 
     def _resolve_view_type_content_instances(self, view_type_id):
+        self._refresh_view_type(view_type_id)
+
         idx_vt_cis = self._get_index(ViewType, ContentInstance)
 
         result = idx_vt_cis.iter_indexed_values(view_type_id)
@@ -110,6 +149,23 @@ class ViewTypeModel(ResourceModelBase):
 
         return result
 
+    def _refresh_view_type(self, view_type_id):
+        """
+        Repopulates the ContentInstance pool of a stale ViewType.
+        """
+        view_type = self._get_resource(view_type_id)
+        if not view_type:
+            return
+
+        stale_state = self._get_stale_state()
+        if stale_state.pop_stale(view_type) is NO_VALUE:
+            return
+
+        idx_vt_cis = self._get_index(ViewType, ContentInstance)
+        idx_vt_cis.pop_index(view_type)
+        idx_vt_cis.push_index(view_type)
+        self._populate_view_type_content_instances_index(view_type)
+
     def _handle_resource_registered(self, sender, data):
         if isinstance(data, ContentInstance):
             self._handle_content_instance_registered(data)
@@ -119,21 +175,28 @@ class ViewTypeModel(ResourceModelBase):
             self._handle_content_instance_released(data)
 
     def _handle_content_instance_registered(self, content_instance):
+        """
+        Adds a ContentInstance to the pool of each ViewType referencing its
+            ContentType.
+
+        The ContentType to ViewType index routes the ContentInstance directly
+        to the qualifying ViewTypes, rather than testing every ViewType.
+        """
+        idx_ct_vts = self._get_index(ContentType, ViewType)
         idx_vt_cis = self._get_index(ViewType, ContentInstance)
-        for view_type_id in idx_vt_cis.iter_index_keys():
-            view_type = self._get_resource(view_type_id)
-            if content_instance.type_id in view_type.content_type_ids:
-                idx_vt_cis.push_indexed_value(view_type, content_instance)
+
+        view_type_ids = idx_ct_vts.iter_indexed_values(content_instance.type_id)
+        for view_type_id in view_type_ids:
+            idx_vt_cis.push_indexed_value(view_type_id, content_instance)
 
     def _handle_content_instance_released(self, content_instance):
         idx_vt_cis = self._get_index(ViewType, ContentInstance)
-        for view_type_id in idx_vt_cis.iter_index_keys():
-            idx_vt_cis.pop_indexed_value(view_type_id, content_instance)
+        idx_vt_cis.pop_value(content_instance)
 
     def _populate_content_type_view_types_index(self, view_type):
         idx_ct_vts = self._get_index(ContentType, ViewType)
         for content_type_id in view_type.content_type_ids:
-            idx_ct_vts.push_index_value(content_type_id, view_type)
+            idx_ct_vts.push_indexed_value(content_type_id, view_type)
 
     def _populate_view_type_content_instances_index(self, view_type):
         """
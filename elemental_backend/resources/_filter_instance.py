@@ -29,7 +29,6 @@ class FilterInstance(ResourceInstance):
             msg = msg.format(value)
             raise ValueError(msg)
 
-        self._kind_params = value
         original_value = self._kind_params
         if value != original_value:
             self._kind_params = value
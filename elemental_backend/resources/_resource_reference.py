@@ -47,13 +47,15 @@ class BoundForwardReference(object):
         try:
             result = resolver(resource_key)
         except Exception as e:
-            msg = 'Failed to resolve Resource reference: "{0}" - {1}: {2}'
-            msg = msg.format(resource_key, type(e).__name__, e)
-            _LOG.debug(msg)
+            if _LOG.isEnabledFor(logging.DEBUG):
+                msg = 'Failed to resolve Resource reference: "{0}" - {1}: {2}'
+                msg = msg.format(resource_key, type(e).__name__, e)
+                _LOG.debug(msg)
         else:
-            msg = 'Resolved Resource: "{0}"'
-            msg = msg.format(repr(result))
-            _LOG.debug(msg)
+            if _LOG.isEnabledFor(logging.DEBUG):
+                msg = 'Resolved Resource: "{0}"'
+                msg = msg.format(repr(result))
+                _LOG.debug(msg)
 
         return result
 
@@ -143,13 +145,15 @@ class ResourceReference(object):
         try:
             result = resolver(resource_key)
         except Exception as e:
-            msg = 'Failed to resolve Resource reference: "{0}" - {1}: {2}'
-            msg = msg.format(resource_key, type(e).__name__, e)
-            _LOG.debug(msg)
+            if _LOG.isEnabledFor(logging.DEBUG):
+                msg = 'Failed to resolve Resource reference: "{0}" - {1}: {2}'
+                msg = msg.format(resource_key, type(e).__name__, e)
+                _LOG.debug(msg)
         else:
-            msg = 'Resolved Resource: "{0}"'
-            msg = msg.format(repr(result))
-            _LOG.debug(msg)
+            if _LOG.isEnabledFor(logging.DEBUG):
+                msg = 'Resolved Resource: "{0}"'
+                msg = msg.format(repr(result))
+                _LOG.debug(msg)
 
         return result
 
@@ -27,7 +27,6 @@ class SorterInstance(ResourceInstance):
             msg = msg.format(value)
             raise ValueError(msg)
 
-        self._kind_params = value
         original_value = self._kind_params
         if value != original_value:
             self._kind_params = value
@@ -75,7 +75,6 @@ class ViewInstance(ResourceInstance):
             msg = msg.format(value)
             raise ValueError(msg)
 
-        self._result_id = value
         original_value = self._result_id
         if value != original_value:
             self._result_id = value
@@ -89,18 +88,94 @@ class ViewInstance(ResourceInstance):
     def result(self):
         return self._result_id
 
+    @property
+    def limit(self):
+        """
+        int: Maximum number of `ContentInstances` held by the `ViewResult`,
+            or None to hold every `ContentInstance` passing the
+            `FilterInstances`.
+        """
+        return self._limit
+
+    @limit.setter
+    def limit(self, value):
+        if value is not None:
+            try:
+                value = _process_count_value(value)
+            except (TypeError, ValueError):
+                msg = 'Failed to set limit: "{0}" is not a valid count.'
+                msg = msg.format(value)
+                raise ValueError(msg)
+
+        original_value = self._limit
+        if value != original_value:
+            self._limit = value
+            self._limit_changed(self, original_value, value)
+
+    @property
+    def limit_changed(self):
+        return self._limit_changed
+
+    @property
+    def offset(self):
+        """
+        int: Number of sorted `ContentInstances` skipped before those held
+            by the `ViewResult`.
+        """
+        return self._offset
+
+    @offset.setter
+    def offset(self, value):
+        if value is None:
+            value = 0
+
+        try:
+            value = _process_count_value(value)
+        except (TypeError, ValueError):
+            msg = 'Failed to set offset: "{0}" is not a valid count.'
+            msg = msg.format(value)
+            raise ValueError(msg)
+
+        original_value = self._offset
+        if value != original_value:
+            self._offset = value
+            self._offset_changed(self, original_value, value)
+
+    @property
+    def offset_changed(self):
+        return self._offset_changed
+
     def __init__(self, id=None, type_id=None, filter_ids=None, sorter_ids=None,
-                 result_id=None):
+                 result_id=None, limit=None, offset=None):
         super(ViewInstance, self).__init__(id=id, type_id=type_id)
 
         self._filter_ids = tuple()
         self._sorter_ids = tuple()
         self._result_id = None
+        self._limit = None
+        self._offset = 0
 
         self._filter_ids_changed = PropertyChangedHook()
         self._sorter_ids_changed = PropertyChangedHook()
         self._result_id_changed = PropertyChangedHook()
+        self._limit_changed = PropertyChangedHook()
+        self._offset_changed = PropertyChangedHook()
 
         self.filter_ids = filter_ids
         self.sorter_ids = sorter_ids
         self.result_id = result_id
+        self.limit = limit
+        self.offset = offset
+
+
+def _process_count_value(value):
+    if isinstance(value, bool):
+        raise TypeError(value)
+
+    result = int(value)
+    if result != value and str(result) != value:
+        raise ValueError(value)
+    elif result < 0:
+        raise ValueError(value)
+
+    return result
@@ -1,5 +1,4 @@
-import weakref
-import collections
+import collections.abc
 
 # from elemental_core.util import process_uuid_value
 
@@ -11,15 +10,19 @@ from ._property_changed_hook import PropertyChangedHook
 class ViewResult(Resource):
     @property
     def content_instance_ids(self):
+        """
+        Tuple[uuid]: Ids of the `ContentInstances` in the result, in the
+            order given by the `ViewInstance's` `SorterInstances`.
+        """
         return self._content_instance_ids
 
     @content_instance_ids.setter
     def content_instance_ids(self, value):
         if not value:
             value = tuple()
-        elif not isinstance(value, collections.Iterable):
-            value = [value]
-        value = weakref.WeakSet(value)
+        elif not isinstance(value, collections.abc.Iterable):
+            value = (value,)
+        value = tuple(value)
 
         original_value = self._content_instance_ids
         if value != original_value:
@@ -32,7 +35,9 @@ class ViewResult(Resource):
 
     @ResourceReference
     def content_instances(self):
-        return self._content_instance_ids
+        # Resolved by id so the Model can bring a stale ViewResult up to
+        # date before its ContentInstances are returned.
+        return self._id
 
     @ResourceReference
     def view_instance(self):
@@ -45,7 +50,7 @@ class ViewResult(Resource):
         super(ViewResult, self).__init__(id=id)
 
         # self._view_instance_id = None
-        self._content_instance_ids = weakref.WeakSet()
+        self._content_instance_ids = tuple()
 
         self._content_instance_ids_changed = PropertyChangedHook()
 
@@ -1,4 +1,5 @@
 from . import json
+from . import binary
 
 from ._resource_io import ResourceSchema
 
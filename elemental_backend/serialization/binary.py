@@ -0,0 +1,381 @@
+"""
+Compact binary snapshots of whole `Models`.
+
+A snapshot holds one section per `Resource` class. Within a section values
+are stored in columns, one per property, rather than one record per
+`Resource`: UUIDs as 16 raw bytes, UUID sequences as a column of lengths
+followed by the flattened UUIDs, and free-form values, such as
+`AttributeInstance` values, as a single JSON array per column along with
+flags marking unset values. Loading a snapshot decodes each column in one
+pass and registers every `Resource` with a single
+`Model.register_resources` call.
+
+Layout, with every integer little-endian::
+
+    magic (4 bytes) | version (uint16) | section count (uint32)
+    per section:
+        class name length (uint16) | class name (utf-8) | count (uint32)
+        per column: length (uint64) | column data
+"""
+import io
+import json
+import struct
+import uuid
+
+from elemental_core import NO_VALUE
+from elemental_core.util import process_elemental_class_value
+
+from ..errors import SerializerError, DeserializerError
+
+
+_DATA_FORMAT = 'binary'
+_MAGIC = b'ELMB'
+_VERSION = 1
+
+_HEADER = struct.Struct('<4sHI')
+_CLASS_NAME_LENGTH = struct.Struct('<H')
+_COUNT = struct.Struct('<I')
+_COLUMN_LENGTH = struct.Struct('<Q')
+
+# Length of a text value that is None.
+_NONE_LENGTH = 0xFFFFFFFF
+
+
+def _pack_lengths(lengths):
+    return struct.pack('<{0}I'.format(len(lengths)), *lengths)
+
+
+def _unpack_lengths(data, count):
+    size = 4 * count
+    return struct.unpack('<{0}I'.format(count), data[:size]), data[size:]
+
+
+def _encode_uuids(values):
+    return b''.join([value.bytes for value in values])
+
+
+def _decode_uuids(data, count):
+    data = bytes(data)
+    UUID = uuid.UUID
+    return [UUID(bytes=data[idx:idx + 16]) for idx in range(0, 16 * count, 16)]
+
+
+def _encode_optional_uuids(values):
+    flags = bytes(bytearray(1 if value else 0 for value in values))
+    return flags + _encode_uuids([value for value in values if value])
+
+
+def _decode_optional_uuids(data, count):
+    flags = data[:count]
+    present = iter(_decode_uuids(data[count:], sum(flags)))
+    return [next(present) if flag else None for flag in flags]
+
+
+def _encode_uuid_lists(values):
+    values = [list(value or ()) for value in values]
+    lengths = [len(value) for value in values]
+    flattened = [item for value in values for item in value]
+    return _pack_lengths(lengths) + _encode_uuids(flattened)
+
+
+def _decode_uuid_lists(data, count):
+    lengths, data = _unpack_lengths(data, count)
+    flattened = _decode_uuids(data, sum(lengths))
+
+    result = []
+    start = 0
+    for length in lengths:
+        end = start + length
+        result.append(flattened[start:end])
+        start = end
+
+    return result
+
+
+def _encode_texts(values):
+    encoded = [None if value is None else str(value).encode('utf-8')
+               for value in values]
+    lengths = [_NONE_LENGTH if value is None else len(value)
+               for value in encoded]
+    return _pack_lengths(lengths) + b''.join(
+        [value for value in encoded if value is not None])
+
+
+def _decode_texts(data, count):
+    lengths, data = _unpack_lengths(data, count)
+    data = bytes(data)
+
+    result = []
+    start = 0
+    for length in lengths:
+        if length == _NONE_LENGTH:
+            result.append(None)
+            continue
+
+        end = start + length
+        result.append(data[start:end].decode('utf-8'))
+        start = end
+
+    return result
+
+
+def _encode_json_values(values):
+    # Unset values are flagged, and written as null.
+    flags = bytes(bytearray(1 if value is NO_VALUE else 0 for value in values))
+    values = [None if value is NO_VALUE else value for value in values]
+    return flags + json.dumps(values, separators=(',', ':')).encode('utf-8')
+
+
+def _decode_json_values(data, count):
+    flags = data[:count]
+    values = json.loads(bytes(data[count:]).decode('utf-8'))
+    return [NO_VALUE if flag else value for flag, value in zip(flags, values)]
+
+
+_UUID = (_encode_uuids, _decode_uuids)
+_OPTIONAL_UUID = (_encode_optional_uuids, _decode_optional_uuids)
+_UUID_LIST = (_encode_uuid_lists, _decode_uuid_lists)
+_TEXT = (_encode_texts, _decode_texts)
+_JSON = (_encode_json_values, _decode_json_values)
+
+
+# Columns of each supported `Resource` class, following the `id` column.
+# Column names are both property names and constructor arguments.
+_map__class_name__columns = {
+    'ContentType': (
+        ('name', _TEXT),
+        ('base_ids', _UUID_LIST),
+        ('attribute_type_ids', _UUID_LIST)
+    ),
+    'AttributeType': (
+        ('name', _TEXT),
+        ('default_value', _JSON),
+        ('kind_id', _TEXT),
+        ('kind_properties', _JSON)
+    ),
+    'FilterType': (
+        ('name', _TEXT),
+        ('attribute_type_ids', _UUID_LIST)
+    ),
+    'SorterType': (
+        ('name', _TEXT),
+        ('attribute_type_ids', _UUID_LIST)
+    ),
+    'ViewType': (
+        ('name', _TEXT),
+        ('content_type_ids', _UUID_LIST),
+        ('filter_type_ids', _UUID_LIST),
+        ('sorter_type_ids', _UUID_LIST)
+    ),
+    'ContentInstance': (
+        ('type_id', _OPTIONAL_UUID),
+        ('attribute_ids', _UUID_LIST)
+    ),
+    'AttributeInstance': (
+        ('type_id', _OPTIONAL_UUID),
+        ('value', _JSON),
+        ('source_id', _OPTIONAL_UUID)
+    ),
+    'FilterInstance': (
+        ('type_id', _OPTIONAL_UUID),
+        ('kind_params', _JSON)
+    ),
+    'SorterInstance': (
+        ('type_id', _OPTIONAL_UUID),
+        ('kind_params', _JSON)
+    ),
+    'ViewInstance': (
+        ('type_id', _OPTIONAL_UUID),
+        ('filter_ids', _UUID_LIST),
+        ('sorter_ids', _UUID_LIST),
+        ('result_id', _OPTIONAL_UUID),
+        ('limit', _JSON),
+        ('offset', _JSON)
+    ),
+    # Entries are derived from the ViewInstance, and recomputed by the Model
+    # when the ViewResult is first read.
+    'ViewResult': ()
+}
+
+
+def dump_resources(resources, stream):
+    """
+    Writes `resources` to `stream` as a binary snapshot.
+
+    Args:
+        resources (Iterable[Resource]): The `Resources` to be written.
+        stream: A binary file-like object.
+
+    Returns:
+        int: The number of `Resources` written.
+
+    Raises:
+        SerializerError: If a `Resource` class is not supported.
+    """
+    map__class_name__resources = {}
+    for resource in resources:
+        class_name = _compute_class_name(resource)
+        map__class_name__resources.setdefault(class_name, []).append(resource)
+
+    stream.write(_HEADER.pack(_MAGIC, _VERSION,
+                              len(map__class_name__resources)))
+
+    count = 0
+    for class_name, class_resources in map__class_name__resources.items():
+        _dump_section(class_name, class_resources, stream)
+        count += len(class_resources)
+
+    return count
+
+
+def load_resources(stream):
+    """
+    Reads the `Resources` of a binary snapshot from `stream`.
+
+    Args:
+        stream: A binary file-like object positioned at a snapshot.
+
+    Returns:
+        List[Resource]: The unregistered `Resources` of the snapshot, grouped
+            by class.
+
+    Raises:
+        DeserializerError: If `stream` does not hold a valid snapshot.
+    """
+    magic, version, section_count = _HEADER.unpack(
+        _read_exactly(stream, _HEADER.size))
+    if magic != _MAGIC or version != _VERSION:
+        msg = (
+            'Failed to read binary snapshot: Unsupported header '
+            '(magic {0!r}, version {1}).'
+        )
+        msg = msg.format(magic, version)
+        raise DeserializerError(msg, data_format=_DATA_FORMAT)
+
+    resources = []
+    for _ in range(section_count):
+        resources.extend(_load_section(stream))
+
+    return resources
+
+
+def dump_model(model, stream):
+    """
+    Writes every `Resource` managed by `model` to `stream`.
+
+    The `Resources` are read through a `Model.snapshot`, so `model` may keep
+    changing while it is written.
+
+    Returns:
+        int: The number of `Resources` written.
+    """
+    with model.snapshot() as snapshot:
+        return dump_resources(snapshot.iter_resources(), stream)
+
+
+def load_model(stream, model):
+    """
+    Reads a binary snapshot from `stream` and registers its `Resources` with
+        `model` in a single `Model.register_resources` call.
+
+    Returns:
+        List[Resource]: The registered `Resources`.
+    """
+    return model.register_resources(load_resources(stream))
+
+
+def dumps_resource(resource):
+    """
+    Encodes a single `Resource` as a snapshot section of its own, for
+        storage formats that address `Resources` individually.
+
+    Returns:
+        bytes
+
+    Raises:
+        SerializerError: If the `Resource` class is not supported.
+    """
+    stream = io.BytesIO()
+    _dump_section(_compute_class_name(resource), [resource], stream)
+    return stream.getvalue()
+
+
+def loads_resource(data):
+    """
+    Decodes a `Resource` encoded by `dumps_resource`.
+
+    Returns:
+        Resource: A new, unregistered `Resource`.
+
+    Raises:
+        DeserializerError: If `data` does not hold a valid section.
+    """
+    return _load_section(io.BytesIO(data))[0]
+
+
+def _compute_class_name(resource):
+    class_name = type(resource).__name__
+    if class_name not in _map__class_name__columns:
+        msg = 'Failed to write binary snapshot: {0} is not supported.'
+        msg = msg.format(class_name)
+        raise SerializerError(msg, resource_type=class_name,
+                              data_format=_DATA_FORMAT)
+
+    return class_name
+
+
+def _dump_section(class_name, resources, stream):
+    encoded_name = class_name.encode('utf-8')
+
+    stream.write(_CLASS_NAME_LENGTH.pack(len(encoded_name)))
+    stream.write(encoded_name)
+    stream.write(_COUNT.pack(len(resources)))
+
+    _write_column(stream, _encode_uuids([resource.id for resource in resources]))
+    for attr_name, (encode, _) in _map__class_name__columns[class_name]:
+        values = [getattr(resource, attr_name) for resource in resources]
+        _write_column(stream, encode(values))
+
+
+def _load_section(stream):
+    name_length, = _CLASS_NAME_LENGTH.unpack(
+        _read_exactly(stream, _CLASS_NAME_LENGTH.size))
+    class_name = _read_exactly(stream, name_length).decode('utf-8')
+    count, = _COUNT.unpack(_read_exactly(stream, _COUNT.size))
+
+    columns = _map__class_name__columns.get(class_name)
+    resource_type = process_elemental_class_value(class_name)
+    if columns is None or resource_type is None:
+        msg = 'Failed to read binary snapshot: {0} is not supported.'
+        msg = msg.format(class_name)
+        raise DeserializerError(msg, resource_type=class_name,
+                                data_format=_DATA_FORMAT)
+
+    attr_names = ['id']
+    values = [_decode_uuids(_read_column(stream), count)]
+    for attr_name, (_, decode) in columns:
+        attr_names.append(attr_name)
+        values.append(decode(_read_column(stream), count))
+
+    return [resource_type(**dict(zip(attr_names, resource_values)))
+            for resource_values in zip(*values)]
+
+
+def _write_column(stream, data):
+    stream.write(_COLUMN_LENGTH.pack(len(data)))
+    stream.write(data)
+
+
+def _read_column(stream):
+    length, = _COLUMN_LENGTH.unpack(
+        _read_exactly(stream, _COLUMN_LENGTH.size))
+    return memoryview(_read_exactly(stream, length))
+
+
+def _read_exactly(stream, size):
+    data = stream.read(size)
+    if len(data) != size:
+        msg = 'Failed to read binary snapshot: Unexpected end of data.'
+        raise DeserializerError(msg, data_format=_DATA_FORMAT)
+
+    return data
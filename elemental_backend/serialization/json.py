@@ -1,8 +1,167 @@
+import importlib
+import math
+import re
 import uuid
 import json as default_json
+from collections import namedtuple
 
 
-_json = default_json
+# A JSON library, adapted to the `dumps` and `loads` of the stdlib module.
+JsonBackend = namedtuple('JsonBackend', ['name', 'dumps', 'loads'])
+
+
+# Integers of 64 bits have at most 20 digits.
+_LONG_DIGITS_PATTERN = re.compile(r'\d{20}')
+
+
+def _adapt_backend(name, dumps, loads):
+    """
+    Adapts a JSON library, leaving the data it cannot handle as the stdlib
+        does to the stdlib.
+    """
+    def adapted_dumps(data):
+        try:
+            return dumps(data)
+        except (TypeError, ValueError, OverflowError):
+            # Libraries variously reject integers beyond 64 bits, keys other
+            # than str and non-finite floats, all of which the stdlib writes.
+            return default_json.dumps(data)
+
+    def adapted_loads(data):
+        # Libraries may read integers beyond 64 bits as floats, so data that
+        # may hold one is read by the stdlib.
+        if _LONG_DIGITS_PATTERN.search(data):
+            return default_json.loads(data)
+
+        try:
+            return loads(data)
+        except ValueError:
+            # Libraries may reject the NaN and Infinity literals the stdlib
+            # writes.
+            return default_json.loads(data)
+
+    return JsonBackend(name, adapted_dumps, adapted_loads)
+
+
+def _has_non_finite_float(data):
+    if isinstance(data, float):
+        return not math.isfinite(data)
+
+    if isinstance(data, dict):
+        data = data.values()
+    elif not isinstance(data, (list, tuple)):
+        return False
+
+    return any(_has_non_finite_float(value) for value in data)
+
+
+def _load_orjson():
+    orjson = importlib.import_module('orjson')
+
+    def dumps(data):
+        result = orjson.dumps(data).decode('utf-8')
+
+        # orjson writes NaN and infinite floats as null rather than
+        # rejecting them, so they are left to the stdlib.
+        if 'null' in result and _has_non_finite_float(data):
+            raise ValueError('orjson does not support non-finite floats')
+
+        return result
+
+    return _adapt_backend('orjson', dumps, orjson.loads)
+
+
+def _load_rapidjson():
+    rapidjson = importlib.import_module('rapidjson')
+    return _adapt_backend('rapidjson', rapidjson.dumps, rapidjson.loads)
+
+
+def _load_ujson():
+    ujson = importlib.import_module('ujson')
+    return _adapt_backend('ujson', ujson.dumps, ujson.loads)
+
+
+def _load_default_json():
+    return JsonBackend('json', default_json.dumps, default_json.loads)
+
+
+# Supported backends, fastest first.
+_map__backend_name__loader = {
+    'orjson': _load_orjson,
+    'rapidjson': _load_rapidjson,
+    'ujson': _load_ujson,
+    'json': _load_default_json
+}
+
+
+_json = _load_default_json()
+
+
+def get_backend():
+    """
+    Returns:
+        str: Name of the JSON library used by the serializers.
+    """
+    return _json.name
+
+
+def iter_available_backends():
+    """
+    Iterates the names of the supported JSON libraries that are installed,
+        fastest first.
+    """
+    for backend_name, loader in _map__backend_name__loader.items():
+        try:
+            loader()
+        except ImportError:
+            continue
+
+        yield backend_name
+
+
+def set_backend(backend_name=None):
+    """
+    Selects the JSON library used by the serializers and deserializers of
+        this module.
+
+    The stdlib `json` module is used until another library is selected.
+    Libraries differ in whitespace and escaping, so serialized data may
+    differ between backends while holding the same values.
+
+    Data a library cannot serialize, such as integers beyond 64 bits,
+    dictionary keys other than strings or, for orjson, NaN and infinite
+    floats, is serialized by the stdlib instead. Likewise, data that may hold
+    integers beyond 64 bits, or that holds the NaN and Infinity literals
+    written by the stdlib, is deserialized by the stdlib. Every backend
+    therefore reads and writes the same values.
+
+    Args:
+        backend_name (str): One of "orjson", "rapidjson", "ujson" or "json".
+            If None, the fastest installed library is selected, falling back
+            to "json".
+
+    Returns:
+        str: Name of the selected library.
+
+    Raises:
+        ValueError: If `backend_name` is not a supported library.
+        ImportError: If `backend_name` is not installed.
+    """
+    global _json
+
+    if backend_name is None:
+        backend_name = next(iter_available_backends())
+
+    try:
+        loader = _map__backend_name__loader[backend_name]
+    except KeyError:
+        msg = 'Failed to set JSON backend: "{0}" is not supported.'
+        msg = msg.format(backend_name)
+        raise ValueError(msg)
+
+    _json = loader()
+
+    return _json.name
 
 
 def serialize_content_type(content_type):
@@ -461,7 +620,9 @@ def serialize_view_instance(view_instance):
         'type_id': str(view_instance.type_id),
         'filter_ids': [str(f_id) for f_id in view_instance.filter_ids],
         'sorter_ids': [str(s_id) for s_id in view_instance.sorter_ids],
-        'result_id': str(view_instance.result_id)
+        'result_id': str(view_instance.result_id),
+        'limit': view_instance.limit,
+        'offset': view_instance.offset
     }
 
     data = _json.dumps(data)
@@ -488,12 +649,59 @@ def deserialize_view_instance(data, view_instance):
     filter_ids = data['filter_ids']
     sorter_ids = data['sorter_ids']
     result_id = data['result_id']
+    limit = data.get('limit')
+    offset = data.get('offset')
 
     view_instance.id = id
     view_instance.type_id = type_id
     view_instance.filter_ids = filter_ids
     view_instance.sorter_ids = sorter_ids
     view_instance.result_id = result_id
+    view_instance.limit = limit
+    view_instance.offset = offset
+
+
+def serialize_view_result(view_result):
+    """
+    Extracts data from `view_result` into a JSON string.
+
+    Only the id is written; the entries of a ``ViewResult`` are derived from
+    its ``ViewInstance`` and recomputed by the ``Model``.
+
+    Args:
+        view_result (ViewResult): The ``ViewResult`` instance to be
+            serialized.
+
+    Returns:
+        str: Raw JSON string containing `view_result` data.
+    """
+    data = {
+        'type': type(view_result).__name__,
+        'id': str(view_result.id)
+    }
+
+    data = _json.dumps(data)
+
+    return data
+
+
+def deserialize_view_result(data, view_result):
+    """
+    Populates `view_result` with values extracted from `data`.
+
+    Args:
+        data (str): Raw JSON string containing ``ViewResult`` data.
+        view_result (ViewResult): A ``ViewResult`` instance to be populated
+            with `data`.
+
+    Returns:
+        None
+    """
+    data = _json.loads(data)
+
+    id = data['id']
+
+    view_result.id = id
 
 
 def bind_to_controller(controller):
@@ -507,6 +715,7 @@ def bind_to_controller(controller):
     controller.serializer('FilterInstance', 'json')(serialize_filter_instance)
     controller.serializer('SorterInstance', 'json')(serialize_sorter_instance)
     controller.serializer('ViewInstance', 'json')(serialize_view_instance)
+    controller.serializer('ViewResult', 'json')(serialize_view_result)
 
     controller.deserializer('ContentType', 'json')(deserialize_content_type)
     controller.deserializer('AttributeType', 'json')(deserialize_attribute_type)
@@ -517,4 +726,5 @@ def bind_to_controller(controller):
     controller.deserializer('AttributeInstance', 'json')(deserialize_attribute_instance)
     controller.deserializer('FilterInstance', 'json')(deserialize_filter_instance)
     controller.deserializer('SorterInstance', 'json')(deserialize_sorter_instance)
-    controller.deserializer('ViewInstance', 'json')(deserialize_view_instance)
\ No newline at end of file
+    controller.deserializer('ViewInstance', 'json')(deserialize_view_instance)
+    controller.deserializer('ViewResult', 'json')(deserialize_view_result)
\ No newline at end of file
@@ -12,3 +12,4 @@ from ._get import Get
 from ._put import Put
 from ._post import Post
 from ._delete import Delete
+from ._batch import Batch
@@ -0,0 +1,99 @@
+import uuid
+
+from elemental_core import ElementalBase
+from elemental_core.util import process_uuid_value
+
+from ..errors import InvalidBatchError
+
+
+class Batch(ElementalBase):
+    """
+    A Batch represents a group of `Transactions` processed together.
+
+    `Transactions` in a `Batch` sharing a `super_id` are members of the same
+    batch `Transaction`: if any of them fails, all of them are rolled back.
+    Members must be adjacent, as `Transactions` are processed in the order
+    given. `Transactions` without a `super_id` succeed or fail on their own.
+    """
+    # Batches are not bound to an Action or Resource type, so only handlers
+    # registered for all Actions and Resource types are invoked for them.
+    action = None
+    resource_type = None
+
+    @property
+    def id(self):
+        """
+        Unique identifier for the Batch.
+        """
+        return self._id
+
+    @property
+    def transactions(self):
+        """
+        The `Transactions` in the Batch, in processing order.
+        """
+        return self._transactions
+
+    @property
+    def errors(self):
+        """
+        Contains any errors encountered while processing the Batch as a
+            whole, such as failed rollbacks.
+        """
+        return self._errors
+
+    def __init__(self, transactions, id=None):
+        """
+        Constructor for a Batch instance.
+
+        Args:
+            transactions (Iterable[Transaction]): The `Transactions` to
+                process.
+            id Optional(str or uuid): The ID of the Batch.
+
+        Raises:
+            InvalidBatchError: If the members of a batch `Transaction` are
+                not adjacent.
+        """
+        self._id = process_uuid_value(id) or uuid.uuid4()
+        self._transactions = tuple(transactions)
+        self._errors = []
+        self._units = self._compute_units()
+
+    def iter_units(self):
+        """
+        Groups the Batch's `Transactions` into units rolled back together.
+
+        Yields:
+            Tuple[Transaction]: The `Transactions` sharing a `super_id`, in
+                processing order, or a single `Transaction` without one.
+        """
+        for unit in self._units:
+            yield unit
+
+    def _compute_units(self):
+        units = []
+        closed_super_ids = set()
+        unit = []
+
+        for transaction in self._transactions:
+            super_id = transaction.super_id
+            if unit and (super_id is None or super_id != unit[0].super_id):
+                closed_super_ids.add(unit[0].super_id)
+                units.append(tuple(unit))
+                unit = []
+
+            if super_id is not None and super_id in closed_super_ids:
+                msg = (
+                    'Invalid Batch "{0}": '
+                    'Members of batch Transaction "{1}" are not adjacent.'
+                )
+                msg = msg.format(self._id, super_id)
+                raise InvalidBatchError(msg, transaction=transaction)
+
+            unit.append(transaction)
+
+        if unit:
+            units.append(tuple(unit))
+
+        return units
@@ -28,15 +28,21 @@ classifiers = [
     'Development Status :: 1 - Planning',
     'License :: OSI Approved :: {0}'.format(license),
     'Intended Audience :: Developers',
-    'Environment :: Web Environment'
+    'Environment :: Web Environment',
     'Programming Language :: Python',
-    'Programming Language :: Python :: 3.5',
-    'Programming Language :: Python :: 3.6',
+    'Programming Language :: Python :: 3',
+    'Programming Language :: Python :: 3 :: Only',
+    'Programming Language :: Python :: 3.7',
+    'Programming Language :: Python :: 3.8',
+    'Programming Language :: Python :: 3.9',
     'Topic :: Internet :: WWW/HTTP :: Dynamic Content',
     'Topic :: Software Development :: Libraries :: Python Modules'
 ]
 keywords = 'elemental cms backend'
 
+# contextlib.nullcontext and asyncio.get_running_loop need Python 3.7.
+python_requires = '>=3.7'
+
 packages = find_packages(exclude=('tests', 'docs', 'scratch'))
 
 install_requires = [
@@ -48,6 +54,9 @@ extras_require = {
     ],
     'doc': [
         'sphinx>=1.3.0'
+    ],
+    'fast_json': [
+        'orjson'
     ]
 }
 
@@ -59,8 +68,8 @@ entry_points = {}
 
 
 def _run_setup():
-    if sys.version_info <= (3, 5) and not ON_RTD:
-        msg = 'This package requires Python 3.5 or above (current {0}.{1})'
+    if sys.version_info < (3, 7) and not ON_RTD:
+        msg = 'This package requires Python 3.7 or above (current {0}.{1})'
         msg = msg.format(sys.version_info[0], sys.version_info[1])
         raise ValueError(msg)
 
@@ -75,6 +84,7 @@ def _run_setup():
         'license': license,
         'classifiers': classifiers,
         'keywords': keywords,
+        'python_requires': python_requires,
         'packages': packages,
         'install_requires': install_requires,
         'extras_require': extras_require,
@@ -0,0 +1,107 @@
+import asyncio
+import uuid
+
+import elemental_backend as backend
+
+from tests.fixtures import *
+
+
+class _ConcurrentGetParams(object):
+    load = [
+        (1, 100),
+        (50, 5000)
+    ]
+
+
+@pytest.mark.parametrize('load', _ConcurrentGetParams.load)
+def test_async_controller_concurrent_gets(load):
+    resource_count, transaction_count = load
+
+    model = backend.Model()
+    controller = backend.AsyncController(model)
+
+    resources = [backend.resources.ContentType(id=uuid.uuid4())
+                 for _ in range(resource_count)]
+    for resource in resources:
+        model.register_resource(resource)
+
+    @controller.serializer(backend.resources.ContentType, 'json')
+    async def serialize_content_type(resource):
+        await asyncio.sleep(0)
+        return str(resource.id)
+
+    async def run():
+        transactions = [
+            backend.transactions.Get(resources[idx % resource_count].id,
+                                     outbound_format='json')
+            for idx in range(transaction_count)]
+
+        results = await asyncio.gather(
+            *[controller.process_transaction(t) for t in transactions])
+        await controller.close()
+
+        return results
+
+    transactions = asyncio.run(run())
+
+    assert len(transactions) == transaction_count
+    for idx, transaction in enumerate(transactions):
+        resource = resources[idx % resource_count]
+
+        assert len(transaction.errors) == 0
+        assert transaction.target_resource is resource
+        assert transaction.outbound_payload == str(resource.id)
+
+
+def test_async_controller_async_handler():
+    model = backend.Model()
+    controller = backend.AsyncController(model)
+
+    resource = backend.resources.Resource(id=uuid.uuid4())
+    model.register_resource(resource)
+
+    handled = []
+
+    async def handler(event, transaction):
+        await asyncio.sleep(0)
+        handled.append((event, transaction.target_resource))
+
+    controller.handler(backend.ControllerEvents.resource_resolved)(handler)
+
+    transaction = backend.transactions.Get(resource.id)
+    asyncio.run(controller.process_transaction(transaction))
+
+    assert len(transaction.errors) == 0
+    assert handled == [(backend.ControllerEvents.resource_resolved, resource)]
+
+
+def test_async_controller_serializes_writes():
+    model = backend.Model()
+    controller = backend.AsyncController(model)
+
+    writing = []
+    max_writing = []
+
+    @controller.deserializer(backend.resources.ContentType, 'json')
+    async def deserialize_content_type(data, resource):
+        writing.append(resource)
+        max_writing.append(len(writing))
+        await asyncio.sleep(0)
+        writing.remove(resource)
+
+    async def run():
+        transactions = [
+            backend.transactions.Post(backend.resources.ContentType, 'json', '{}')
+            for _ in range(20)]
+
+        results = await asyncio.gather(
+            *[controller.process_transaction(t) for t in transactions])
+        await controller.close()
+
+        return results
+
+    transactions = asyncio.run(run())
+
+    assert all(len(t.errors) == 0 for t in transactions)
+    assert all(t.target_resource.id in model._resources for t in transactions)
+    assert max(max_writing) == 1
@@ -1,3 +1,5 @@
+import gc
+import io
 import uuid
 import json
 
@@ -74,6 +76,26 @@ def test_controller_handler_registration(controller):
     del _handler
 
 
+def test_controller_handler_collection():
+    controller = backend.Controller(backend.Model())
+    event = backend.ControllerEvents.resource_created
+
+    @controller.handler(event)
+    def _handler(e, t):
+        pass
+
+    transaction = backend.transactions.Get(uuid.uuid4())
+    controller._invoke_handlers(event, transaction)
+
+    assert controller._handler_dispatch
+
+    del _handler
+    gc.collect()
+
+    assert not controller._handlers
+    assert not controller._handler_dispatch
+
+
 class _ImportParams(object):
     resource_data = [
         (resource_data.DATA_CONTENT_TYPE_BASE, 'json'),
@@ -131,6 +153,76 @@ def test_controller_resource_export(controller, resource_data):
     assert sorted(export_data) == sorted(resource_data)
 
 
+def _make_json_controller():
+    controller = backend.Controller(backend.Model())
+    json_serialization.bind_to_controller(controller)
+    return controller
+
+
+def test_controller_resource_stream_round_trip():
+    lines = [json.dumps(data) for data, _ in _ImportParams.resource_data]
+    # The type field is found when it does not lead the line too.
+    data = dict(resource_data.DATA_CONTENT_INST)
+    data['type'] = data.pop('type')
+    lines.append(json.dumps(data))
+
+    stream = io.StringIO('\n'.join(lines) + '\n\n')
+    controller = _make_json_controller()
+
+    count = controller.import_resource_stream(stream, batch_size=4)
+
+    assert count == len(lines)
+    assert len(controller._model._resources) == len(lines)
+
+    export_stream = io.StringIO()
+    assert controller.export_resource_stream(export_stream) == len(lines)
+
+    exported_lines = export_stream.getvalue().splitlines()
+    round_trip_controller = _make_json_controller()
+    round_trip_controller.import_resource_stream(iter(exported_lines))
+
+    assert sorted(round_trip_controller.iter_exported_resources()) == sorted(
+        line + '\n' for line in exported_lines)
+
+
+def test_controller_resource_stream_view_result():
+    controller = _make_json_controller()
+    view_result = backend.resources.ViewResult(id=uuid.uuid4())
+    controller._model.register_resource(view_result)
+
+    export_stream = io.StringIO()
+    assert controller.export_resource_stream(export_stream) == 1
+
+    export_stream.seek(0)
+    round_trip_controller = _make_json_controller()
+    assert round_trip_controller.import_resource_stream(export_stream) == 1
+    assert view_result.id in round_trip_controller._model._resources
+
+
+def test_controller_resource_stream_missing_serializer():
+    controller = backend.Controller(backend.Model())
+    controller.serializer('AttributeType', 'json')(
+        json_serialization.serialize_attribute_type)
+    controller._model.register_resources([
+        backend.resources.AttributeType(id=uuid.uuid4(), name='name'),
+        backend.resources.ViewResult(id=uuid.uuid4())
+    ])
+
+    export_stream = io.StringIO()
+    with pytest.raises(backend.errors.SerializerNotFoundError):
+        controller.export_resource_stream(export_stream)
+
+    assert export_stream.getvalue() == ''
+
+
+def test_controller_resource_stream_missing_type():
+    controller = _make_json_controller()
+    stream = io.StringIO(json.dumps({'id': str(uuid.uuid4())}))
+
+    with pytest.raises(backend.errors.DeserializerError):
+        controller.import_resource_stream(stream)
+
+
 class _PostParams(object):
     resource_data = [
         (resource_data.DATA_CONTENT_INST, 'json')
@@ -252,3 +344,204 @@ def test_controller_transaction_delete(controller, resource_id):
 
     assert len(transaction.errors) == 0
     assert resource_id not in controller._model._resources
+
+
+def _make_batch_post(resource_data, super_id=None, inbound_payload=None):
+    if inbound_payload is None:
+        inbound_payload = json.dumps(resource_data)
+
+    return backend.transactions.Transaction(
+        backend.transactions.Actions.POST,
+        resource_type=resource_data['type'],
+        super_id=super_id,
+        inbound_format='json',
+        inbound_payload=inbound_payload)
+
+
+def test_controller_batch_units():
+    super_id = uuid.uuid4()
+    transactions = [
+        _make_batch_post(resource_data.DATA_ATTR_TYPE_NAME, super_id=super_id),
+        _make_batch_post(resource_data.DATA_CONTENT_TYPE_BASE, super_id=super_id),
+        _make_batch_post(resource_data.DATA_ATTR_TYPE_PATH),
+        _make_batch_post(resource_data.DATA_CONTENT_TYPE_SUB)
+    ]
+
+    batch = backend.transactions.Batch(transactions)
+    units = list(batch.iter_units())
+
+    assert units == [
+        (transactions[0], transactions[1]),
+        (transactions[2],),
+        (transactions[3],)
+    ]
+
+
+def test_controller_batch_split_unit():
+    model = backend.Model()
+    controller = backend.Controller(model)
+    json_serialization.bind_to_controller(controller)
+
+    super_id = uuid.uuid4()
+    transactions = [
+        _make_batch_post(resource_data.DATA_ATTR_TYPE_NAME, super_id=super_id),
+        _make_batch_post(resource_data.DATA_ATTR_TYPE_PATH),
+        _make_batch_post(resource_data.DATA_CONTENT_TYPE_BASE, super_id=super_id)
+    ]
+
+    with pytest.raises(backend.errors.InvalidBatchError):
+        controller.process_batch(transactions)
+
+    assert len(model._resources) == 0
+
+
+def test_controller_batch_rollback():
+    model = backend.Model()
+    controller = backend.Controller(model)
+    json_serialization.bind_to_controller(controller)
+
+    fired_events = []
+
+    def handler(e, t):
+        fired_events.append(e)
+
+    for event in (backend.ControllerEvents.batch_opened,
+                  backend.ControllerEvents.batch_succeeded,
+                  backend.ControllerEvents.batch_failed,
+                  backend.ControllerEvents.batch_closing):
+        controller.handler(event)(handler)
+
+    super_id = uuid.uuid4()
+    transactions = [
+        _make_batch_post(resource_data.DATA_ATTR_TYPE_NAME, super_id=super_id),
+        _make_batch_post(resource_data.DATA_CONTENT_TYPE_BASE,
+                         super_id=super_id, inbound_payload=''),
+        _make_batch_post(resource_data.DATA_ATTR_TYPE_PATH)
+    ]
+
+    batch = controller.process_batch(transactions)
+
+    assert batch.transactions == tuple(transactions)
+    assert len(transactions[0].errors) == 1
+    assert len(transactions[1].errors) > 0
+    assert len(transactions[2].errors) == 0
+    assert uuid.UUID(resource_data.DATA_ATTR_TYPE_NAME['id']) not in model._resources
+    assert uuid.UUID(resource_data.DATA_ATTR_TYPE_PATH['id']) in model._resources
+    assert tuple(fired_events) == (
+        backend.ControllerEvents.batch_opened,
+        backend.ControllerEvents.batch_failed,
+        backend.ControllerEvents.batch_closing
+    )
+
+
+def test_controller_batch_rollback_failed_handler():
+    model = backend.Model()
+    controller = backend.Controller(model)
+    json_serialization.bind_to_controller(controller)
+
+    failing_id = uuid.UUID(resource_data.DATA_CONTENT_TYPE_BASE['id'])
+
+    def handler(e, t):
+        if t.target_resource.id == failing_id:
+            raise RuntimeError('handler failed')
+
+    controller.handler(backend.ControllerEvents.resource_registered)(handler)
+
+    super_id = uuid.uuid4()
+    transactions = [
+        _make_batch_post(resource_data.DATA_ATTR_TYPE_NAME, super_id=super_id),
+        _make_batch_post(resource_data.DATA_CONTENT_TYPE_BASE, super_id=super_id)
+    ]
+
+    controller.process_batch(transactions)
+
+    assert len(transactions[0].errors) == 1
+    assert len(transactions[1].errors) > 0
+    assert uuid.UUID(resource_data.DATA_ATTR_TYPE_NAME['id']) not in model._resources
+    assert failing_id not in model._resources
+
+
+def test_controller_batch_snapshots_units_only():
+    model = backend.Model()
+    controller = backend.Controller(model)
+
+    resources = [backend.resources.AttributeType(id=uuid.uuid4(), name='name')
+                 for _ in range(2)]
+    model.register_resources(resources)
+
+    # Nothing serializes the 'name' format, so updates cannot be snapshotted.
+    @controller.deserializer(backend.resources.AttributeType, 'name')
+    def deserialize_name(data, resource):
+        resource.name = data
+
+    standalone = backend.transactions.Put(resources[0].id, 'name', 'renamed')
+    super_id = uuid.uuid4()
+    members = [
+        backend.transactions.Transaction(
+            backend.transactions.Actions.PUT, resource_id=resource.id,
+            super_id=super_id, inbound_format='name', inbound_payload='changed')
+        for resource in resources]
+
+    controller.process_batch([standalone])
+
+    assert len(standalone.errors) == 0
+    assert resources[0].name == 'renamed'
+
+    controller.process_batch(members)
+
+    assert isinstance(members[0].errors[0],
+                      backend.errors.SerializerNotFoundError)
+    assert len(members[1].errors) == 1
+    assert resources[0].name == 'renamed'
+    assert resources[1].name == 'name'
+
+
+def test_controller_stage():
+    model = backend.Model()
+    controller = backend.Controller(model)
+
+    resource = backend.resources.Resource(id=uuid.uuid4())
+    model.register_resource(resource)
+
+    staged = []
+
+    @controller.stage(backend.transactions.Actions.GET,
+                      after='resolve_resource')
+    def stage(transaction):
+        staged.append(transaction.target_resource)
+
+    transaction = backend.transactions.Get(resource.id)
+    controller.process_transaction(transaction)
+
+    assert len(transaction.errors) == 0
+    assert staged == [resource]
+
+    with pytest.raises(backend.errors.InvalidStageKeyError):
+        controller.stage(backend.transactions.Actions.GET,
+                         after='delete_resource')(stage)
+
+
+def test_controller_serializer_ancestor_resolution():
+    model = backend.Model()
+    controller = backend.Controller(model)
+
+    resource = backend.resources.ContentType(id=uuid.uuid4())
+    model.register_resource(resource)
+
+    @controller.serializer(backend.resources.Resource, 'json')
+    def serialize_resource(resource):
+        return 'resource'
+
+    assert controller.export_resource(resource.id, 'json') == 'resource'
+
+    @controller.serializer(backend.resources.ContentType, 'json')
+    def serialize_content_type(resource):
+        return 'content_type'
+
+    assert controller.export_resource(resource.id, 'json') == 'content_type'
+
+    # The cached resolution falls back once the nearer serializer is collected.
+    del serialize_content_type
+    gc.collect()
+
+    assert controller.export_resource(resource.id, 'json') == 'resource'
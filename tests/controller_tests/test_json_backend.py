@@ -0,0 +1,106 @@
+import json
+import uuid
+
+import elemental_backend as backend
+from elemental_backend.serialization import json as json_serialization
+
+from tests import resource_data
+from tests.fixtures import *
+
+
+class _BackendParams(object):
+    backend_name = list(json_serialization.iter_available_backends())
+    resource_data = [
+        resource_data.DATA_CONTENT_TYPE_BASE,
+        resource_data.DATA_ATTR_TYPE_NAME,
+        resource_data.DATA_FILTER_TYPE,
+        resource_data.DATA_SORTER_TYPE,
+        resource_data.DATA_VIEW_TYPE,
+        resource_data.DATA_CONTENT_INST,
+        resource_data.DATA_ATTR_INST_NAME,
+        resource_data.DATA_FILTER_INSTANCE,
+        resource_data.DATA_SORTER_INSTANCE,
+        resource_data.DATA_VIEW_INSTANCE
+    ]
+
+
+@pytest.fixture
+def json_backend(request):
+    original_backend_name = json_serialization.get_backend()
+    yield json_serialization.set_backend(request.param)
+    json_serialization.set_backend(original_backend_name)
+
+
+@pytest.mark.parametrize('json_backend', _BackendParams.backend_name,
+                         indirect=True)
+@pytest.mark.parametrize('resource_data', _BackendParams.resource_data)
+def test_json_backend_round_trip(json_backend, resource_data):
+    controller = backend.Controller(backend.Model())
+    json_serialization.bind_to_controller(controller)
+
+    resource = controller.import_resource(
+        resource_data['type'], json.dumps(resource_data), 'json')
+    export_data = controller.export_resource(resource.id, 'json')
+
+    assert json_serialization.get_backend() == json_backend
+
+    json_serialization.set_backend('json')
+    default_export_data = controller.export_resource(resource.id, 'json')
+
+    assert json.loads(export_data) == json.loads(default_export_data)
+    assert json.loads(export_data)['type'] == resource_data['type']
+
+
+def test_json_backend_default():
+    assert json_serialization.get_backend() == 'json'
+    assert list(json_serialization.iter_available_backends())[-1] == 'json'
+
+
+def test_json_backend_unsupported():
+    with pytest.raises(ValueError):
+        json_serialization.set_backend('unsupported')
+
+    assert json_serialization.get_backend() == 'json'
+
+
+
+class _EdgeValueParams(object):
+    value = [
+        2 ** 70,
+        -2 ** 70,
+        {1: 'a', 'b': 2},
+        float('nan'),
+        float('inf'),
+        {'values': [1.5, float('-inf'), None]}
+    ]
+
+
+def _round_trip_attribute_value(value, serialize_backend_name,
+                                deserialize_backend_name):
+    attribute_instance = backend.resources.AttributeInstance(
+        id=uuid.uuid4(), type_id=uuid.uuid4(), value=value)
+
+    json_serialization.set_backend(serialize_backend_name)
+    data = json_serialization.serialize_attribute_instance(attribute_instance)
+
+    json_serialization.set_backend(deserialize_backend_name)
+    result = backend.resources.AttributeInstance()
+    json_serialization.deserialize_attribute_instance(data, result)
+
+    return result.value
+
+
+@pytest.mark.parametrize('json_backend', _BackendParams.backend_name,
+                         indirect=True)
+@pytest.mark.parametrize('value', _EdgeValueParams.value)
+def test_json_backend_edge_values(json_backend, value):
+    expected = json.loads(json.dumps(value))
+
+    result = _round_trip_attribute_value(value, json_backend, json_backend)
+
+    assert json.dumps(result) == json.dumps(expected)
+
+    # Data written by the stdlib is read by every backend.
+    result = _round_trip_attribute_value(value, 'json', json_backend)
+
+    assert json.dumps(result) == json.dumps(expected)
@@ -0,0 +1,214 @@
+import json
+import os
+import time
+import uuid
+
+import elemental_backend as backend
+from elemental_backend.serialization import json as json_serialization
+
+from tests import resource_data
+from tests.fixtures import *
+
+
+def _make_controller():
+    model = backend.Model()
+    controller = backend.Controller(model)
+    json_serialization.bind_to_controller(controller)
+    return model, controller
+
+
+def _post_attribute_type(controller, name, super_id=None):
+    data = dict(resource_data.DATA_ATTR_TYPE_NAME)
+    data['id'] = str(uuid.uuid4())
+    data['name'] = name
+
+    transaction = backend.transactions.Transaction(
+        backend.transactions.Actions.POST,
+        resource_type='AttributeType',
+        super_id=super_id,
+        inbound_format='json',
+        inbound_payload=json.dumps(data) if name else '')
+
+    return transaction, uuid.UUID(data['id'])
+
+
+def _collect_names(model):
+    return dict((resource_id, resource.name)
+                for resource_id, resource in model._resources.items())
+
+
+class _RecoverParams(object):
+    checkpoint_interval = [
+        None,
+        3
+    ]
+
+
+@pytest.mark.parametrize('checkpoint_interval', _RecoverParams.checkpoint_interval)
+def test_transaction_log_recover(tmp_path, checkpoint_interval):
+    directory = str(tmp_path)
+
+    model, controller = _make_controller()
+    log = backend.TransactionLog(directory, group_size=2,
+                                 checkpoint_interval=checkpoint_interval)
+    log.recover(controller)
+    log.bind_to_controller(controller)
+
+    resource_ids = []
+    for idx in range(5):
+        transaction, resource_id = _post_attribute_type(
+            controller, 'name_{0}'.format(idx))
+        controller.process_transaction(transaction)
+        resource_ids.append(resource_id)
+
+    data = json.loads(controller.export_resource(resource_ids[0], 'json'))
+    data['name'] = 'renamed'
+    controller.process_transaction(backend.transactions.Put(
+        resource_ids[0], 'json', json.dumps(data)))
+    controller.process_transaction(
+        backend.transactions.Delete(resource_ids[1]))
+
+    # The failing member rolls its batch Transaction back.
+    super_id = uuid.uuid4()
+    rolled_back, rolled_back_id = _post_attribute_type(
+        controller, 'rolled_back', super_id=super_id)
+    failing, _ = _post_attribute_type(controller, None, super_id=super_id)
+    controller.process_batch([rolled_back, failing])
+
+    log.close()
+
+    expected = _collect_names(model)
+    assert rolled_back_id not in expected
+    assert resource_ids[1] not in expected
+    assert expected[resource_ids[0]] == 'renamed'
+
+    recovered_model, recovered_controller = _make_controller()
+    recovered_log = backend.TransactionLog(directory)
+    replayed_count = recovered_log.recover(recovered_controller)
+
+    assert _collect_names(recovered_model) == expected
+    assert recovered_log.seq == log.seq
+    if checkpoint_interval:
+        assert replayed_count < log.seq
+
+
+def test_transaction_log_recover_mixed_batch(tmp_path):
+    directory = str(tmp_path)
+
+    model, controller = _make_controller()
+    log = backend.TransactionLog(directory)
+    log.bind_to_controller(controller)
+
+    # Standalone Transactions follow members of a batch Transaction, and
+    # must be replayed after them.
+    super_id = uuid.uuid4()
+    deleted, deleted_id = _post_attribute_type(controller, 'deleted',
+                                               super_id=super_id)
+    renamed, renamed_id = _post_attribute_type(controller, 'name',
+                                               super_id=super_id)
+
+    data = dict(resource_data.DATA_ATTR_TYPE_NAME)
+    data['id'] = str(renamed_id)
+    data['name'] = 'renamed'
+
+    controller.process_batch([
+        deleted,
+        renamed,
+        backend.transactions.Delete(deleted_id),
+        backend.transactions.Put(renamed_id, 'json', json.dumps(data))
+    ])
+    log.close()
+
+    expected = _collect_names(model)
+    assert deleted_id not in expected
+    assert expected[renamed_id] == 'renamed'
+
+    recovered_model, recovered_controller = _make_controller()
+    backend.TransactionLog(directory).recover(recovered_controller)
+
+    assert _collect_names(recovered_model) == expected
+
+
+def test_transaction_log_discards_partial_record(tmp_path):
+    directory = str(tmp_path)
+
+    model, controller = _make_controller()
+    log = backend.TransactionLog(directory)
+    log.bind_to_controller(controller)
+
+    transaction, resource_id = _post_attribute_type(controller, 'name')
+    controller.process_transaction(transaction)
+    log.close()
+
+    segment_name = [file_name for file_name in os.listdir(directory)
+                    if file_name.endswith('.log')][0]
+    segment_path = os.path.join(directory, segment_name)
+    segment_size = os.path.getsize(segment_path)
+    with open(segment_path, 'a') as stream:
+        stream.write('00000000 {"seq": 2, "act')
+
+    recovered_model, recovered_controller = _make_controller()
+    replayed_count = backend.TransactionLog(directory).recover(
+        recovered_controller)
+
+    assert replayed_count == 1
+    assert resource_id in recovered_model._resources
+    assert os.path.getsize(segment_path) == segment_size
+
+
+def test_transaction_log_sync_interval_flushes_idle_records(tmp_path):
+    model, controller = _make_controller()
+    log = backend.TransactionLog(str(tmp_path), group_size=64,
+                                 sync_interval=0.2)
+    log.bind_to_controller(controller)
+
+    # Appended right after a flush, so neither group_size nor the interval
+    # flush it while appending.
+    log.sync()
+    transaction, _ = _post_attribute_type(controller, 'name')
+    controller.process_transaction(transaction)
+
+    assert log._pending_count == 1
+
+    deadline = time.monotonic() + 5
+    while log._pending_count and time.monotonic() < deadline:
+        time.sleep(0.01)
+
+    assert log._pending_count == 0
+    assert log._sync_timer is None
+    log.close()
+
+
+def test_transaction_log_checkpoint_missing_serializer(tmp_path):
+    directory = str(tmp_path)
+
+    model = backend.Model()
+    controller = backend.Controller(model)
+    controller.serializer('AttributeType', 'json')(
+        json_serialization.serialize_attribute_type)
+    controller.deserializer('AttributeType', 'json')(
+        json_serialization.deserialize_attribute_type)
+
+    log = backend.TransactionLog(directory)
+    log.bind_to_controller(controller)
+
+    transaction, _ = _post_attribute_type(controller, 'checkpointed')
+    controller.process_transaction(transaction)
+    log.checkpoint()
+
+    transaction, _ = _post_attribute_type(controller, 'logged')
+    controller.process_transaction(transaction)
+    expected = _collect_names(model)
+
+    model.register_resource(backend.resources.ViewResult(id=uuid.uuid4()))
+
+    with pytest.raises(backend.errors.TransactionLogError):
+        log.checkpoint()
+    log.close()
+
+    recovered_model, recovered_controller = _make_controller()
+    replayed_count = backend.TransactionLog(directory).recover(
+        recovered_controller)
+
+    assert replayed_count == 1
+    assert _collect_names(recovered_model) == expected
@@ -0,0 +1,128 @@
+import math
+import uuid
+
+import pytest
+from elemental_core import NO_VALUE
+
+from elemental_backend._attribute_value_index import AttributeValueIndex
+from elemental_backend._view_evaluation import (
+    compile_filter_params,
+    match_filter_params
+)
+
+
+_VALUES = (0, 1, 2.5, 3, 10, -4, True, 'a', 'ab', 'abc', 'b', '10', 'ba',
+           None, (1, 2), ('ab',))
+
+
+@pytest.fixture
+def value_index():
+    result = AttributeValueIndex((uuid.uuid4(),))
+    content_instance_ids = {}
+
+    for value in _VALUES:
+        attribute_instance_id = uuid.uuid4()
+        content_instance_id = uuid.uuid4()
+        result.push_value(attribute_instance_id, content_instance_id, value)
+        content_instance_ids[content_instance_id] = value
+
+    return result, content_instance_ids
+
+
+@pytest.mark.parametrize('kind_params', (
+    {'equals': 3},
+    {'equals': 'ab'},
+    {'equals': 1},
+    {'minimum': 1},
+    {'maximum': 3},
+    {'minimum': 1, 'maximum': 3},
+    {'minimum': 'ab', 'maximum': 'b'},
+    {'minimum': 1, 'maximum': 'b'},
+    {'prefix': 'a'},
+    {'prefix': '1'},
+    {'minimum': 'a', 'prefix': 'ab'},
+))
+def test_attribute_value_index_lookup(value_index, kind_params):
+    value_index, content_instance_ids = value_index
+    predicate = compile_filter_params(kind_params)
+
+    expected = set(
+        content_instance_id
+        for content_instance_id, value in content_instance_ids.items()
+        if match_filter_params((value,), kind_params))
+
+    assert value_index.lookup(kind_params, predicate) == expected
+
+
+def test_attribute_value_index_unsupported(value_index):
+    value_index, _ = value_index
+    kind_params = {'match': 'a'}
+
+    assert not AttributeValueIndex.supports(kind_params)
+    assert value_index.lookup(
+        kind_params, compile_filter_params(kind_params)) is NO_VALUE
+
+
+def test_attribute_value_index_replaces_values():
+    value_index = AttributeValueIndex((uuid.uuid4(),))
+    attribute_instance_id = uuid.uuid4()
+    content_instance_id = uuid.uuid4()
+    kind_params = {'equals': 2}
+    predicate = compile_filter_params(kind_params)
+
+    value_index.push_value(attribute_instance_id, content_instance_id, 1)
+    assert value_index.lookup(kind_params, predicate) == set()
+
+    value_index.push_value(attribute_instance_id, content_instance_id, 2)
+    assert value_index.lookup(kind_params, predicate) == {content_instance_id}
+    assert len(value_index) == 1
+
+    value_index.pop_value(attribute_instance_id)
+    assert value_index.lookup(kind_params, predicate) == set()
+    assert len(value_index) == 0
+
+
+def test_attribute_value_index_build(value_index):
+    value_index, content_instance_ids = value_index
+    built_index = AttributeValueIndex.build(
+        value_index.attribute_type_ids,
+        [(uuid.uuid4(), content_instance_id, value)
+         for content_instance_id, value in content_instance_ids.items()])
+    kind_params = {'minimum': 1, 'maximum': 'b'}
+    predicate = compile_filter_params(kind_params)
+
+    assert len(built_index) == len(value_index)
+    assert built_index._entries == sorted(built_index._entries)
+    assert (built_index.lookup(kind_params, predicate) ==
+            value_index.lookup(kind_params, predicate))
+
+
+def test_attribute_value_index_nan():
+    value_index = AttributeValueIndex((uuid.uuid4(),))
+    content_instance_ids = {}
+    nan_attribute_instance_id = None
+
+    for value in [3, math.nan, 1, 5, 2, 4]:
+        attribute_instance_id = uuid.uuid4()
+        content_instance_id = uuid.uuid4()
+        value_index.push_value(attribute_instance_id, content_instance_id,
+                               value)
+        content_instance_ids[content_instance_id] = value
+        if value != value:
+            nan_attribute_instance_id = attribute_instance_id
+
+    kind_params = {'minimum': 0}
+    predicate = compile_filter_params(kind_params)
+    expected = set(
+        content_instance_id
+        for content_instance_id, value in content_instance_ids.items()
+        if value == value)
+
+    assert value_index._entries == sorted(value_index._entries)
+    assert value_index.lookup(kind_params, predicate) == expected
+
+    value_index.pop_value(nan_attribute_instance_id)
+
+    assert len(value_index) == 5
+    assert len(value_index._entries) == 5
+    assert value_index.lookup(kind_params, predicate) == expected
@@ -1,3 +1,5 @@
+import uuid
+
 from tests.fixtures import *
 
 
@@ -76,3 +78,90 @@ def test_model_unordered_register_and_release(
     assert len(model._map__content_type__view_types) == 0
     assert len(model._map__filter_instance__view_instance) == 0
     assert len(model._map__view_result__view_instance) == 0
+
+
+def test_model_register_resources():
+    model = backend.Model()
+    resources = [backend.resources.Resource(id=uuid.uuid4())
+                 for _ in range(10)]
+
+    result = model.register_resources(resources)
+
+    assert result == resources
+    for resource in resources:
+        assert model._resources[resource.id] is resource
+
+
+def test_model_register_resources_collision_registers_nothing():
+    model = backend.Model()
+    existing = backend.resources.Resource(id=uuid.uuid4())
+    model.register_resource(existing)
+
+    resources = [backend.resources.Resource(id=uuid.uuid4()),
+                 backend.resources.Resource(id=existing.id)]
+
+    with pytest.raises(backend.errors.ResourceCollisionError):
+        model.register_resources(resources)
+
+    assert resources[0].id not in model._resources
+    assert model._resources[existing.id] is existing
+
+
+@pytest.mark.parametrize('fast_retrieve_hooks', [False, True])
+def test_model_fast_retrieve(fast_retrieve_hooks):
+    model = backend.Model(fast_retrieve=True,
+                          fast_retrieve_hooks=fast_retrieve_hooks)
+    resource = backend.resources.Resource(id=uuid.uuid4())
+    model.register_resource(resource)
+
+    retrieved = []
+
+    def _handle_resource_retrieved(sender, data):
+        retrieved.append(data)
+
+    model.resource_retrieved += _handle_resource_retrieved
+
+    assert model.retrieve_resource(resource.id) is resource
+    assert model.retrieve_resource(str(resource.id)) is resource
+    # String ids miss the fast path and always fire resource_retrieved.
+    assert len(retrieved) == (2 if fast_retrieve_hooks else 1)
+
+    with pytest.raises(backend.errors.ResourceNotFoundError):
+        model.retrieve_resource(uuid.uuid4())
+
+
+def test_model_release_resource_untracks_resource_cls():
+    model = backend.Model()
+    resources = [backend.resources.Resource(id=uuid.uuid4())
+                 for _ in range(2)]
+    model.register_resources(resources)
+
+    model.release_resource(resources[0].id)
+
+    cls_resources = model._map__resource_cls__resources[
+        backend.resources.Resource]
+    assert resources[0].id not in cls_resources
+    assert resources[1].id in cls_resources
+
+
+def test_model_register_resources_rollback_untracks_resource_cls():
+    model = backend.Model()
+    existing = backend.resources.Resource(id=uuid.uuid4())
+    model.register_resource(existing)
+
+    def _fail(sender, resource):
+        raise ValueError('Registration rejected.')
+
+    resources = [backend.resources.Resource(id=uuid.uuid4())
+                 for _ in range(2)]
+    model.resource_registered += _fail
+
+    with pytest.raises(backend.errors.ResourceNotRegisteredError):
+        model.register_resources(resources)
+
+    cls_resources = model._map__resource_cls__resources[
+        backend.resources.Resource]
+    assert existing.id in cls_resources
+    for resource in resources:
+        assert resource.id not in model._resources
+        assert resource.id not in cls_resources
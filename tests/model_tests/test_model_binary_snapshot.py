@@ -0,0 +1,85 @@
+import io
+import uuid
+
+import elemental_backend as backend
+from elemental_backend.serialization import binary as binary_serialization
+from elemental_backend.serialization import json as json_serialization
+
+from tests.fixtures import *
+
+
+_map__class_name__serializer = {
+    'ContentType': json_serialization.serialize_content_type,
+    'AttributeType': json_serialization.serialize_attribute_type,
+    'ViewType': json_serialization.serialize_view_type,
+    'ContentInstance': json_serialization.serialize_content_instance,
+    'AttributeInstance': json_serialization.serialize_attribute_instance,
+    'ViewInstance': json_serialization.serialize_view_instance,
+    'ViewResult': lambda resource: resource.id
+}
+
+
+def _make_resources():
+    attribute_type = backend.resources.AttributeType(
+        id=uuid.uuid4(), name='name', default_value='unnamed',
+        kind_id='StringKind', kind_properties={'max_length': 8})
+    content_type = backend.resources.ContentType(
+        id=uuid.uuid4(), name='base',
+        attribute_type_ids=[attribute_type.id])
+    attribute_instance = backend.resources.AttributeInstance(
+        id=uuid.uuid4(), type_id=attribute_type.id, value='value')
+    content_instance = backend.resources.ContentInstance(
+        id=uuid.uuid4(), type_id=content_type.id,
+        attribute_ids=[attribute_instance.id])
+    view_type = backend.resources.ViewType(
+        id=uuid.uuid4(), name='view', content_type_ids=[content_type.id])
+    view_result = backend.resources.ViewResult(id=uuid.uuid4())
+    view_instance = backend.resources.ViewInstance(
+        id=uuid.uuid4(), type_id=view_type.id, result_id=view_result.id,
+        limit=10, offset=5)
+
+    return [attribute_type, content_type, attribute_instance,
+            content_instance, view_type, view_result, view_instance]
+
+
+def _serialize_model(model):
+    return dict(
+        (resource_id,
+         _map__class_name__serializer[type(resource).__name__](resource))
+        for resource_id, resource in model._resources.items())
+
+
+def test_model_binary_snapshot_round_trip():
+    model = backend.Model()
+    model.register_resources(_make_resources())
+
+    stream = io.BytesIO()
+    count = binary_serialization.dump_model(model, stream)
+
+    stream.seek(0)
+    loaded_model = backend.Model()
+    resources = binary_serialization.load_model(stream, loaded_model)
+
+    assert count == len(resources) == len(model._resources)
+    assert _serialize_model(loaded_model) == _serialize_model(model)
+
+    view_instance = next(resource for resource in resources
+                         if isinstance(resource, backend.resources.ViewInstance))
+    view_result = loaded_model._resources[view_instance.result_id]
+    assert view_result.view_instance is view_instance
+
+
+def test_model_binary_snapshot_truncated():
+    stream = io.BytesIO()
+    binary_serialization.dump_resources(_make_resources(), stream)
+
+    stream = io.BytesIO(stream.getvalue()[:-1])
+    with pytest.raises(backend.errors.DeserializerError):
+        binary_serialization.load_resources(stream)
+
+
+def test_model_binary_snapshot_unsupported_resource():
+    resource = backend.resources.Resource(id=uuid.uuid4())
+
+    with pytest.raises(backend.errors.SerializerError):
+        binary_serialization.dump_resources([resource], io.BytesIO())
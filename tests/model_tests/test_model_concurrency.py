@@ -0,0 +1,117 @@
+import threading
+import uuid
+
+import elemental_backend as backend
+
+from tests.fixtures import *
+
+
+class _StressParams(object):
+    model_kwargs = [
+        {'thread_safe': True},
+        {'thread_safe': True, 'fast_retrieve': True}
+    ]
+
+
+@pytest.mark.parametrize('model_kwargs', _StressParams.model_kwargs)
+def test_model_concurrent_register_retrieve_release(model_kwargs):
+    model = backend.Model(**model_kwargs)
+
+    stable_resources = [backend.resources.ContentType(id=uuid.uuid4())
+                        for _ in range(50)]
+    model.register_resources(stable_resources)
+
+    writer_count = 4
+    churned_resources = [
+        [backend.resources.ContentType(id=uuid.uuid4()) for _ in range(25)]
+        for _ in range(writer_count)]
+
+    errors = []
+    stop = threading.Event()
+
+    def read(reader_idx):
+        resources = stable_resources + sum(churned_resources, [])
+        resource_idx = reader_idx
+
+        while not stop.is_set():
+            resource = resources[resource_idx % len(resources)]
+            resource_idx += 7
+
+            try:
+                result = model.retrieve_resource(resource.id)
+            except backend.errors.ResourceNotFoundError:
+                if resource in stable_resources:
+                    errors.append(resource.id)
+            except Exception as e:
+                errors.append(e)
+            else:
+                if result is not resource:
+                    errors.append(result)
+
+    def write(resources):
+        try:
+            for _ in range(20):
+                for resource in resources:
+                    model.register_resource(resource)
+                for resource in resources:
+                    model.release_resource(resource.id)
+
+            model.register_resources(resources[::2])
+        except Exception as e:
+            errors.append(e)
+
+    readers = [threading.Thread(target=read, args=(reader_idx,))
+               for reader_idx in range(4)]
+    writers = [threading.Thread(target=write, args=(resources,))
+               for resources in churned_resources]
+
+    for thread in readers + writers:
+        thread.start()
+    for thread in writers:
+        thread.join()
+    stop.set()
+    for thread in readers:
+        thread.join()
+
+    expected_ids = set(resource.id for resource in stable_resources)
+    for resources in churned_resources:
+        expected_ids.update(resource.id for resource in resources[::2])
+
+    assert errors == []
+    assert set(model._resources.keys()) == expected_ids
+    assert model._writing_resource_ids == {}
+
+
+@pytest.mark.parametrize('model_kwargs', _StressParams.model_kwargs)
+def test_model_concurrent_retrieve_waits_for_registration(model_kwargs):
+    model = backend.Model(**model_kwargs)
+    resource = backend.resources.ContentType(id=uuid.uuid4())
+
+    registering = threading.Event()
+    resume = threading.Event()
+
+    def handler(sender, data):
+        registering.set()
+        resume.wait()
+
+    model.resource_registered += handler
+
+    writer = threading.Thread(target=model.register_resource, args=(resource,))
+    writer.start()
+    registering.wait()
+
+    retrieved = []
+    reader = threading.Thread(
+        target=lambda: retrieved.append(model.retrieve_resource(resource.id)))
+    reader.start()
+    reader.join(0.05)
+
+    # The Resource is in the Model, but its registration has not finished.
+    assert resource.id in model._resources
+    assert reader.is_alive()
+
+    resume.set()
+    writer.join()
+    reader.join()
+
+    assert retrieved == [resource]
@@ -0,0 +1,120 @@
+import gc
+import os
+import uuid
+import weakref
+
+import elemental_backend as backend
+
+from tests.fixtures import *
+
+
+def _make_attribute_instances(count):
+    type_id = uuid.uuid4()
+    return [backend.resources.AttributeInstance(id=uuid.uuid4(),
+                                                type_id=type_id,
+                                                value='value_{0}'.format(idx))
+            for idx in range(count)]
+
+
+@pytest.fixture
+def resource_store(tmp_path):
+    attribute_instances = _make_attribute_instances(10)
+    content_instance = backend.resources.ContentInstance(
+        id=uuid.uuid4(),
+        type_id=uuid.uuid4(),
+        attribute_ids=[ai.id for ai in attribute_instances])
+
+    path = os.path.join(str(tmp_path), 'resources.store')
+    backend.ResourceStore.write(path,
+                                attribute_instances + [content_instance])
+
+    with backend.ResourceStore(path) as store:
+        yield store, attribute_instances, content_instance
+
+
+def test_resource_store_lookup(resource_store):
+    store, attribute_instances, content_instance = resource_store
+
+    assert len(store) == 11
+    assert content_instance.id in store
+    assert uuid.uuid4() not in store
+    assert set(store.iter_ids()) == set(
+        [ai.id for ai in attribute_instances] + [content_instance.id])
+
+    materialised = store.materialise(attribute_instances[0].id)
+
+    assert materialised is not attribute_instances[0]
+    assert materialised.id == attribute_instances[0].id
+    assert materialised.value == attribute_instances[0].value
+
+
+def test_model_resource_store_materialises_and_evicts(resource_store):
+    store, attribute_instances, content_instance = resource_store
+    model = backend.Model(store=store)
+
+    assert len(model._resources) == 11
+
+    resource = model.retrieve_resource(content_instance.id)
+
+    assert resource.attribute_ids == content_instance.attribute_ids
+    assert model.retrieve_resource(content_instance.id) is resource
+    assert [ai.value for ai in resource.attributes] == [
+        ai.value for ai in attribute_instances]
+
+    resource_ref = weakref.ref(resource)
+    del resource
+    gc.collect()
+
+    assert resource_ref() is None
+    assert content_instance.id in model._resources
+
+
+def test_model_resource_store_pin(resource_store):
+    store, attribute_instances, _ = resource_store
+    model = backend.Model(store=store)
+    resource_id = attribute_instances[0].id
+
+    resource = model.retrieve_resource(resource_id)
+    resource.value = 'changed'
+
+    assert model.pin_resource(resource_id)
+    del resource
+    gc.collect()
+
+    assert model.retrieve_resource(resource_id).value == 'changed'
+
+
+def test_model_resource_store_release(resource_store):
+    store, attribute_instances, _ = resource_store
+    model = backend.Model(store=store)
+    resource_id = attribute_instances[0].id
+
+    released = model.release_resource(resource_id)
+
+    assert released.id == resource_id
+    assert resource_id not in model._resources
+    assert len(model._resources) == 10
+    with pytest.raises(backend.errors.ResourceNotFoundError):
+        model.retrieve_resource(resource_id)
+
+    model.register_resource(released)
+
+    assert model.retrieve_resource(resource_id) is released
+    assert len(model._resources) == 11
+
+
+def test_model_resource_store_collision(resource_store):
+    store, attribute_instances, _ = resource_store
+    model = backend.Model(store=store)
+
+    resource = backend.resources.AttributeInstance(id=attribute_instances[0].id)
+
+    with pytest.raises(backend.errors.ResourceCollisionError):
+        model.register_resource(resource)
+
+
+def test_model_resource_store_not_thread_safe(resource_store):
+    store, _, _ = resource_store
+
+    with pytest.raises(ValueError):
+        backend.Model(store=store, thread_safe=True)
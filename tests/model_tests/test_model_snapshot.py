@@ -0,0 +1,77 @@
+import threading
+import uuid
+
+import elemental_backend as backend
+
+from tests.fixtures import *
+
+
+class _SnapshotParams(object):
+    model_kwargs = [
+        {},
+        {'thread_safe': True}
+    ]
+
+
+@pytest.mark.parametrize('model_kwargs', _SnapshotParams.model_kwargs)
+def test_model_snapshot_is_point_in_time(model_kwargs):
+    model = backend.Model(**model_kwargs)
+    resources = [backend.resources.ContentType(id=uuid.uuid4())
+                 for _ in range(10)]
+    model.register_resources(resources)
+
+    with model.snapshot() as snapshot:
+        new_resource = backend.resources.ContentType(id=uuid.uuid4())
+        model.register_resource(new_resource)
+        model.release_resource(resources[0].id)
+        model.release_resource(resources[1].id)
+        model.register_resource(resources[1])
+
+        assert snapshot.retrieve_resource(resources[0].id) is resources[0]
+        assert snapshot.retrieve_resource(str(resources[1].id)) is resources[1]
+        assert new_resource.id not in snapshot
+        with pytest.raises(backend.errors.ResourceNotFoundError):
+            snapshot.retrieve_resource(new_resource.id)
+
+        snapshot_resources = list(snapshot.iter_resources())
+        assert len(snapshot_resources) == len(resources)
+        assert all(resource in snapshot_resources for resource in resources)
+
+        # Only the changed entries are copied.
+        assert len(snapshot._preserved) == 3
+
+    assert len(model._snapshots) == 0
+
+
+def test_model_snapshot_during_writes():
+    model = backend.Model(thread_safe=True)
+    resources = [backend.resources.ContentType(id=uuid.uuid4())
+                 for _ in range(500)]
+    model.register_resources(resources)
+
+    churned_resources = [backend.resources.ContentType(id=uuid.uuid4())
+                         for _ in range(50)]
+    stop = threading.Event()
+
+    def write():
+        while not stop.is_set():
+            for resource in churned_resources:
+                model.register_resource(resource)
+            for resource in churned_resources:
+                model.release_resource(resource.id)
+
+    writer = threading.Thread(target=write)
+    writer.start()
+
+    try:
+        for _ in range(20):
+            with model.snapshot() as snapshot:
+                resource_ids = [r.id for r in snapshot.iter_resources()]
+
+                assert len(resource_ids) == len(set(resource_ids))
+                assert set(r.id for r in resources) <= set(resource_ids)
+                assert set(
+                    r.id for r in snapshot.iter_resources()) == set(resource_ids)
+    finally:
+        stop.set()
+        writer.join()
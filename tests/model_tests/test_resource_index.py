@@ -0,0 +1,88 @@
+import uuid
+
+import pytest
+from elemental_core import NO_VALUE
+
+import elemental_backend as backend
+from elemental_backend._resource_index import ResourceIndex
+
+
+def test_resource_index_preserves_insertion_order():
+    index = ResourceIndex(backend.resources.ViewType,
+                          backend.resources.ContentInstance)
+    key = uuid.uuid4()
+    values = [uuid.uuid4() for _ in range(5)]
+
+    for value in values:
+        index.push_indexed_value(key, value)
+    index.pop_indexed_value(key, values[2])
+
+    assert list(index.iter_indexed_values(key)) == values[:2] + values[3:]
+    assert index.pop_indexed_value(key, values[2]) is None
+    assert index.pop_indexed_value(uuid.uuid4(), values[0]) is NO_VALUE
+
+
+def test_resource_index_capacity_evicts_oldest():
+    index = ResourceIndex(backend.resources.FilterInstance,
+                          backend.resources.ViewInstance,
+                          indexed_capacity=1)
+    key = uuid.uuid4()
+    original_value = uuid.uuid4()
+    current_value = uuid.uuid4()
+
+    index.push_indexed_value(key, original_value)
+    index.push_indexed_value(key, current_value)
+
+    assert list(index.iter_indexed_values(key)) == [current_value]
+    assert index.pop_value(original_value) == tuple()
+
+
+@pytest.mark.parametrize('bidirectional', [False, True])
+def test_resource_index_pop_value_removes_from_every_key(bidirectional):
+    index = ResourceIndex(backend.resources.ViewType,
+                          backend.resources.ContentInstance,
+                          bidirectional=bidirectional)
+    keys = [uuid.uuid4() for _ in range(3)]
+    value = uuid.uuid4()
+    other_value = uuid.uuid4()
+
+    for key in keys:
+        index.push_indexed_value(key, value)
+    index.push_indexed_value(keys[0], other_value)
+
+    assert set(index.iter_value_keys(value)) == set(keys)
+    assert set(index.pop_value(value)) == set(keys)
+    assert list(index.iter_value_keys(value)) == []
+    assert list(index.iter_indexed_values(keys[0])) == [other_value]
+    assert list(index.iter_indexed_values(keys[1])) == []
+
+
+def test_resource_index_snapshot_is_point_in_time():
+    index = ResourceIndex(backend.resources.ViewType,
+                          backend.resources.ContentInstance,
+                          bidirectional=True)
+    keys = [uuid.uuid4() for _ in range(3)]
+    values = [uuid.uuid4() for _ in range(4)]
+
+    index.push_indexed_value(keys[0], values[0])
+    index.push_indexed_value(keys[0], values[1])
+    index.push_indexed_value(keys[1], values[2])
+
+    snapshot = index.snapshot()
+
+    index.push_indexed_value(keys[0], values[3])
+    index.pop_index(keys[1])
+    index.push_indexed_value(keys[2], values[0])
+    index.pop_value(values[0])
+
+    assert snapshot.get_indexed_values(keys[0]) == (values[0], values[1])
+    assert snapshot.get_indexed_values(keys[1]) == (values[2],)
+    assert snapshot.get_indexed_values(keys[2]) == tuple()
+    assert set(snapshot.iter_index_keys()) == set(keys[:2])
+    assert index.get_indexed_values(keys[0]) == (values[1], values[3])
+
+    # Only the changed keys are copied.
+    assert len(snapshot._preserved) == 3
+
+    snapshot.close()
+    assert len(index._snapshots) == 0
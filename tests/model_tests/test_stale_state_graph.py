@@ -0,0 +1,48 @@
+import uuid
+
+from elemental_core import NO_VALUE
+
+from elemental_backend._stale_state_graph import StaleStateGraph
+
+
+def test_stale_state_graph_collects_details():
+    graph = StaleStateGraph()
+    resource_id = uuid.uuid4()
+    details = [uuid.uuid4() for _ in range(3)]
+
+    assert graph.mark_stale(resource_id, details[0])
+    for detail in details[1:]:
+        assert not graph.mark_stale(resource_id, detail)
+
+    assert set(graph.pop_stale(resource_id)) == set(details)
+    assert graph.pop_stale(resource_id) is NO_VALUE
+
+
+def test_stale_state_graph_propagates_to_dependents():
+    graph = StaleStateGraph()
+    content_type_id = uuid.uuid4()
+    view_type_id = uuid.uuid4()
+    view_result_id = uuid.uuid4()
+    content_instance_id = uuid.uuid4()
+
+    graph.push_dependency(content_type_id, view_type_id)
+    graph.push_dependency(view_type_id, view_result_id)
+    graph.mark_stale(view_result_id, content_instance_id)
+
+    graph.mark_dependents_stale(content_type_id)
+
+    assert not graph.is_stale(content_type_id)
+    assert graph.pop_stale(view_type_id) is None
+    assert graph.pop_stale(view_result_id) is None
+
+
+def test_stale_state_graph_pop_dependent():
+    graph = StaleStateGraph()
+    view_type_id = uuid.uuid4()
+    view_result_id = uuid.uuid4()
+
+    graph.push_dependency(view_type_id, view_result_id)
+    graph.pop_dependent(view_result_id)
+    graph.mark_dependents_stale(view_type_id)
+
+    assert not graph.is_stale(view_result_id)
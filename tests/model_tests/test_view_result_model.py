@@ -1,8 +1,18 @@
+import collections
 import uuid
 
 import pytest
 
+from elemental_core import NO_VALUE
+
 import elemental_backend as backend
+from elemental_backend._attribute_value_index import AttributeValueIndex
+from elemental_backend._view_evaluation import (
+    compile_filter_params,
+    compute_sort_key,
+    match_filter_column,
+    match_filter_params
+)
 
 from tests import utils
 from tests.fixtures import model
@@ -12,6 +22,83 @@ _view_result_id_raw = uuid.uuid4()
 _view_result_id_str = uuid.uuid4()
 
 
+_ViewResources = collections.namedtuple(
+    '_ViewResources',
+    ['model', 'attribute_type', 'content_type', 'filter_instance',
+     'sorter_instance', 'view_instance', 'view_result']
+)
+
+
+def _register_view(filter_params=None, sorter_params=None, limit=None,
+                   offset=None):
+    """
+    Registers a ViewInstance, with one FilterInstance and one SorterInstance
+        over a single AttributeType, and its ViewResult with a new Model.
+    """
+    model = backend.Model()
+
+    attribute_type = backend.resources.AttributeType(
+        id=uuid.uuid4(), name='name', kind_id='StringKind')
+    content_type = backend.resources.ContentType(
+        id=uuid.uuid4(), name='content',
+        attribute_type_ids=[attribute_type.id])
+    filter_type = backend.resources.FilterType(
+        id=uuid.uuid4(), name='filter',
+        attribute_type_ids=[attribute_type.id])
+    sorter_type = backend.resources.SorterType(
+        id=uuid.uuid4(), name='sorter',
+        attribute_type_ids=[attribute_type.id])
+    view_type = backend.resources.ViewType(
+        id=uuid.uuid4(), name='view', content_type_ids=[content_type.id],
+        filter_type_ids=[filter_type.id], sorter_type_ids=[sorter_type.id])
+    filter_instance = backend.resources.FilterInstance(
+        id=uuid.uuid4(), type_id=filter_type.id, kind_params=filter_params)
+    sorter_instance = backend.resources.SorterInstance(
+        id=uuid.uuid4(), type_id=sorter_type.id, kind_params=sorter_params)
+    view_result = backend.resources.ViewResult(id=uuid.uuid4())
+    view_instance = backend.resources.ViewInstance(
+        id=uuid.uuid4(), type_id=view_type.id,
+        filter_ids=[filter_instance.id], sorter_ids=[sorter_instance.id],
+        result_id=view_result.id, limit=limit, offset=offset)
+
+    model.register_resources([
+        attribute_type, content_type, filter_type, sorter_type, view_type,
+        filter_instance, sorter_instance, view_instance, view_result
+    ])
+
+    return _ViewResources(model, attribute_type, content_type,
+                          filter_instance, sorter_instance, view_instance,
+                          view_result)
+
+
+def _register_content_instance(view, value):
+    attribute_instance = backend.resources.AttributeInstance(
+        id=uuid.uuid4(), type_id=view.attribute_type.id, value=value)
+    content_instance = backend.resources.ContentInstance(
+        id=uuid.uuid4(), type_id=view.content_type.id,
+        attribute_ids=[attribute_instance.id])
+
+    view.model.register_resources([attribute_instance, content_instance])
+
+    return content_instance, attribute_instance
+
+
+def _retrieve_content_instance_ids(view):
+    view_result = view.model.retrieve_resource(view.view_result.id)
+    return list(view_result.content_instance_ids)
+
+
+def _get_stale_details(view):
+    stale_details = view.model._stale_state_graph._map__resource__stale_details
+    return stale_details.get(view.view_result.id, NO_VALUE)
+
+
+def _get_sort_keys(view):
+    view_result_model = view.model._resource_models[
+        backend.resources.ViewResult]
+    return view_result_model._map__view_result__sort_keys[view.view_result.id]
+
+
 class _RegistrationParams(object):
     id = [
         (None, None, backend.errors.ResourceNotRegisteredError),
@@ -83,3 +170,277 @@ def test_model_release_view_result(model, id):
 
     type_resources = model._map__resource_cls__resources[backend.resources.ViewResult]
     assert resource.id not in type_resources
+
+
+class _FilterParams(object):
+    values = [
+        (['foo'], {}, True),
+        ([], {'equals': 'foo'}, False),
+        (['foo', 'bar'], {'equals': 'bar'}, True),
+        ([None], {'equals': None}, False),
+        (['foobar'], {'prefix': 'foo', 'match': '.*bar$'}, True),
+        (['foobar'], {'prefix': 'bar'}, False),
+        ([5], {'minimum': 1, 'maximum': 5}, True),
+        ([6], {'minimum': 1, 'maximum': 5}, False),
+        (['foo'], {'minimum': 1}, False)
+    ]
+
+
+@pytest.mark.parametrize('values', _FilterParams.values)
+def test_match_filter_params(values):
+    attribute_values, kind_params, expected = values
+
+    assert match_filter_params(attribute_values, kind_params) is expected
+
+
+@pytest.mark.parametrize('descending', [False, True])
+def test_compute_sort_key(descending):
+    kind_params = {'descending': descending}
+    values = [[2], [1], ['b'], ['a'], [None], []]
+
+    result = sorted(values, key=lambda v: compute_sort_key(v, kind_params))
+
+    if descending:
+        assert result[:4] == [['b'], ['a'], [2], [1]]
+    else:
+        assert result[:4] == [[1], [2], ['a'], ['b']]
+    assert result[4:] == [[None], []]
+
+
+@pytest.mark.parametrize('values', _FilterParams.values)
+def test_match_filter_column(values):
+    attribute_values, kind_params, expected = values
+    column = [attribute_values, [], attribute_values]
+
+    mask = match_filter_column(column, compile_filter_params(kind_params))
+
+    assert list(mask) == [expected, not kind_params, expected]
+
+
+@pytest.mark.parametrize('filter_params', (
+    {'equals': 'ab'},
+    {'prefix': 'a'},
+    {'minimum': 'ab', 'maximum': 'b'},
+    {'minimum': 'a', 'match': '.b'},
+))
+def test_view_result_value_index_matches_scan(monkeypatch, filter_params):
+    values = ('b', 'ab', 'a', 'ba', 'abc', 'ab', 'c')
+
+    def _retrieve_values(view):
+        map_content_instance__value = {}
+        for value in values:
+            content_instance, _ = _register_content_instance(view, value)
+            map_content_instance__value[content_instance.id] = value
+
+        return [map_content_instance__value[content_instance_id]
+                for content_instance_id in _retrieve_content_instance_ids(view)]
+
+    indexed_view = _register_view(filter_params=filter_params)
+    indexed_values = _retrieve_values(indexed_view)
+
+    view_result_model = indexed_view.model._resource_models[
+        backend.resources.ViewResult]
+    assert view_result_model._map__filter_type__value_index
+
+    monkeypatch.setattr(AttributeValueIndex, 'supports',
+                        classmethod(lambda cls, kind_params: False))
+
+    scanned_values = _retrieve_values(_register_view(
+        filter_params=filter_params))
+
+    assert indexed_values
+    assert indexed_values == scanned_values
+
+
+def test_view_result_page():
+    view = _register_view(limit=2, offset=1)
+    content_instances = dict(
+        (value, _register_content_instance(view, value)[0])
+        for value in ('e', 'a', 'd', 'b', 'c'))
+
+    def _ids(*values):
+        return [content_instances[value].id for value in values]
+
+    assert _retrieve_content_instance_ids(view) == _ids('b', 'c')
+
+    # Entries leaving the page are replaced from the rest of the pool.
+    view.model.release_resource(content_instances['b'].id)
+
+    assert _retrieve_content_instance_ids(view) == _ids('c', 'd')
+
+    view.model.release_resource(content_instances['a'].id)
+
+    assert _retrieve_content_instance_ids(view) == _ids('d', 'e')
+
+    view.view_instance.limit = 3
+    view.view_instance.offset = 0
+
+    assert _retrieve_content_instance_ids(view) == _ids('c', 'd', 'e')
+
+    view.view_instance.limit = None
+
+    assert _retrieve_content_instance_ids(view) == _ids('c', 'd', 'e')
+
+
+def test_view_result_page_limit_cleared():
+    view = _register_view(limit=2)
+    content_instances = dict(
+        (value, _register_content_instance(view, value)[0])
+        for value in ('d', 'a', 'c', 'b'))
+
+    def _ids(*values):
+        return [content_instances[value].id for value in values]
+
+    assert _retrieve_content_instance_ids(view) == _ids('a', 'b')
+
+    view.view_instance.limit = None
+
+    assert _retrieve_content_instance_ids(view) == _ids('a', 'b', 'c', 'd')
+
+    # Entries sorting after the former page are kept up to date.
+    content_instances['e'] = _register_content_instance(view, 'e')[0]
+
+    assert _retrieve_content_instance_ids(view) == _ids('a', 'b', 'c', 'd', 'e')
+
+
+def test_view_result_maintained_incrementally():
+    view = _register_view(filter_params={'prefix': 'a'})
+    content_instances = {}
+    attribute_instances = {}
+    for value in ('ab', 'aa', 'b'):
+        content_instance, attribute_instance = _register_content_instance(
+            view, value)
+        content_instances[value] = content_instance
+        attribute_instances[value] = attribute_instance
+
+    def _ids(*values):
+        return [content_instances[value].id for value in values]
+
+    assert _retrieve_content_instance_ids(view) == _ids('aa', 'ab')
+    assert _get_stale_details(view) is NO_VALUE
+
+    # Registering a ContentInstance only schedules that ContentInstance.
+    content_instances['ac'], attribute_instances['ac'] = (
+        _register_content_instance(view, 'ac'))
+
+    assert _get_stale_details(view) == set(_ids('ac'))
+    assert _retrieve_content_instance_ids(view) == _ids('aa', 'ab', 'ac')
+
+    attribute_instances['ab'].value = 'z'
+
+    assert _get_stale_details(view) == set(_ids('ab'))
+    assert _retrieve_content_instance_ids(view) == _ids('aa', 'ac')
+
+    attribute_instances['b'].value = 'a0'
+
+    assert _get_stale_details(view) == set(_ids('b'))
+    assert _retrieve_content_instance_ids(view) == _ids('b', 'aa', 'ac')
+
+    view.model.release_resource(attribute_instances['aa'].id)
+
+    assert _get_stale_details(view) == set(_ids('aa'))
+    assert _retrieve_content_instance_ids(view) == _ids('b', 'ac')
+
+    view.model.release_resource(content_instances['ac'].id)
+
+    assert _get_stale_details(view) == set(_ids('ac'))
+    assert _retrieve_content_instance_ids(view) == _ids('b')
+
+
+def test_view_result_criteria_instance_released():
+    view = _register_view(filter_params={'prefix': 'a'},
+                          sorter_params={'descending': True})
+    content_instances = dict(
+        (value, _register_content_instance(view, value)[0])
+        for value in ('ab', 'aa', 'b'))
+
+    def _ids(*values):
+        return [content_instances[value].id for value in values]
+
+    assert _retrieve_content_instance_ids(view) == _ids('ab', 'aa')
+
+    view.model.release_resource(view.filter_instance.id)
+
+    assert _get_stale_details(view) is None
+    assert _retrieve_content_instance_ids(view) == _ids('b', 'ab', 'aa')
+
+    view.model.release_resource(view.sorter_instance.id)
+
+    assert _get_stale_details(view) is None
+    assert set(_retrieve_content_instance_ids(view)) == set(_ids('b', 'ab',
+                                                                 'aa'))
+
+
+def test_view_result_recomputed_on_read():
+    view = _register_view(filter_params={'prefix': 'a'})
+    content_instance, attribute_instance = _register_content_instance(
+        view, 'a')
+    stale_state = view.model._stale_state_graph
+
+    assert _retrieve_content_instance_ids(view) == [content_instance.id]
+
+    # Changes only mark the ViewResult stale.
+    attribute_instance.value = 'b'
+
+    assert stale_state.is_stale(view.view_result.id)
+    assert view.view_result.content_instance_ids == (content_instance.id,)
+
+    assert _retrieve_content_instance_ids(view) == []
+    assert not stale_state.is_stale(view.view_result.id)
+
+    view.filter_instance.kind_params = {'prefix': 'b'}
+
+    assert _get_stale_details(view) is None
+    assert view.view_result.content_instance_ids == ()
+
+    assert _retrieve_content_instance_ids(view) == [content_instance.id]
+    assert not stale_state.is_stale(view.view_result.id)
+
+
+def test_view_result_sort_keys_sorter_params_changed():
+    view = _register_view()
+    content_instances = dict(
+        (value, _register_content_instance(view, value)[0])
+        for value in ('b', 'c', 'a'))
+
+    def _ids(*values):
+        return [content_instances[value].id for value in values]
+
+    assert _retrieve_content_instance_ids(view) == _ids('a', 'b', 'c')
+    cached_sort_keys = dict(_get_sort_keys(view))
+    assert set(cached_sort_keys) == set(_ids('a', 'b', 'c'))
+
+    view.sorter_instance.kind_params = {'descending': True}
+
+    assert not _get_sort_keys(view)
+    assert _retrieve_content_instance_ids(view) == _ids('c', 'b', 'a')
+    for content_instance_id, sort_key in _get_sort_keys(view).items():
+        assert sort_key != cached_sort_keys[content_instance_id]
+
+
+def test_view_result_sort_keys_attribute_value_changed():
+    view = _register_view()
+    content_instances = {}
+    attribute_instances = {}
+    for value in ('b', 'c', 'a'):
+        content_instance, attribute_instance = _register_content_instance(
+            view, value)
+        content_instances[value] = content_instance
+        attribute_instances[value] = attribute_instance
+
+    def _ids(*values):
+        return [content_instances[value].id for value in values]
+
+    assert _retrieve_content_instance_ids(view) == _ids('a', 'b', 'c')
+    cached_sort_keys = dict(_get_sort_keys(view))
+
+    attribute_instances['a'].value = 'd'
+
+    assert _retrieve_content_instance_ids(view) == _ids('b', 'c', 'a')
+    sort_keys = _get_sort_keys(view)
+    assert sort_keys[content_instances['a'].id] != cached_sort_keys[
+        content_instances['a'].id]
+    for value in ('b', 'c'):
+        content_instance_id = content_instances[value].id
+        assert sort_keys[content_instance_id] == cached_sort_keys[
+            content_instance_id]
@@ -47,3 +47,45 @@ def test_view_instance_instantiation(id, type_id, filter_ids):
     assert ai.id == id_expected
     assert ai.type_id == type_id_expected
     assert ai.filter_ids == filter_ids_expected
+
+
+class _WindowParams(object):
+    limit = [
+        (None, None),
+        (0, 0),
+        (25, 25),
+        ('25', 25)
+    ]
+
+    offset = [
+        (None, 0),
+        (0, 0),
+        (50, 50),
+        ('50', 50)
+    ]
+
+    invalid = [-1, 2.5, 'a', True]
+
+
+@pytest.mark.parametrize('limit', _WindowParams.limit)
+@pytest.mark.parametrize('offset', _WindowParams.offset)
+def test_view_instance_window(limit, offset):
+    limit_value, limit_expected = limit
+    offset_value, offset_expected = offset
+
+    vi = backend.resources.ViewInstance(limit=limit_value,
+                                        offset=offset_value)
+
+    assert vi.limit == limit_expected
+    assert vi.offset == offset_expected
+
+
+@pytest.mark.parametrize('value', _WindowParams.invalid)
+def test_view_instance_window_invalid(value):
+    vi = backend.resources.ViewInstance()
+
+    with pytest.raises(ValueError):
+        vi.limit = value
+
+    with pytest.raises(ValueError):
+        vi.offset = value